@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+وضع الدفعات (batch): نشر N منتج في نفس التشغيل بفاصل زمني ثابت
+الكتالوج بيتحمل مرة واحدة، والطابور بيتحفظ بعد كل منشور
+لو التشغيل وقف في النص، التشغيل الجاي يكمل الباقي من نفس الطابور
+"""
+
+import logging
+import argparse
+import json
+import os
+import time
+
+log = logging.getLogger(__name__)
+
+# ========== خيارات سطر الأوامر ==========
+def parse_batch_args(description, configure=None):
+    """configure (اختياري): دالة بتضيف خيارات زيادة على الـ parser"""
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument('--batch', type=int, default=1,
+                        help='عدد المنتجات اللي تتنشر في التشغيل ده')
+    parser.add_argument('--spacing', type=float, default=0,
+                        help='الفاصل بين كل منشور والتاني بالثواني')
+    parser.add_argument('--metrics-history', default=None,
+                        help='ملف JSONL يتضاف له سجل مقاييس التشغيل (زمن كل مرحلة)')
+    if configure:
+        configure(parser)
+    return parser.parse_args()
+
+# ========== الطابور ==========
+def queue_path(tracking_file):
+    """posted_products.jsonl -> posted_products.schedule.json"""
+    return os.path.splitext(tracking_file)[0] + '.schedule.json'
+
+def load_queue(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def save_queue(queue, path):
+    """حفظ الطابور (ملف مؤقت ثم rename)"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(queue, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+# ========== تشغيل الدفعة ==========
+def run_batch(post_once, batch, spacing, path):
+    """تشغيل post_once() لحد batch مرة بفاصل spacing ثانية
+    post_once ترجع True لو النشر نجح - التتبع بيتحفظ جواها بعد كل نجاح
+    يرجع قائمة بنتيجة كل محاولة
+    """
+    queue = load_queue(path)
+    if queue and queue.get('remaining', 0) > 0:
+        log.info(f"⏯️ استكمال دفعة سابقة: باقي {queue['remaining']} منشور "
+                 f"(فاصل {queue['spacing']}s)")
+    elif batch > 1:
+        queue = {'remaining': batch, 'spacing': spacing, 'next_due': time.time()}
+        save_queue(queue, path)
+        log.info(f"📦 دفعة جديدة: {batch} منشور بفاصل {spacing}s")
+    else:
+        # تشغيل عادي لمنشور واحد - من غير ملف طابور
+        return [post_once()]
+
+    results = []
+    while queue['remaining'] > 0:
+        wait = queue['next_due'] - time.time()
+        if wait > 0:
+            log.info(f"⏳ المنشور الجاي بعد {wait:.0f}s...")
+            time.sleep(wait)
+        results.append(post_once())
+        queue['remaining'] -= 1
+        queue['next_due'] = time.time() + queue['spacing']
+        save_queue(queue, path)
+
+    os.remove(path)
+    log.info(f"\n📦 انتهت الدفعة: {sum(results)}/{len(results)} منشور ناجح")
+    return results
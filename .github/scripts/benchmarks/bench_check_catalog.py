@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس فحص اتساق الكتالوج على كتالوجات صناعية لحد مليون منتج
+في كل كتالوج مشاكل مزروعة بعدد معروف (صفحات ناقصة، روابط يتيمة، ids مكررة ...)
+والقياس بيتأكد إن الفحص لقاها كلها - والزمن لكل منتج لازم يفضل ثابت (linear)
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_check_catalog.py
+    python .github/scripts/benchmarks/bench_check_catalog.py --sizes 10000,1000000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from catalog import SITE_URL, product_file_name
+from check_catalog import check_catalog
+
+WORDS = ['جهاز', 'مساج', 'ساعة', 'عطر', 'خلاط', 'كاميرا', 'إضاءة', 'rolex', 'watch', 'gold']
+
+# ========== كتالوج صناعي بمشاكل مزروعة ==========
+def make_catalog(total, seed=1):
+    """(products, page_files, sitemap_locs, url_index, المتوقع) - 0.1% من كل نوع مشكلة"""
+    rng = random.Random(seed)
+    products = []
+    for i in range(1, total + 1):
+        title = ' '.join(rng.sample(WORDS, 3))
+        products.append({'id': str(i), 'title': title, 'image_link': f'https://cdn.example.com/{i}.jpg'})
+    files = [product_file_name(p) for p in products]
+    url_index = {p['id']: [f'products/{f}', SITE_URL + quote(f'products/{f}', safe='/-.')]
+                 for p, f in zip(products, files)}
+
+    step = 1000
+    no_page = set(range(0, total, step))
+    no_loc = set(range(1, total, step))
+    renamed = set(range(2, total, step))
+    page_files = [('قديم-' + f if n in renamed else f) for n, f in enumerate(files) if n not in no_page]
+    page_files += [f'يتيم-{total + 1 + n}.html' for n in range(0, total, step)]
+    locs = [f"{SITE_URL}products/{f}" for n, f in enumerate(files) if n not in no_loc]
+    locs += locs[:total // step]
+    for n in range(3, total, step):
+        products.append(dict(products[n]))
+    expected = {
+        'missing_page': len(no_page), 'orphan_page': total // step + (total % step > 0),
+        'page_slug': len(renamed), 'missing_loc': len(no_loc), 'duplicate_loc': total // step,
+        'duplicate_id': len(range(3, total, step)),
+    }
+    return products, page_files, locs, url_index, expected
+
+# ========== القياس ==========
+def main():
+    parser = argparse.ArgumentParser(description='Catalog consistency checker benchmark')
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    args = parser.parse_args()
+
+    print(f"{'products':>9} {'seconds':>8} {'us/product':>11} {'issues':>8}  found all")
+    for total in [int(x) for x in args.sizes.split(',')]:
+        products, page_files, locs, url_index, expected = make_catalog(total)
+        start = time.perf_counter()
+        report = check_catalog(products, page_files, iter(locs), url_index)
+        seconds = time.perf_counter() - start
+        found = all(report['counts'][kind] == count for kind, count in expected.items())
+        print(f"{total:>9} {seconds:>8.2f} {seconds / total * 1e6:>11.2f} "
+              f"{sum(report['counts'].values()):>8}  {'✅' if found else '❌ ' + str(report['counts'])}")
+
+if __name__ == '__main__':
+    main()
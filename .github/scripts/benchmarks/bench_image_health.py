@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس فحص صحة الصور على سيرفر صور محلي (stub) بتأخير ثابت لكل طلب
+السيرفر فيه صور سليمة بـ ETag، و404، و500 دايماً (عطل متكرر)، وصفحة HTML بدل صورة،
+ومسارات ما بتدعمش HEAD (405) - والقياس بيتأكد إن التصنيف صح:
+- فحص بارد: worker واحد مقابل التوازي
+- إعادة فحص بكاش الـ ETag (كله 304 من غير body)
+- إعادة فحص جوه --max-age (صفر طلبات)
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_image_health.py
+    python .github/scripts/benchmarks/bench_image_health.py --images 500 --latency 0.05 --workers 16
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import image_health
+
+BODY = b'\xff\xd8\xff' + b'0' * 20000
+
+# ========== سيرفر الصور ==========
+class StubImages(BaseHTTPRequestHandler):
+    latency = 0.02
+    requests = 0
+    body_bytes = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self, send_body):
+        time.sleep(self.latency)
+        kind, _, name = self.path.strip('/').partition('/')
+        etag = f'"{name}"'
+        with self.lock:
+            StubImages.requests += 1
+        if kind == 'missing':
+            return self.send_error(404)
+        if kind == 'flaky':
+            return self.send_error(500)
+        if kind == 'nohead' and self.command == 'HEAD':
+            return self.send_error(405)
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            return self.end_headers()
+        html = kind == 'html'
+        body = b'<html></html>' if html else BODY
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html' if html else 'image/jpeg')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+            with self.lock:
+                StubImages.body_bytes += len(body)
+
+    def do_HEAD(self):
+        self.respond(False)
+
+    def do_GET(self):
+        self.respond(True)
+
+def start_server(latency):
+    StubImages.latency = latency
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubImages)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def make_urls(base, total):
+    """(urls, المتوقع مكسور) - 5% 404، 2% 500، 2% HTML، 5% من غير HEAD"""
+    urls, broken = [], set()
+    for i in range(total):
+        kind = ('missing' if i % 20 == 0 else 'flaky' if i % 50 == 1 else
+                'html' if i % 50 == 2 else 'nohead' if i % 20 == 3 else 'img')
+        url = f"{base}/{kind}/{i}.jpg"
+        urls.append(url)
+        if kind in ('missing', 'flaky', 'html'):
+            broken.add(url)
+    return urls, broken
+
+# ========== القياس ==========
+def run_scan(urls, health, workers, max_age):
+    before = StubImages.requests, StubImages.body_bytes
+    start = time.perf_counter()
+    checked = image_health.scan(urls, health, workers, max_age)
+    seconds = time.perf_counter() - start
+    return checked, seconds, StubImages.requests - before[0], StubImages.body_bytes - before[1]
+
+def main():
+    parser = argparse.ArgumentParser(description='Image health scanner benchmark (local stub server)')
+    parser.add_argument('--images', type=int, default=300)
+    parser.add_argument('--latency', type=float, default=0.02, help='تأخير السيرفر لكل طلب (ثانية)')
+    parser.add_argument('--workers', type=int, default=image_health.DEFAULT_WORKERS)
+    args = parser.parse_args()
+
+    server = start_server(args.latency)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls, expected = make_urls(base, args.images)
+
+    print(f"{'scan':<28} {'checked':>8} {'seconds':>8} {'requests':>9} {'body KB':>8}")
+    rows = [
+        ('cold, 1 worker', {'version': 1, 'images': {}}, 1, 0),
+        (f'cold, {args.workers} workers', {'version': 1, 'images': {}}, args.workers, 0),
+    ]
+    for label, health, workers, max_age in rows:
+        checked, seconds, requests, body = run_scan(urls, health, workers, max_age)
+        print(f"{label:<28} {checked:>8} {seconds:>8.2f} {requests:>9} {body // 1024:>8}")
+    # الأعطال المؤقتة بتتعلم مكسورة من تاني فحص - فالإعادة بتكمل على نفس الـ health
+    for label, max_age in (('repeat (ETag -> 304)', 0), ('repeat inside --max-age', 24)):
+        checked, seconds, requests, body = run_scan(urls, health, args.workers, max_age)
+        print(f"{label:<28} {checked:>8} {seconds:>8.2f} {requests:>9} {body // 1024:>8}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'health.json')
+        image_health.save_health(health, path)
+        products = [{'id': str(i), 'image_link': url} for i, url in enumerate(urls)]
+        broken = {urls[int(i)] for i in image_health.broken_product_ids(products, path)}
+    print(f"broken: {len(broken)} found / {len(expected)} expected - {'✅' if broken == expected else '❌'}")
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
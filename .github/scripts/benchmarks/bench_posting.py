@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+اختبار حِمل للنشر على المحاكي المحلي (platform_emulator.py) - من غير ما نلمس المنصات الحقيقية
+آلاف المنشورات بتعدي على نفس الكود الحقيقي: publish_all + دوال القنوات (channel_meta, channel_twitter)
++ http_client (retry و backoff و Retry-After) + كاش الصور + الـ outbox - والمحاكي بيحقن
+تأخير و429 و5xx وcontainers بطيئة
+
+النتيجة لكل قناة: نجح / فشل، p50 و p99 لزمن المنشور، ومنشورات في الثانية
++ عدد الـ retries عند العميل والأعطال اللي المحاكي حقنها والمنشورات المكررة (لازم تكون صفر)
+
+- حدود الـ rate limit عند العميل (http_client.RATE_LIMITS) بتتشال افتراضياً عشان نقيس الكود
+  مش الـ token bucket (--client-limits يرجعها)، و BACKOFF_BASE بيصغر لنفس السبب
+- قناة twitter محتاجة tweepy - لو مش متثبت بتتشال من القياس
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_posting.py
+    python .github/scripts/benchmarks/bench_posting.py --posts 5000 --concurrency 32 --rate-429 0.05 --rate-5xx 0.02
+    python .github/scripts/benchmarks/bench_posting.py --emulator http://127.0.0.1:8800   # محاكي شغال لوحده
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from platform_emulator import add_fault_args, faults_from_args, start_emulator
+
+# مفاتيح وهمية - المحاكي بيتأكد إنها موجودة بس
+FAKE_CREDENTIALS = {
+    'FACEBOOK_PAGE_ID': '100200300', 'FACEBOOK_ACCESS_TOKEN': 'emulator-token',
+    'INSTAGRAM_ACCOUNT_ID': '17840000000', 'INSTAGRAM_ACCESS_TOKEN': 'emulator-token',
+    'TWITTER_API_KEY': 'key', 'TWITTER_API_SECRET': 'secret',
+    'TWITTER_ACCESS_TOKEN': 'token', 'TWITTER_ACCESS_SECRET': 'token-secret',
+}
+
+def percentile(values, p):
+    """nearest-rank على قائمة مترتبة"""
+    if not values:
+        return math.nan
+    return values[min(len(values) - 1, max(0, math.ceil(p / 100 * len(values)) - 1))]
+
+# ========== منشور واحد ==========
+def post_product(index, base_url, images, channels, outbox):
+    """منتج صناعي واحد على كل القنوات - نفس خطوات runner.post_next من بعد الاختيار"""
+    from channels import create_post_content
+    from publisher import publish_all
+
+    product = {'id': str(index), 'title': f"منتج تجريبي رقم {index}", 'price': 100 + index % 400,
+               'image_link': f"{base_url}/cdn/{index % images}.jpg"}
+    content = create_post_content(product, f"https://m5zoon.com/products/{index}.html")
+    jobs = {name: outbox.job(product['id'], name, 1) for name in channels}
+    start = time.perf_counter()
+    results = publish_all(content, channels, jobs)
+    wall = time.perf_counter() - start
+    for name, job in jobs.items():
+        if results[name]['post_id'] is not None:
+            outbox.drop(job)
+    return results, wall
+
+# ========== القياس ==========
+def main():
+    parser = argparse.ArgumentParser(description='Posting load test against the local platform emulator')
+    parser.add_argument('--posts', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=16, help='منشورات في نفس الوقت')
+    parser.add_argument('--channels', default='facebook,instagram,twitter')
+    parser.add_argument('--images', type=int, default=50, help='عدد صور الـ CDN المختلفة (الباقي من الكاش)')
+    parser.add_argument('--backoff-base', type=float, default=0.05, help='BACKOFF_BASE في http_client')
+    parser.add_argument('--client-limits', action='store_true', help='تشغيل الـ token buckets بتاعة http_client')
+    parser.add_argument('--emulator', default=None, help='عنوان محاكي شغال بالفعل بدل واحد جوه العملية')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--verbose', action='store_true', help='رسائل النشر (كتير جداً مع آلاف المنشورات)')
+    add_fault_args(parser)
+    parser.add_argument('--container-timeout', type=float, default=None,
+                        help='CONTAINER_TIMEOUT في channel_meta (افتراضياً زي الإنتاج)')
+    args = parser.parse_args()
+
+    server = None
+    if args.emulator:
+        base_url = args.emulator.rstrip('/')
+    else:
+        server, base_url = start_emulator(faults_from_args(args), seed=args.seed)
+    os.environ['PLATFORM_EMULATOR'] = base_url
+    for name, value in FAKE_CREDENTIALS.items():
+        os.environ.setdefault(name, value)
+
+    if args.verbose:
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+    else:
+        logging.disable(logging.CRITICAL)
+
+    import channel_meta
+    import http_client
+    import metrics
+    from channels import load_plugins
+    from outbox import Outbox
+
+    if not args.client_limits:
+        http_client.RATE_LIMITS.clear()
+    http_client.BACKOFF_BASE = args.backoff_base
+    if args.container_timeout is not None:
+        channel_meta.CONTAINER_TIMEOUT = args.container_timeout
+    registry = load_plugins()
+    channels = {}
+    for name in args.channels.split(','):
+        if name == 'twitter' and importlib.util.find_spec('tweepy') is None:
+            print("⏭️ twitter: tweepy مش متثبت - القناة اتشالت من القياس")
+        elif name not in registry:
+            print(f"⏭️ {name}: قناة مش معروفة")
+        else:
+            channels[name] = registry[name]['post']
+    if not channels:
+        sys.exit("❌ مفيش قنوات للقياس")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # كاش الصور والـ outbox في مجلد مؤقت
+        os.chdir(directory)
+        try:
+            outbox = Outbox('load-test.outbox.json')
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                runs = list(pool.map(lambda i: post_product(i, base_url, args.images, channels, outbox),
+                                     range(1, args.posts + 1)))
+            seconds = time.perf_counter() - start
+            left_pending = len(outbox.entries)
+        finally:
+            os.chdir(cwd)
+
+    print(f"\n{args.posts} منشور × {len(channels)} قناة، concurrency {args.concurrency}، "
+          f"{seconds:.1f}s")
+    print(f"{'channel':<10} {'ok':>6} {'failed':>6} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'posts/s':>8}")
+    for name in channels:
+        results = [results[name] for results, _ in runs]
+        ok = sorted(r['seconds'] * 1000 for r in results if r['post_id'] is not None)
+        print(f"{name:<10} {len(ok):>6} {len(results) - len(ok):>6} {percentile(ok, 50):>8.0f} "
+              f"{percentile(ok, 99):>8.0f} {(ok[-1] if ok else math.nan):>8.0f} {len(ok) / seconds:>8.1f}")
+    walls = sorted(wall * 1000 for _, wall in runs)
+    complete = sum(all(r['post_id'] is not None for r in results.values()) for results, _ in runs)
+    print(f"{'product':<10} {complete:>6} {args.posts - complete:>6} {percentile(walls, 50):>8.0f} "
+          f"{percentile(walls, 99):>8.0f} {walls[-1]:>8.0f} {complete / seconds:>8.1f}")
+
+    run = metrics.snapshot()
+    print(f"\nclient: http_retries={run['counters'].get('http_retries', 0)} "
+          f"image_cache_miss={run['counters'].get('image_cache_miss', 0)} outbox_pending={left_pending}")
+    for name in ('image_fetch', 'image_transcode', 'upload', 'container_wait', 'publish'):
+        phase = run['phases'].get(name)
+        if phase:
+            print(f"  {name:<16} {phase['count']:>6} × {phase['seconds'] / phase['count'] * 1000:>7.1f} ms")
+
+    if server is not None:
+        stats = server.emulator.snapshot()
+    else:
+        import http_client as client
+        stats = client.get(f"{base_url}/_emulator/stats").json()
+    print("\nemulator:")
+    duplicates = 0
+    for endpoint, counts in sorted(stats['endpoints'].items()):
+        duplicates += counts.get('duplicate', 0)
+        print(f"  {endpoint:<44} {json.dumps(counts)}")
+    print(f"duplicates: {duplicates} - {'✅' if not duplicates else '❌'}")
+    if server is not None:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس الذاكرة لتحميل الكتالوج في سكربتات النشر على كتالوجات صناعية (عناوين ووصف عربي)
+كل طريقة بتتقاس في process لوحدها (من /proc/self/status) - بعد ما الكتالوج يتحمل
+ويتعمل عليه 1000 lookup عشوائي (نفس شغل تشغيلة نشر) و100 قراءة للوصف:
+- dicts      json.load لـ products.json كله (load_products)
+- snapshot   dict لكل منتج بالحقول المهمة بس (الـ snapshot JSON القديم)
+- store      catalog.store بـ mmap (product_store.load_catalog)
+
+الأعمدة: peak (VmHWM) و RSS (VmRSS) و anon (RssAnon - الذاكرة الخاصة بالـ process بس،
+من غير صفحات الملفات المعمول لها mmap اللي الـ kernel يقدر يرجعها في أي وقت)
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_product_store.py
+    python .github/scripts/benchmarks/bench_product_store.py --sizes 1000000
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from catalog import PRODUCTS_FILE, URLS_FILE, URLS_VERSION, build_url_index, iter_products
+
+WORDS = ['جهاز', 'مساج', 'ساعة', 'عطر', 'خلاط', 'كاميرا', 'إضاءة', 'ذكية', 'فاخرة', 'للمنزل',
+         'rolex', 'watch', 'gold', 'pro']
+SENTENCE = 'يمنحك استخداماً سريعاً ونتائج مبهرة تلبي احتياجاتك بدقة وتوفر الوقت في كل عملية'
+LOOKUPS = 1000
+DETAILS = 100
+MODES = ('dicts', 'snapshot', 'store')
+
+# ========== كتالوج صناعي ==========
+def make_catalog(directory, total, seed=1):
+    """products.json و data/urls.json في directory - بيتكتب منتج منتج عشان المولد نفسه ما ياكلش ذاكرة"""
+    rng = random.Random(seed)
+    index = {}
+    with open(os.path.join(directory, PRODUCTS_FILE), 'w', encoding='utf-8') as f:
+        f.write('[\r\n')
+        for i in range(1, total + 1):
+            title = ' '.join(rng.sample(WORDS, 4))
+            price = rng.randint(50, 900)
+            product = {
+                'id': str(i), 'title': title,
+                'description': '\n'.join(f"{title} {SENTENCE}" for _ in range(5)),
+                'image_link': f'https://cdn.example.com/uploads/products/{i:012d}.webp',
+                'price': price, 'sale_price': price - rng.randint(0, 40), 'stock': 50,
+                'category': 'Home & Garden > Kitchen & Dining', 'availability': 'in stock',
+                'condition': 'new', 'brand': 'Generic', 'currency': 'AED',
+            }
+            f.write(('' if i == 1 else ',\r\n') + json.dumps(product, ensure_ascii=False, indent=2))
+            path, url = build_url_index([product])[0][product['id']]
+            index[product['id']] = [path, url]
+        f.write('\r\n]')
+    os.makedirs(os.path.join(directory, 'data'), exist_ok=True)
+    with open(os.path.join(directory, URLS_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'version': URLS_VERSION, 'total': total, 'urls': index}, f, ensure_ascii=False)
+
+# ========== طريقة واحدة (جوه process لوحدها) ==========
+def memory_mb():
+    """(peak, resident, anon) بالـ MB للـ process دي
+    ru_maxrss ما ينفعش هنا: بيتورث من الـ process الأب بعد exec
+    """
+    values = {}
+    with open('/proc/self/status', 'r') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name in ('VmHWM', 'VmRSS', 'RssAnon'):
+                values[name] = int(value.split()[0]) / 1024
+    return values['VmHWM'], values['VmRSS'], values['RssAnon']
+
+def load_mode(mode):
+    """(catalog, details(id)) للطريقة"""
+    if mode == 'dicts':
+        from catalog import load_products
+        products = {p['id']: p for p in load_products()}
+        return products, products.__getitem__
+    if mode == 'snapshot':
+        with open(os.path.join('.cache', 'snapshot.json'), 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+        fields = snapshot['fields']
+        catalog = {}
+        for product_id, row in snapshot['products'].items():
+            product = dict(zip(fields, row))
+            product['id'] = product_id
+            catalog[product_id] = product
+        # الوصف في الطريقة دي محتاج products.json كله تاني
+        return catalog, lambda product_id: next(p for p in iter_products() if p['id'] == product_id)
+    from product_store import load_catalog
+    catalog, _, _ = load_catalog()
+    return catalog, catalog.details
+
+def run_mode(mode, total):
+    import logging
+    logging.disable(logging.CRITICAL)
+    _, base, base_anon = memory_mb()
+    start = time.perf_counter()
+    catalog, details = load_mode(mode)
+    load_seconds = time.perf_counter() - start
+
+    rng = random.Random(7)
+    ids = [str(rng.randint(1, total)) for _ in range(LOOKUPS)]
+    start = time.perf_counter()
+    titles = sum(len(catalog[product_id]['title']) for product_id in ids)
+    lookup_us = (time.perf_counter() - start) / LOOKUPS * 1e6
+    samples = ids[:DETAILS] if mode != 'snapshot' else ids[:2]
+    start = time.perf_counter()
+    for product_id in samples:
+        assert details(product_id)['description']
+    details_us = (time.perf_counter() - start) / len(samples) * 1e6
+    peak, resident, anon = memory_mb()
+    print(json.dumps({'load': load_seconds, 'lookup_us': lookup_us, 'details_us': details_us,
+                      'peak_mb': peak - base, 'rss_mb': resident - base, 'anon_mb': anon - base_anon,
+                      'ok': titles > 0}))
+
+# ========== القياس ==========
+def prepare(directory, total):
+    """الكتالوج + الـ snapshot القديم + catalog.store - يرجع (حجم products.json, زمن بناء المخزن)"""
+    make_catalog(directory, total)
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        import logging
+        logging.disable(logging.CRITICAL)
+        from catalog import iter_products, load_url_index
+        urls = load_url_index()
+        rows = {p['id']: [p['title'], p['price'], p['sale_price'], p['image_link'], urls[p['id']][1]]
+                for p in iter_products()}
+        del urls
+        os.makedirs('.cache', exist_ok=True)
+        with open(os.path.join('.cache', 'snapshot.json'), 'w', encoding='utf-8') as f:
+            json.dump({'fields': ['title', 'price', 'sale_price', 'image_link', 'url'], 'products': rows},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        del rows
+        from product_store import build_store
+        start = time.perf_counter()
+        build_store()
+        build_seconds = time.perf_counter() - start
+    finally:
+        os.chdir(cwd)
+    return os.path.getsize(os.path.join(directory, PRODUCTS_FILE)), build_seconds
+
+def main():
+    parser = argparse.ArgumentParser(description='Catalog loading memory benchmark (dicts vs mmap store)')
+    parser.add_argument('--sizes', default='10000,100000')
+    parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument('--total', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.mode:
+        return run_mode(args.mode, args.total)
+
+    print(f"{'products':>9} {'json MB':>8} {'mode':<9} {'peak MB':>8} {'RSS MB':>7} {'anon MB':>8} {'load s':>7} "
+          f"{'lookup us':>10} {'details us':>11}")
+    for total in [int(x) for x in args.sizes.split(',')]:
+        with tempfile.TemporaryDirectory() as directory:
+            size, build_seconds = prepare(directory, total)
+            for mode in MODES:
+                output = subprocess.run([sys.executable, os.path.abspath(__file__), '--mode', mode,
+                                         '--total', str(total)], cwd=directory, check=True,
+                                        capture_output=True, text=True).stdout
+                result = json.loads(output.strip().splitlines()[-1])
+                print(f"{total:>9} {size / 2 ** 20:>8.1f} {mode:<9} {result['peak_mb']:>8.1f} "
+                      f"{result['rss_mb']:>7.1f} {result['anon_mb']:>8.1f} "
+                      f"{result['load']:>7.2f} {result['lookup_us']:>10.1f} {result['details_us']:>11.1f}")
+            print(f"{total:>9} {'':>8} {'(build catalog.store: ' + format(build_seconds, '.2f') + ' s)'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس فهرس البحث على كتالوج صناعي (عناوين عربية + إنجليزي، وصف بنفس شكل products.json)
+- زمن البناء وحجم الفهرس وعدد الـ shards
+- زمن البحث (p50 / p99) من أول تحميل للـ shard ولما يكون في الكاش
+- مقارنة بالبحث الخطي القديم (includes على title/description/category لكل المنتجات)
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_search.py
+    python .github/scripts/benchmarks/bench_search.py --sizes 1000,100000 --queries 200
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import search_index
+
+WORDS = ['جهاز', 'مساج', 'ساعة', 'عطر', 'خلاط', 'كاميرا', 'إضاءة', 'الأطفال', 'مكنسة', 'سيارة',
+         'لاسلكية', 'رولكس', 'ذهبي', 'فضي', 'أسود', 'rolex', 'watch', 'gold', 'silver', 'smart']
+BOILERPLATE = ('يمنحك استخداماً سريعاً ونتائج مبهرة تلبي احتياجاتك بدقة وتوفر الوقت في كل عملية\n'
+               'يتمتع بصلابة الهيكل ومواد تصنيع متينة تضمن أداءً يستمر لفترات طويلة دون أعطال')
+CATEGORIES = ['Home & Garden > Household Supplies', 'Apparel & Accessories > Jewelry > Watches',
+              'Health & Beauty > Personal Care']
+
+# ========== كتالوج صناعي ==========
+def make_products(total, seed=1):
+    rng = random.Random(seed)
+    products = []
+    for i in range(1, total + 1):
+        # كلمة نادرة (رقم موديل) في كل عنوان عشان البحث يكون فيه نتائج قليلة كمان
+        title = ' '.join(rng.sample(WORDS, 4)) + f' m{i}'
+        products.append({
+            'id': str(i),
+            'title': title,
+            'description': f"{title} {BOILERPLATE}",
+            'category': rng.choice(CATEGORIES),
+        })
+    return products
+
+def make_queries(count, total, seed=2):
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.4:
+            queries.append(rng.choice(WORDS))
+        elif kind < 0.7:
+            queries.append(' '.join(rng.sample(WORDS, 2)))
+        elif kind < 0.9:
+            queries.append(rng.choice(WORDS)[:3])
+        else:
+            queries.append(f'm{rng.randint(1, total)}')
+    return queries
+
+# ========== القياس ==========
+def linear_search(products, query):
+    """searchProducts القديمة"""
+    q = query.lower()
+    return [p for p in products
+            if q in p['title'].lower() or q in p['description'].lower() or q in p['category'].lower()]
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+def time_queries(fn, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        fn(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    return percentile(timings, 50), percentile(timings, 99)
+
+def main():
+    parser = argparse.ArgumentParser(description='Search index benchmark')
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--shard-terms', type=int, default=search_index.DEFAULT_SHARD_TERMS)
+    args = parser.parse_args()
+
+    print(f"{'products':>9} {'build s':>8} {'terms':>8} {'shards':>7} {'KB':>8} "
+          f"{'cold p50':>9} {'warm p50':>9} {'warm p99':>9} {'linear p50':>11}")
+    for total in [int(x) for x in args.sizes.split(',')]:
+        products = make_products(total)
+        queries = make_queries(args.queries, total)
+        with tempfile.TemporaryDirectory() as directory:
+            search_index.SEARCH_DIR = directory
+            search_index.SEARCH_MANIFEST = os.path.join(directory, 'manifest.json')
+            start = time.perf_counter()
+            terms, shards, _ = search_index.build_search_index(products, args.shard_terms)
+            build = time.perf_counter() - start
+            size = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+            # cold: index جديد لكل بحث (تحميل الـ manifest والـ shard من الديسك)
+            cold, _ = time_queries(lambda q: search_index.SearchIndex(directory).search(q), queries[:20])
+            index = search_index.SearchIndex(directory)
+            for query in queries:
+                index.search(query)
+            warm50, warm99 = time_queries(index.search, queries)
+            linear50, _ = time_queries(lambda q: linear_search(products, q), queries[:20])
+        print(f"{total:>9} {build:>8.2f} {terms:>8} {shards:>7} {size // 1024:>8} "
+              f"{cold:>8.2f}ms {warm50:>8.3f}ms {warm99:>8.3f}ms {linear50:>10.2f}ms")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس قراءة sitemap: الطريقة القديمة (ET.fromstring على الملف كامل) مقابل iterparse
+على ملفات sitemap صناعية بحجم 100 ألف ومليون رابط (ملف واحد أو sitemapindex مقسم)
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_sitemap.py
+    python .github/scripts/benchmarks/bench_sitemap.py --sizes 100000 --shard 50000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import catalog
+
+BASE_URL = 'https://sherow1982.github.io/matjar-makhzoon-alemarat'
+WORDS = ['جهاز', 'مساج', 'ساعة', 'عطر', 'خلاط', 'كاميرا', 'rolex', 'watch', 'gold']
+
+# ========== توليد sitemap صناعي ==========
+def write_urlset(path, start, count):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for i in range(start, start + count):
+            slug = '-'.join(WORDS[(i + k) % len(WORDS)] for k in range(3))
+            f.write(f'  <url>\n    <loc>{BASE_URL}/products/{slug}-{i}.html</loc>\n'
+                    f'    <lastmod>2025-11-27</lastmod>\n  </url>\n')
+        f.write('</urlset>\n')
+
+def write_sitemap(directory, total, shard):
+    """ملف واحد لو shard=0، وإلا sitemapindex يشاور على ملفات فرعية"""
+    path = os.path.join(directory, 'sitemap.xml')
+    if not shard:
+        write_urlset(path, 1, total)
+        return path
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        f.write('<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
+        for n, start in enumerate(range(1, total + 1, shard), 1):
+            name = f'sitemap-products-{n}.xml'
+            write_urlset(os.path.join(directory, name), start, min(shard, total - start + 1))
+            f.write(f'  <sitemap><loc>{BASE_URL}/{name}</loc></sitemap>\n')
+        f.write('</sitemapindex>\n')
+    return path
+
+# ========== القياس ==========
+def dom_urls(path):
+    """الطريقة القديمة: قراءة الملف كامل وبناء DOM (ملف واحد فقط)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        root = ET.fromstring(f.read())
+    ns = {'ns': 'http://www.sitemaps.org/schemas/sitemap/0.9'}
+    return [loc.text.strip() for loc in root.findall('ns:url/ns:loc', ns)
+            if '/products/' in loc.text]
+
+def streaming_count(path):
+    return sum(1 for _ in catalog.iter_product_urls(path))
+
+def measure(fn, path):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    count = result if isinstance(result, int) else len(result)
+    return elapsed, peak, count
+
+def main():
+    parser = argparse.ArgumentParser(description='Sitemap ingestion benchmark')
+    parser.add_argument('--sizes', default='100000,1000000')
+    parser.add_argument('--shard', type=int, default=50000,
+                        help='عدد الروابط في كل ملف فرعي (0 = ملف واحد)')
+    parser.add_argument('--skip-dom', action='store_true',
+                        help='تخطي الطريقة القديمة (بطيئة جداً مع مليون رابط)')
+    args = parser.parse_args()
+
+    print(f"{'urls':>9} {'method':<10} {'seconds':>8} {'peak MB':>9} {'found':>9}")
+    for total in [int(x) for x in args.sizes.split(',')]:
+        with tempfile.TemporaryDirectory() as directory:
+            single = write_sitemap(os.path.join(directory), total, 0)
+            rows = []
+            if not args.skip_dom:
+                rows.append(('dom', measure(dom_urls, single)))
+            rows.append(('iterparse', measure(streaming_count, single)))
+            if args.shard:
+                sharded_dir = os.path.join(directory, 'sharded')
+                os.mkdir(sharded_dir)
+                index = write_sitemap(sharded_dir, total, args.shard)
+                rows.append(('index', measure(streaming_count, index)))
+            for method, (elapsed, peak, count) in rows:
+                print(f"{total:>9} {method:<10} {elapsed:>8.2f} {peak / 1e6:>9.1f} {count:>9}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,413 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مجموعة قياس المسارات السريعة: الكتالوج، الـ sitemap، فهرس الروابط، الاختيار والتتبع
+على كتالوجات صناعية (عناوين عربية = slugs عربية في الروابط) بأحجام 1k / 10k / 100k / 1M
+
+كل مرحلة بتتقاس في process لوحدها (التحضير بره القياس): الزمن، وأقصى ذاكرة للمرحلة
+(VmHWM بعد تصفيره بـ /proc/self/clear_refs ناقص RSS قبلها - بيشمل صفحات الـ mmap)
+- load_products     catalog.load_products (products.json كله)
+- sitemap_parse     iter_product_urls + استخراج الـ id من اسم الصفحة (check_catalog.page_id)
+- url_index_build   build_url_index على products.json بالـ streaming
+- url_index_load    load_url_index (data/urls.json)
+- store_build       product_store.build_store
+- catalog_load      product_store.load_catalog من المخزن الجاهز
+- cycle_start       أول select_next_product في سجل فاضي (ترتيب الدورة بالأوزان لكل المنتجات)
+- selection         200 × (select_next_product + mark_posted) في نص دورة
+- tracking_load     load_tracking لسجل فيه دورتين كاملين ودورة شغالة
+- save_tracking     save_tracking على نفس السجل (ضغط الدورة القديمة لسطر ملخص)
+
+النتايج بتتقارن بـ baselines.json (في الريبو): أي مرحلة أبطأ من الـ baseline بأكتر من --threshold
+(50% افتراضياً - الزمن بيتهز كتير على أجهزة CI) أو ذاكرتها أكتر بـ --memory-threshold (10%)،
+وفوق حد أدنى للضوضاء، بتتعلم كـ regression والسكربت بيخرج بـ 1
+الزمن = أحسن تشغيلة من --repeat processes، وكل process بتعيد المرحلة القصيرة لحد ~1s،
+والمرحلة اللي تطلع regression بتتقاس تاني قبل ما تتعلم (فترة بطيئة على الجهاز مش regression)؛
+والمراحل اللي الـ baseline بتاعها أقل من MIN_BASELINE_SECONDS زمنها ما بيتقارنش (ضوضاء بس)
+البيانات الصناعية بتتولد مرة واحدة في .cache/bench-data/<الحجم>/ وبيتعاد استخدامها
+
+الاستخدام:
+    python .github/scripts/benchmarks/bench_suite.py
+    python .github/scripts/benchmarks/bench_suite.py --sizes 1k,10k,100k,1M --threshold 0.3
+    python .github/scripts/benchmarks/bench_suite.py --stages selection,save_tracking --repeat 5
+    python .github/scripts/benchmarks/bench_suite.py --update-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(BENCH_DIR, '..')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from catalog import PRODUCTS_FILE, SITE_URL, SITEMAP_FILE, URLS_FILE, URLS_VERSION, build_url_index
+
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baselines.json')
+DATA_DIR = os.path.join('.cache', 'bench-data')
+DATA_VERSION = 1
+DEFAULT_SIZES = '1k,10k,100k'
+SIZE_SUFFIXES = {'k': 1000, 'm': 1000000}
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_MEMORY_THRESHOLD = 0.1
+# فروق أصغر من كده ضوضاء مش regression
+TIME_FLOOR = 0.02
+MEMORY_FLOOR = 1.0
+# مراحل الـ baseline بتاعها أقصر من كده زمنها ما بيتقارنش (الذاكرة بس) - القياس نفسه أكبر من الفرق
+MIN_BASELINE_SECONDS = 0.01
+# المرحلة القصيرة بتتعاد جوه نفس الـ process لحد ما مجموع زمنها يعدي STAGE_MIN_SECONDS
+STAGE_MIN_SECONDS = 1.0
+STAGE_MAX_RUNS = 25
+
+TRACKING_LOG = 'tracking.jsonl'
+WORK_LOG = 'work.jsonl'
+SELECTIONS = 200
+
+WORDS = ['جهاز', 'مساج', 'لتدليك', 'فروة', 'الرأس', 'خلاط', 'كاتل', 'كهربائي', 'ترمس', 'مقص',
+         'تقليم', 'اشجار', 'ساعة', 'رولكس', 'عطر', 'فاخر', 'إضاءة', 'ذكية', 'للمنزل', 'magic',
+         'bullet', 'rolex', 'gold', 'pro', 'max']
+SENTENCE = 'يمنحك استخداماً سريعاً ونتائج مبهرة تلبي احتياجاتك بدقة وتوفر الوقت في كل عملية'
+CATEGORIES = ['Home & Garden > Household Supplies', 'Home & Garden > Kitchen & Dining',
+              'Health & Beauty > Personal Care', 'Apparel & Accessories > Jewelry > Watches',
+              'Electronics > Audio', 'Toys & Games', 'Sporting Goods > Fitness', 'Vehicles & Parts']
+
+# ========== البيانات الصناعية ==========
+def make_product(i, rng):
+    title = ' '.join(rng.sample(WORDS, rng.randint(3, 6)))
+    price = rng.randint(50, 900)
+    return {
+        'id': str(i), 'title': title,
+        'description': '\n'.join(f"{title} {SENTENCE}" for _ in range(4)),
+        'image_link': f'https://m5zoon.com/public/uploads/products/{i:08d}.webp',
+        'price': price, 'sale_price': price - rng.choice((0, 0, 10, 50, price // 3)),
+        'stock': rng.choice((50, 50, 50, 3, 0)), 'category': rng.choice(CATEGORIES),
+        'availability': 'in stock', 'condition': 'new', 'brand': 'Generic', 'currency': 'AED',
+    }
+
+def generate(directory, total, seed=1):
+    """products.json و data/urls.json و sitemap.xml وسجل تتبع كبير - منتج منتج (الذاكرة ثابتة)"""
+    import logging
+    logging.disable(logging.CRITICAL)
+    rng = random.Random(seed)
+    os.makedirs(os.path.join(directory, 'data'), exist_ok=True)
+    urls = {}
+    with open(os.path.join(directory, PRODUCTS_FILE), 'w', encoding='utf-8', newline='') as products, \
+            open(os.path.join(directory, SITEMAP_FILE), 'w', encoding='utf-8') as sitemap:
+        products.write('[\r\n')
+        sitemap.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+                      '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+                      f'  <url>\n    <loc>{SITE_URL}</loc>\n    <priority>1.0</priority>\n  </url>\n')
+        for i in range(1, total + 1):
+            product = make_product(i, rng)
+            text = json.dumps(product, ensure_ascii=False, indent=2).replace('\n', '\r\n')
+            products.write(('' if i == 1 else ',\r\n') + text)
+            index, _ = build_url_index([product])
+            path, url = index[product['id']]
+            urls[product['id']] = [path, url]
+            # روابط sitemap.xml بالحروف العربية زي الملف الحقيقي
+            sitemap.write(f'  <url>\n    <loc>{SITE_URL}{path}</loc>\n    <lastmod>2025-11-27</lastmod>\n'
+                          f'    <changefreq>weekly</changefreq>\n    <priority>0.8</priority>\n  </url>\n')
+        products.write('\r\n]')
+        sitemap.write('</urlset>\n')
+    with open(os.path.join(directory, URLS_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'version': URLS_VERSION, 'total': total, 'urls': urls}, f,
+                  ensure_ascii=False, separators=(',', ':'))
+    del urls
+
+    cwd = os.getcwd()
+    os.chdir(directory)
+    try:
+        from product_store import load_catalog
+        store, _, key = load_catalog()
+        store.close()
+    finally:
+        os.chdir(cwd)
+    write_tracking_log(os.path.join(directory, TRACKING_LOG), total, key, rng)
+
+def write_tracking_log(path, total, key, rng):
+    """دورتين منتهيين (كل المنتجات) + دورة تالتة في نصها - نفس شكل سطور tracking.py"""
+    from tracking import encode_record
+    ids = [str(i) for i in range(1, total + 1)]
+    with open(path, 'w', encoding='utf-8') as f:
+        for cycle in (1, 2, 3):
+            rng.shuffle(ids)
+            f.write(encode_record({'type': 'order', 'cycle': cycle, 'seed': rng.randrange(2 ** 32),
+                                   'catalog_key': key, 'order': ids}))
+            posts = total if cycle < 3 else total // 2
+            for n, product_id in enumerate(ids[:posts]):
+                f.write(encode_record({'type': 'post', 'id': product_id, 'channel': 'twitter', 'cycle': cycle,
+                                       'ts': '2025-11-27T10:00:00Z', 'remote_id': str(10 ** 18 + n)}))
+
+def data_dir(total, seed=1):
+    """مجلد البيانات للحجم ده - بيتولد لو مش موجود أو قديم"""
+    directory = os.path.join(DATA_DIR, str(total))
+    marker = os.path.join(directory, 'generated.json')
+    expected = {'version': DATA_VERSION, 'total': total, 'seed': seed}
+    try:
+        with open(marker, 'r', encoding='utf-8') as f:
+            if json.load(f) == expected:
+                return directory
+    except (OSError, ValueError):
+        pass
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+    print(f"🏗️ توليد كتالوج صناعي: {total} منتج ...", flush=True)
+    start = time.perf_counter()
+    generate(directory, total, seed)
+    with open(marker, 'w', encoding='utf-8') as f:
+        json.dump(expected, f)
+    print(f"   {time.perf_counter() - start:.1f}s", flush=True)
+    return directory
+
+# ========== المراحل ==========
+# كل مرحلة: (تحضير -> state, القياس(state)) - بتشتغل جوه مجلد البيانات
+def fresh_log():
+    shutil.copyfile(TRACKING_LOG, WORK_LOG)
+
+def setup_selection():
+    from product_store import load_catalog
+    from tracking import load_tracking
+    fresh_log()
+    catalog, total, key = load_catalog()
+    return catalog, total, key, load_tracking(WORK_LOG, 'twitter')
+
+def run_selection(state):
+    from tracking import mark_posted, select_next_product
+    catalog, total, key, tracking = state
+    for _ in range(SELECTIONS):
+        product, _ = select_next_product(catalog, total, tracking, key)
+        mark_posted(tracking, product['id'])
+
+def setup_cycle_start():
+    from product_store import load_catalog
+    from tracking import load_tracking
+    if os.path.exists(WORK_LOG):
+        os.remove(WORK_LOG)
+    catalog, total, key = load_catalog()
+    return catalog, total, key, load_tracking(WORK_LOG, 'twitter')
+
+def run_cycle_start(state):
+    from tracking import select_next_product
+    catalog, total, key, tracking = state
+    select_next_product(catalog, total, tracking, key)
+
+def setup_save_tracking():
+    from tracking import load_tracking
+    fresh_log()
+    return load_tracking(WORK_LOG, 'twitter')
+
+def run_sitemap_parse(_):
+    from catalog import iter_product_urls
+    from check_catalog import loc_file, page_id
+    ids = [page_id(loc_file(loc)) for loc in iter_product_urls(SITEMAP_FILE)]
+    assert all(ids)
+
+def run_url_index_build(_):
+    from catalog import iter_products
+    index, problems = build_url_index(iter_products())
+    assert index and not problems
+
+def run_store_build(_):
+    from product_store import build_store
+    assert build_store(os.path.join('.cache', 'bench.store'))
+
+STAGES = {
+    'load_products': (None, lambda _: __import__('catalog').load_products()),
+    'sitemap_parse': (None, run_sitemap_parse),
+    'url_index_build': (None, run_url_index_build),
+    'url_index_load': (None, lambda _: __import__('catalog').load_url_index()),
+    'store_build': (None, run_store_build),
+    'catalog_load': (None, lambda _: __import__('product_store').load_catalog()),
+    'cycle_start': (setup_cycle_start, run_cycle_start),
+    'selection': (setup_selection, run_selection),
+    'tracking_load': (fresh_log, lambda _: __import__('tracking').load_tracking(WORK_LOG, 'twitter')),
+    'save_tracking': (setup_save_tracking, lambda tracking: __import__('tracking').save_tracking(tracking)),
+}
+
+# ========== مرحلة واحدة (جوه process لوحدها) ==========
+def memory_status():
+    values = {}
+    with open('/proc/self/status', 'r') as f:
+        for line in f:
+            name, _, value = line.partition(':')
+            if name in ('VmHWM', 'VmRSS'):
+                values[name] = int(value.split()[0]) / 1024
+    return values
+
+def reset_peak():
+    """تصفير VmHWM (Linux) - False لو مش متاح"""
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+def run_stage(name):
+    """الزمن = أحسن تشغيلة من كذا تشغيلة (كل واحدة بتحضير جديد بره القياس) - الذاكرة من أول تشغيلة"""
+    import logging
+    logging.disable(logging.CRITICAL)
+    setup, run = STAGES[name]
+    times, peak = [], None
+    while not times or (sum(times) < STAGE_MIN_SECONDS and len(times) < STAGE_MAX_RUNS):
+        state = setup() if setup else None
+        first = not times
+        if first:
+            has_peak = reset_peak()
+            before = memory_status()['VmRSS']
+        start = time.perf_counter()
+        result = run(state)
+        times.append(time.perf_counter() - start)
+        if first and has_peak:
+            peak = memory_status()['VmHWM'] - before
+        del result, state
+    print(json.dumps({'seconds': min(times), 'peak_mb': peak, 'runs': len(times)}))
+
+# ========== المقارنة بالـ baseline ==========
+def machine_info():
+    return {'python': platform.python_version(), 'platform': f"{platform.system()}-{platform.machine()}",
+            'cpus': os.cpu_count()}
+
+def load_baselines(path=BASELINE_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'version': 1, 'machine': None, 'results': {}}
+
+def save_baselines(baselines, path=BASELINE_FILE):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+def regressions(result, baseline, threshold, memory_threshold):
+    """قائمة بالمقاييس اللي زادت عن الـ baseline بأكتر من الـ threshold بتاعها (وفوق حد الضوضاء)"""
+    found = []
+    for metric, threshold, floor in (('seconds', threshold, TIME_FLOOR),
+                                     ('peak_mb', memory_threshold, MEMORY_FLOOR)):
+        new, old = result.get(metric), baseline.get(metric)
+        if new is None or old is None:
+            continue
+        if metric == 'seconds' and old < MIN_BASELINE_SECONDS:
+            continue
+        if new > old * (1 + threshold) and new - old > floor:
+            found.append(metric)
+    return found
+
+def change(new, old):
+    if new is None or not old:
+        return ''
+    return f"{(new - old) / old * 100:+.0f}%"
+
+def number(value, spec):
+    return '-' if value is None else format(value, spec)
+
+# ========== القياس ==========
+def parse_size(text):
+    """'1k' / '10K' / '1M' / '1000' -> عدد المنتجات"""
+    text = text.strip()
+    multiplier = SIZE_SUFFIXES.get(text[-1:].lower(), 1)
+    number = text[:-1] if multiplier > 1 else text
+    try:
+        total = int(float(number) * multiplier)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"حجم مش مفهوم: {text!r} (أمثلة: 1000، 1k، 100k، 1M)")
+    if total < 1:
+        raise argparse.ArgumentTypeError(f"الحجم لازم يكون أكبر من صفر: {text!r}")
+    return total
+
+def parse_sizes(text):
+    return [parse_size(part) for part in text.split(',') if part.strip()]
+
+def measure(directory, stage, repeat):
+    """أحسن زمن ووسيط ذروة الذاكرة من repeat مرات (كل مرة process جديدة)
+    الضوضاء على الزمن بتزود بس (processes تانية على نفس الـ CPU، سرعة الجهاز بتتهز ±40% من فترة للتانية)،
+    فأحسن تشغيلة من كل التشغيلات (جوه كل process المرحلة القصيرة بتتعاد - run_stage) هي الأثبت
+    """
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, os.path.abspath(__file__), '--stage', stage],
+                                cwd=directory, check=True, capture_output=True, text=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    peaks = [run['peak_mb'] for run in runs if run['peak_mb'] is not None]
+    return {'seconds': min(run['seconds'] for run in runs),
+            'peak_mb': statistics.median(peaks) if peaks else None}
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark suite for catalog, sitemap, selection and tracking')
+    parser.add_argument('--sizes', type=parse_sizes, default=DEFAULT_SIZES,
+                        help='أحجام الكتالوج مفصولة بفاصلة: 1000 أو 1k / 100k / 1M')
+    parser.add_argument('--stages', default=','.join(STAGES), help='المراحل مفصولة بفاصلة')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='كل مرحلة بتتقاس في كذا process (الزمن الأحسن، الذاكرة الوسيط)')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='نسبة زيادة الزمن عن الـ baseline اللي تتحسب regression (0.5 = 50%%)')
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help='نسبة زيادة الذاكرة اللي تتحسب regression')
+    parser.add_argument('--baseline', default=BASELINE_FILE)
+    parser.add_argument('--update-baseline', action='store_true', help='حفظ النتايج كـ baseline جديد')
+    parser.add_argument('--stage', choices=list(STAGES), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.stage:
+        return run_stage(args.stage)
+
+    stages = args.stages.split(',')
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        sys.exit(f"❌ مراحل مش معروفة: {', '.join(unknown)} (المتاح: {', '.join(STAGES)})")
+    baselines = load_baselines(args.baseline)
+    if baselines.get('machine') and baselines['machine'] != machine_info():
+        print(f"⚠️ الـ baseline متسجل على جهاز تاني ({baselines['machine']}) - مقارنة الزمن تقريبية")
+
+    sizes = args.sizes
+    directories = {total: data_dir(total) for total in sizes}
+    results = {}
+    flagged = []
+    print(f"{'products':>9} {'stage':<16} {'seconds':>9} {'base s':>9} {'Δ':>6} "
+          f"{'peak MB':>8} {'base MB':>8} {'Δ':>6}")
+    for total in sizes:
+        for stage in stages:
+            result = measure(directories[total], stage, args.repeat)
+            baseline = baselines['results'].get(str(total), {}).get(stage) or {}
+            bad = regressions(result, baseline, args.threshold, args.memory_threshold)
+            if bad and not args.update_baseline:
+                # تأكيد: الجهاز ممكن يكون في فترة بطيئة - قياس تاني وناخد الأحسن من الاتنين
+                again = measure(directories[total], stage, args.repeat)
+                result = {'seconds': min(result['seconds'], again['seconds']),
+                          'peak_mb': again['peak_mb'] if 'peak_mb' in bad else result['peak_mb']}
+                bad = regressions(result, baseline, args.threshold, args.memory_threshold)
+            results.setdefault(str(total), {})[stage] = result
+            if bad:
+                flagged.append((total, stage, bad))
+            print(f"{total:>9} {stage:<16} {number(result['seconds'], '.4f'):>9} "
+                  f"{number(baseline.get('seconds'), '.4f'):>9} {change(result['seconds'], baseline.get('seconds')):>6} "
+                  f"{number(result['peak_mb'], '.1f'):>8} {number(baseline.get('peak_mb'), '.1f'):>8} "
+                  f"{change(result['peak_mb'], baseline.get('peak_mb')):>6}"
+                  f"{'  ⚠️ ' + ','.join(bad) if bad else ''}", flush=True)
+
+    if args.update_baseline:
+        for total, stage_results in results.items():
+            baselines['results'].setdefault(total, {}).update(
+                {stage: {metric: round(value, 4) if value is not None else None
+                         for metric, value in result.items()}
+                 for stage, result in stage_results.items()})
+        baselines['machine'] = machine_info()
+        save_baselines(baselines, args.baseline)
+        print(f"💾 تم حفظ الـ baseline في {args.baseline}")
+    elif flagged:
+        print(f"\n❌ {len(flagged)} regression (الزمن فوق {args.threshold:.0%} أو الذاكرة فوق "
+              f"{args.memory_threshold:.0%}):")
+        for total, stage, metrics in flagged:
+            print(f"   {total} {stage}: {', '.join(metrics)}")
+        sys.exit(1)
+    else:
+        print(f"\n✅ مفيش regressions (الزمن {args.threshold:.0%}، الذاكرة {args.memory_threshold:.0%})")
+
+if __name__ == '__main__':
+    main()
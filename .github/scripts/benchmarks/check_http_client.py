@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+فحص http_client على سيرفر محلي (stub): إعادة المحاولة والـ backoff والـ rate limit
+- GET بيتعاد بعد 5xx لحد ما ينجح (والسيرفر شاف عدد الطلبات المتوقع)
+- Retry-After بيتحترم (مع 429 و 503) بدل الـ backoff العشوائي
+- POST ما بيتعادش بعد 5xx (ممكن يكون اتنفذ) - بس بيتعاد بعد 429
+- الـ token bucket بتاع الـ host بيحدد معدل الطلبات
+
+الاستخدام:
+    python .github/scripts/benchmarks/check_http_client.py
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import requests
+
+import http_client
+
+# ========== السيرفر ==========
+class StubAPI(BaseHTTPRequestHandler):
+    """/<kind>/<key>?fail=N: أول N طلبات لنفس المفتاح بتفشل بالحالة بتاعة kind، وبعدها 200
+    kind: 503 | 500 | 429 | retry503 (503 + Retry-After) | ok
+    """
+    protocol_version = 'HTTP/1.1'
+    retry_after = 1
+    counts = {}
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def respond(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+        path, _, query = self.path.partition('?')
+        kind, _, key = path.strip('/').partition('/')
+        fail = int(query.split('=', 1)[1]) if query.startswith('fail=') else 1
+        with self.lock:
+            seen = StubAPI.counts[key] = StubAPI.counts.get(key, 0) + 1
+        status, headers = 200, {}
+        if kind != 'ok' and seen <= fail:
+            status = {'503': 503, '500': 500, '429': 429, 'retry503': 503}[kind]
+            if kind in ('429', 'retry503'):
+                headers['Retry-After'] = str(self.retry_after)
+        body = b'{"ok": true}' if status == 200 else b'{"error": true}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.respond()
+
+    def do_POST(self):
+        self.respond()
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # العميل بيقفل الاتصال بعد آخر إعادة - مش خطأ
+        pass
+
+def start_server():
+    server = StubServer(('127.0.0.1', 0), StubAPI)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ========== الفحوصات ==========
+def timed(method, url):
+    session = http_client.install(requests.Session())
+    start = time.monotonic()
+    response = session.request(method, url)
+    return response.status_code, time.monotonic() - start
+
+def main():
+    logging.disable(logging.CRITICAL)
+    # backoff صغير عشان الفرق بينه وبين Retry-After يبان
+    http_client.BACKOFF_BASE = 0.01
+    server = start_server()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    results = []
+
+    def check(label, ok, detail):
+        results.append(ok)
+        print(f"{'✅' if ok else '❌'} {label}: {detail}")
+
+    status, seconds = timed('GET', f"{base}/503/get-5xx?fail=2")
+    check('GET retried on 5xx', status == 200 and StubAPI.counts['get-5xx'] == 3,
+          f"{status} بعد {StubAPI.counts['get-5xx']} طلبات")
+
+    status, _ = timed('GET', f"{base}/503/get-give-up?fail=99")
+    check('GET gives up after MAX_RETRIES', status == 503 and
+          StubAPI.counts['get-give-up'] == http_client.MAX_RETRIES + 1,
+          f"{status} بعد {StubAPI.counts['get-give-up']} طلبات")
+
+    for kind in ('429', 'retry503'):
+        status, seconds = timed('GET', f"{base}/{kind}/get-{kind}?fail=1")
+        check(f"Retry-After honoured ({kind})", status == 200 and seconds >= StubAPI.retry_after * 0.9,
+              f"{status} بعد {seconds:.2f}s (Retry-After: {StubAPI.retry_after}s)")
+
+    status, _ = timed('POST', f"{base}/500/post-5xx?fail=1")
+    check('POST not retried on 5xx', status == 500 and StubAPI.counts['post-5xx'] == 1,
+          f"{status} بعد {StubAPI.counts['post-5xx']} طلب")
+
+    status, _ = timed('POST', f"{base}/429/post-429?fail=1")
+    check('POST retried on 429', status == 200 and StubAPI.counts['post-429'] == 2,
+          f"{status} بعد {StubAPI.counts['post-429']} طلبات")
+
+    # token bucket: 10 طلبات في الثانية ودفعة 2 -> 12 طلب محتاجين ~1 ثانية
+    rate, burst, total = 10.0, 2, 12
+    http_client.RATE_LIMITS['127.0.0.1'] = (rate, burst)
+    session = http_client.install(requests.Session())
+    start = time.monotonic()
+    for i in range(total):
+        session.get(f"{base}/ok/bucket-{i}")
+    seconds = time.monotonic() - start
+    expected = (total - burst) / rate
+    check('per-host token bucket', seconds >= expected * 0.9,
+          f"{total} طلب في {seconds:.2f}s (المتوقع >= {expected:.2f}s بـ {rate:g}/s)")
+
+    server.shutdown()
+    if not all(results):
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
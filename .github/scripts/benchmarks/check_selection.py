@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+فحص ضمان الدورة في الاختيار: ما فيش منتج بيتنشر مرتين في نفس الدورة والدورة بتخلص
+كل تشغيلة بتتحاكى زي الحقيقة: load_tracking من السجل (replay) ثم select_next_product + mark_posted
+السيناريوهات:
+- منتج صورته مكسورة (skip) واقف عند الـ cursor - replay بيرجع الـ cursor عليه في كل تشغيلة
+- منشور معلق من الـ outbox بيتنشر من غير اختيار (منتج بعد الـ cursor)
+
+الاستخدام:
+    python .github/scripts/benchmarks/check_selection.py
+    python .github/scripts/benchmarks/check_selection.py --products 50 --cycles 4
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from tracking import load_tracking, mark_posted, select_next_product
+
+def make_catalog(total):
+    return {str(i): {'id': str(i), 'title': f"منتج {i}", 'url': f"https://example.com/{i}.html",
+                     'price': 100, 'sale_price': 100 - i % 30, 'stock': 50, 'category': f"c{i % 4}"}
+            for i in range(1, total + 1)}
+
+def run_cycles(path, catalog, cycles, broken=frozenset(), pending=None):
+    """تشغيلات لحد ما يخلص cycles دورات - يرجع [(الدورة, المنتج)] لكل تشغيلة"""
+    posts = []
+    runs_per_cycle = len(catalog) - len(broken)
+    for run in range(cycles * runs_per_cycle):
+        tracking = load_tracking(path, 'twitter')
+        if pending and run == 0:
+            # منشور معلق اتنشر من الـ outbox (مش من الاختيار) - منتج بعد الـ cursor
+            product_id = tracking['order'][len(tracking['order']) // 2]
+            mark_posted(tracking, product_id)
+            posts.append((tracking['cycle'], product_id))
+            continue
+        product, _ = select_next_product(catalog, len(catalog), tracking, 'key', broken)
+        mark_posted(tracking, product['id'])
+        posts.append((tracking['cycle'], product['id']))
+    return posts
+
+def check(posts, catalog, broken, cycles):
+    """قائمة بالمشاكل (فاضية = تمام)"""
+    problems = []
+    seen = {}
+    for cycle, product_id in posts:
+        seen.setdefault(cycle, []).append(product_id)
+    for cycle, ids in sorted(seen.items()):
+        repeated = sorted({i for i in ids if ids.count(i) > 1}, key=int)
+        if repeated:
+            problems.append(f"الدورة {cycle}: منتجات اتنشرت أكتر من مرة {repeated}")
+        if broken & set(ids):
+            problems.append(f"الدورة {cycle}: منتج صورته مكسورة اتنشر {sorted(broken & set(ids))}")
+    expected = set(catalog) - broken
+    finished = [cycle for cycle, ids in seen.items() if set(ids) == expected]
+    if len(finished) < cycles:
+        problems.append(f"دورات كاملة {len(finished)} من {cycles}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description='Selection no-repeat check across runs and cycles')
+    parser.add_argument('--products', type=int, default=30)
+    parser.add_argument('--cycles', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    catalog = make_catalog(args.products)
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        # الدورة الأولى بتتبني الأول عشان نعرف المنتج اللي عند الـ cursor ونكسره
+        probe = os.path.join(directory, 'probe.jsonl')
+        first, _ = select_next_product(catalog, len(catalog), load_tracking(probe, 'twitter'), 'key')
+        scenarios = [
+            ('broken product at the cursor', frozenset({first['id']}), None),
+            ('pending outbox post after the cursor', frozenset(), True),
+            ('both', frozenset({first['id']}), True),
+        ]
+        for n, (label, broken, pending) in enumerate(scenarios):
+            path = os.path.join(directory, f"{n}.jsonl")
+            with open(probe, 'rb') as src, open(path, 'wb') as dst:
+                dst.write(src.read())
+            posts = run_cycles(path, catalog, args.cycles, broken, pending)
+            problems = check(posts, catalog, broken, args.cycles)
+            print(f"{'✅' if not problems else '❌'} {label}: {len(posts)} تشغيلة")
+            for problem in problems:
+                print(f"   {problem}")
+            failed = failed or bool(problems)
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
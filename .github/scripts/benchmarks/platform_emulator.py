@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+محاكي محلي لـ Graph API و Twitter - نفس الـ endpoints اللي سكربتات النشر بتكلمها:
+- graph.facebook.com   POST /{page}/photos, /{page}/feed, /{account}/media, /{account}/media_publish
+                       GET  /{container}?fields=status_code
+- upload.twitter.com   POST /1.1/media/upload.json (رفع بسيط أو INIT/APPEND/FINALIZE)
+- api.twitter.com      POST /2/tweets (create_tweet)
+- /cdn/<name>.jpg      صور المنتجات (للتحميل والتحويل في images.py)
+
+الأعطال اللي بيحقنها (كلها اختيارية): تأخير لكل طلب + jitter، 429 بـ Retry-After،
+أخطاء 5xx، وcontainers بتاخد وقت لحد ما تجهز (أو بتفشل)
+السكربتات بتتحول له بـ PLATFORM_EMULATOR (شوف http_client.py) - الطلب بيوصل كـ /{host}{path}
+الإحصائيات (عدد الطلبات والأعطال والمنشورات المكررة لكل endpoint) على GET /_emulator/stats
+
+الاستخدام:
+    python .github/scripts/benchmarks/platform_emulator.py --port 8800 --rate-429 0.05 --container-delay 3
+    PLATFORM_EMULATOR=http://127.0.0.1:8800 python .github/scripts/runner.py --channels facebook,instagram
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from email.parser import BytesParser
+from email.policy import default as email_policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+DEFAULT_FAULTS = {
+    'latency': 0.05,          # تأخير كل طلب (ثانية)
+    'jitter': 0.02,           # +- عشوائي على التأخير
+    'rate_429': 0.0,          # نسبة الطلبات اللي بترجع 429
+    'rate_5xx': 0.0,          # نسبة الطلبات اللي بترجع 500/502/503
+    'retry_after': 1.0,       # Retry-After مع الـ 429 (ثانية)
+    'container_delay': 2.0,   # متوسط وقت تجهيز Instagram container (ثانية)
+    'container_error': 0.0,   # نسبة الـ containers اللي بتخلص ERROR
+}
+
+GRAPH_PATH = re.compile(r'^/v\d+\.\d+/([^/]+)(?:/(photos|feed|media|media_publish))?$')
+SERVER_ERRORS = (500, 502, 503)
+
+def test_image():
+    """صورة JPEG للـ CDN - من Pillow لو موجود وإلا bytes بشكل JPEG بس"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return b'\xff\xd8\xff' + b'0' * 40000
+    out = BytesIO()
+    Image.new('RGB', (1200, 1200), (200, 120, 40)).save(out, format='JPEG', quality=90)
+    return out.getvalue()
+
+# ========== حالة المحاكي ==========
+class Emulator:
+    """الحالة المشتركة بين كل الطلبات (containers، الصور المرفوعة، المنشورات، الإحصائيات)"""
+
+    def __init__(self, faults=None, seed=None):
+        self.faults = dict(DEFAULT_FAULTS, **(faults or {}))
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.image = test_image()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.next_id = 1000
+            self.containers = {}
+            self.media = {}
+            self.published = set()
+            self.stats = {}
+
+    def new_id(self):
+        with self.lock:
+            self.next_id += 1
+            return str(self.next_id)
+
+    def count(self, endpoint, outcome):
+        with self.lock:
+            entry = self.stats.setdefault(endpoint, {})
+            entry[outcome] = entry.get(outcome, 0) + 1
+
+    def delay(self):
+        with self.lock:
+            jitter = self.rng.uniform(-1, 1) * self.faults['jitter']
+        return max(0.0, self.faults['latency'] + jitter)
+
+    def injected_fault(self):
+        """429 أو 5xx عشوائي (أو None)"""
+        with self.lock:
+            roll = self.rng.random()
+            if roll < self.faults['rate_429']:
+                return 429
+            if roll < self.faults['rate_429'] + self.faults['rate_5xx']:
+                return self.rng.choice(SERVER_ERRORS)
+        return None
+
+    def record_post(self, endpoint, text):
+        """تسجيل منشور - النص نفسه مرتين على نفس المنصة = منشور مكرر"""
+        with self.lock:
+            duplicate = (endpoint, text) in self.published
+            self.published.add((endpoint, text))
+        if duplicate:
+            self.count(endpoint, 'duplicate')
+
+    # ---------- Instagram containers ----------
+    def create_container(self):
+        container_id = self.new_id()
+        with self.lock:
+            ready_in = self.faults['container_delay'] * self.rng.uniform(0.5, 1.5)
+            failed = self.rng.random() < self.faults['container_error']
+            self.containers[container_id] = {'ready_at': time.monotonic() + ready_in,
+                                             'failed': failed, 'published': False}
+        return container_id
+
+    def container_status(self, container_id):
+        with self.lock:
+            container = self.containers.get(container_id)
+        if container is None:
+            return None
+        if time.monotonic() < container['ready_at']:
+            return 'IN_PROGRESS'
+        return 'ERROR' if container['failed'] else 'FINISHED'
+
+    def snapshot(self):
+        with self.lock:
+            return {'faults': dict(self.faults), 'endpoints': json.loads(json.dumps(self.stats))}
+
+# ========== الطلبات ==========
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def emulator(self):
+        return self.server.emulator
+
+    def send_json(self, status, body, headers=None):
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8') if body is not None else b''
+        self.send_response(status)
+        if body is not None:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def read_form(self):
+        """(fields, files) من body الطلب - urlencoded أو multipart أو JSON"""
+        body = self.body
+        content_type = self.headers.get('Content-Type', '')
+        fields, files = {}, {}
+        if content_type.startswith('multipart/form-data'):
+            message = BytesParser(policy=email_policy).parsebytes(
+                b'Content-Type: ' + content_type.encode('latin-1') + b'\r\n\r\n' + body)
+            for part in message.iter_parts():
+                name = part.get_param('name', header='content-disposition')
+                payload = part.get_payload(decode=True) or b''
+                if part.get_filename():
+                    files[name] = payload
+                else:
+                    fields[name] = payload.decode('utf-8')
+        elif content_type.startswith('application/json'):
+            fields = json.loads(body or b'{}')
+        else:
+            fields = {k: v[-1] for k, v in parse_qs(body.decode('utf-8')).items()}
+        return fields, files
+
+    def route(self):
+        """(host, path, query) - الطلب بيوصل كـ /{host}{path}"""
+        parts = urlsplit(self.path)
+        host, _, path = parts.path.lstrip('/').partition('/')
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        return host, '/' + path, query
+
+    def handle_request(self):
+        # الـ body لازم يتقري قبل أي رد (حتى 429) وإلا الاتصال الـ keep-alive يبوظ
+        length = int(self.headers.get('Content-Length') or 0)
+        self.body = self.rfile.read(length) if length else b''
+        host, path, query = self.route()
+        if host == '_emulator':
+            if path == '/stats':
+                return self.send_json(200, self.emulator.snapshot())
+            if path == '/reset':
+                self.emulator.reset()
+                return self.send_json(200, {'ok': True})
+        if host == 'cdn':
+            time.sleep(self.emulator.delay())
+            self.send_response(200)
+            self.send_header('Content-Type', 'image/jpeg')
+            self.send_header('Content-Length', str(len(self.emulator.image)))
+            self.send_header('ETag', '"emulator"')
+            self.end_headers()
+            return self.wfile.write(self.emulator.image)
+        handler = {'graph.facebook.com': self.graph, 'upload.twitter.com': self.twitter_upload,
+                   'api.twitter.com': self.twitter_api}.get(host)
+        if handler is None:
+            return self.send_json(404, {'error': f'unknown host {host}'})
+
+        time.sleep(self.emulator.delay())
+        endpoint = f"{host}{re.sub(r'/[0-9_]{3,}(?=/|$)', '/{id}', path)}"
+        status = self.emulator.injected_fault()
+        if status == 429:
+            # الطلب ما اتنفذش - إعادته آمنة حتى لو POST
+            self.emulator.count(endpoint, '429')
+            retry_after = self.emulator.faults['retry_after']
+            headers = {'Retry-After': f"{retry_after:g}",
+                       'x-rate-limit-reset': str(int(time.time() + retry_after))}
+            if host == 'graph.facebook.com':
+                body = {'error': {'message': '(#4) Application request limit reached',
+                                  'type': 'OAuthException', 'code': 4}}
+            else:
+                body = {'title': 'Too Many Requests', 'detail': 'Too Many Requests', 'status': 429}
+            return self.send_json(429, body, headers)
+        if status:
+            self.emulator.count(endpoint, '5xx')
+            return self.send_json(status, {'error': {'message': 'An unexpected error has occurred',
+                                                     'code': 2, 'is_transient': True}})
+        status, body = handler(path, query)
+        self.emulator.count(endpoint, 'ok' if status < 300 else str(status))
+        self.send_json(status, body)
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.handle_request()
+
+    # ---------- Graph API ----------
+    def graph(self, path, query):
+        match = GRAPH_PATH.match(path)
+        fields, files = self.read_form() if self.command == 'POST' else ({}, {})
+        params = dict(query, **fields)
+        if not match:
+            return 400, graph_error(100, f'Unknown path components: {path}')
+        if not params.get('access_token'):
+            return 400, graph_error(190, 'An access token is required to request this resource.')
+        node, edge = match.groups()
+
+        if self.command == 'GET' and edge is None:
+            status = self.emulator.container_status(node)
+            if status is None:
+                return 400, graph_error(100, f"Unsupported get request. Object with ID '{node}' does not exist")
+            return 200, {'status_code': status, 'id': node}
+        if self.command != 'POST' or edge is None:
+            return 400, graph_error(100, 'Unsupported request')
+
+        if edge in ('photos', 'feed'):
+            if edge == 'photos' and 'source' not in files and not params.get('url'):
+                return 400, graph_error(324, 'Requires upload file')
+            if not params.get('message') and edge == 'feed':
+                return 400, graph_error(100, 'The parameter message is required')
+            self.emulator.record_post('facebook', params.get('message'))
+            post_id = f"{node}_{self.emulator.new_id()}"
+            return 200, ({'id': self.emulator.new_id(), 'post_id': post_id} if edge == 'photos'
+                         else {'id': post_id})
+        if edge == 'media':
+            if not params.get('image_url'):
+                return 400, graph_error(9004, 'Only photo or video can be accepted as media type.')
+            return 200, {'id': self.emulator.create_container()}
+
+        # media_publish
+        container_id = params.get('creation_id')
+        status = self.emulator.container_status(container_id)
+        if status is None:
+            return 400, graph_error(100, 'The parameter creation_id is required')
+        if status != 'FINISHED':
+            return 400, graph_error(9007, 'Media ID is not available')
+        with self.emulator.lock:
+            container = self.emulator.containers[container_id]
+            duplicate, container['published'] = container['published'], True
+        if duplicate:
+            self.emulator.count('instagram', 'duplicate')
+            return 400, graph_error(9007, 'Media ID is not available')
+        self.emulator.record_post('instagram', container_id)
+        return 200, {'id': self.emulator.new_id()}
+
+    # ---------- Twitter ----------
+    def authorized(self):
+        return self.headers.get('Authorization', '').startswith(('OAuth ', 'Bearer '))
+
+    def twitter_upload(self, path, query):
+        fields, files = self.read_form()
+        if not self.authorized():
+            return 401, {'errors': [{'code': 32, 'message': 'Could not authenticate you.'}]}
+        if path != '/1.1/media/upload.json':
+            return 404, {'errors': [{'code': 34, 'message': 'Sorry, that page does not exist.'}]}
+        command = fields.get('command') or query.get('command')
+        if command in ('APPEND', 'FINALIZE', 'STATUS'):
+            media_id = fields.get('media_id') or query.get('media_id')
+            with self.emulator.lock:
+                media = self.emulator.media.get(media_id)
+                if media is not None and command == 'APPEND':
+                    media['size'] += len(files.get('media', b''))
+            if media is None:
+                return 400, {'errors': [{'code': 324, 'message': 'Invalid media id'}]}
+            if command == 'APPEND':
+                return 204, None
+            return 200, media_body(media_id, media['size'])
+        if command == 'INIT':
+            media_id = self.emulator.new_id()
+            with self.emulator.lock:
+                self.emulator.media[media_id] = {'size': 0}
+            return 202, media_body(media_id, 0)
+
+        data = files.get('media')
+        if not data:
+            return 400, {'errors': [{'code': 38, 'message': 'media parameter is missing.'}]}
+        media_id = self.emulator.new_id()
+        with self.emulator.lock:
+            self.emulator.media[media_id] = {'size': len(data)}
+        return 200, media_body(media_id, len(data))
+
+    def twitter_api(self, path, query):
+        fields, _ = self.read_form()
+        if not self.authorized():
+            return 401, {'title': 'Unauthorized', 'status': 401, 'detail': 'Unauthorized'}
+        if path != '/2/tweets' or self.command != 'POST':
+            return 404, {'title': 'Not Found Error', 'status': 404}
+        text = fields.get('text')
+        media_ids = (fields.get('media') or {}).get('media_ids', [])
+        with self.emulator.lock:
+            unknown = [m for m in media_ids if str(m) not in self.emulator.media]
+        if not text or unknown:
+            return 400, {'title': 'Invalid Request', 'status': 400,
+                         'detail': 'One or more parameters to your request was invalid.'}
+        self.emulator.record_post('twitter', text)
+        return 201, {'data': {'id': self.emulator.new_id(), 'text': text}}
+
+def graph_error(code, message):
+    return {'error': {'message': message, 'type': 'OAuthException', 'code': code}}
+
+def media_body(media_id, size):
+    return {'media_id': int(media_id), 'media_id_string': media_id, 'size': size,
+            'expires_after_secs': 86400, 'image': {'image_type': 'image/jpeg', 'w': 1200, 'h': 1200}}
+
+# ========== التشغيل ==========
+class EmulatorServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # العميل بيقفل اتصالات زيادة عن الـ pool بتاعه - مش خطأ في المحاكي
+        pass
+
+def start_emulator(faults=None, port=0, seed=None):
+    """تشغيل المحاكي في thread - يرجع (server, base_url)"""
+    server = EmulatorServer(('127.0.0.1', port), Handler)
+    server.emulator = Emulator(faults, seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def add_fault_args(parser):
+    parser.add_argument('--latency', type=float, default=DEFAULT_FAULTS['latency'], help='تأخير كل طلب (ثانية)')
+    parser.add_argument('--jitter', type=float, default=DEFAULT_FAULTS['jitter'])
+    parser.add_argument('--rate-429', type=float, default=DEFAULT_FAULTS['rate_429'])
+    parser.add_argument('--rate-5xx', type=float, default=DEFAULT_FAULTS['rate_5xx'])
+    parser.add_argument('--retry-after', type=float, default=DEFAULT_FAULTS['retry_after'])
+    parser.add_argument('--container-delay', type=float, default=DEFAULT_FAULTS['container_delay'],
+                        help='متوسط وقت تجهيز Instagram container (ثانية)')
+    parser.add_argument('--container-error', type=float, default=DEFAULT_FAULTS['container_error'])
+
+def faults_from_args(args):
+    return {name: getattr(args, name) for name in DEFAULT_FAULTS}
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Graph API / Twitter emulator with fault injection')
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--seed', type=int, default=None)
+    add_fault_args(parser)
+    args = parser.parse_args()
+
+    server, base_url = start_emulator(faults_from_args(args), args.port, args.seed)
+    print(f"🧪 المحاكي شغال على {base_url} - PLATFORM_EMULATOR={base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مولّد صفحات المنتجات products/*.html من products.json
+- اسم الملف بنفس قاعدة getProductFileName() في index.html
+- manifest فيه hash لمدخلات كل صفحة: الصفحة بتتكتب بس لو مدخلاتها اتغيرت
+- إعادة البناء الكاملة (أول مرة أو تغيير القالب) بتتوزع على process pool
+- الـ CSS المشترك في ملف واحد assets/product.<hash>.css (بيتكاش مرة واحدة للموقع كله)
+  والصفحات نفسها بتتكتب مصغّرة (minify) مع تقرير بالحجم قبل وبعد
+- ملفات القائمة للصفحة الرئيسية (data/listing) مقسمة على shards - شوف listing.py
+- فهرس البحث (data/search) - شوف search_index.py
+- data/urls.json (id -> مسار الصفحة + الرابط encoded) بيتولد الأول وكل الباقي بياخد المسارات منه
+  أي تعارض (id أو اسم ملف متكرر) بيوقف البناء
+- sitemap.xml بيتولد من المنتجات (وبيتقسم لـ sitemapindex لما يكبر) - شوف sitemap.py
+- الـ JSON-LD ItemList للصفحة الرئيسية بيتكتب جوه index.html وقت البناء (بنفس ترتيب أول shard
+  في القائمة) - المتصفح ما بيعملش أي schema، والـ crawlers بتشوفها من غير JavaScript
+- feeds الـ Google Merchant و Meta (الكاملة والـ delta) - شوف feeds.py
+
+الاستخدام:
+    python .github/scripts/build_site.py            # تحديث الصفحات المتغيرة بس
+    python .github/scripts/build_site.py --full     # إعادة بناء كل الصفحات
+    python .github/scripts/build_site.py --dry-run  # عرض اللي هيتغير من غير كتابة
+    python .github/scripts/build_site.py --no-minify  # صفحات مقروءة (للتصحيح)
+    python .github/scripts/build_site.py --shard-size 48  # عدد المنتجات في كل shard للقائمة
+    python .github/scripts/build_site.py --sitemap-max-urls 500  # أقصى عدد روابط في ملف sitemap واحد
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from string import Template
+from urllib.parse import quote
+
+import metrics
+from feeds import export_feeds
+from listing import DEFAULT_SHARD_SIZE, build_listing
+from minify import minify_css, minify_html
+from search_index import build_search_index
+from sitemap import MAX_URLS, build_sitemap
+from catalog import (PRODUCTS_FILE, SITE_URL, URLS_FILE, build_url_index, load_products,
+                     write_url_index)
+
+log = logging.getLogger(__name__)
+
+PRODUCTS_DIR = 'products'
+TEMPLATE_FILE = os.path.join('.github', 'templates', 'product.html')
+STYLESHEET_SOURCE = os.path.join('.github', 'templates', 'product.css')
+ASSETS_DIR = 'assets'
+MANIFEST_FILE = os.path.join('.github', 'site-manifest.json')
+MANIFEST_VERSION = 1
+INDEX_FILE = 'index.html'
+
+STORE_NAME = 'متجر مخزون الإمارات'
+WHATSAPP_NUMBER = '201110760081'
+# تاريخ ثابت بيخلص (2025-12-31 كان خلص) - آخر السنة الجاية من يوم البناء
+# بيتغير مرة في السنة ومعاه template_key، فكل الصفحات بتتبني تاني بالتاريخ الجديد
+PRICE_VALID_UNTIL = f"{date.today().year + 1}-12-31"
+
+# أقل عدد صفحات يستاهل تشغيل process pool - أقل من كده البناء المتسلسل أسرع
+POOL_THRESHOLD = 200
+CHUNK_SIZE = 32
+
+VIDEO_BLOCK = """
+                    <!-- Product Video Section -->
+                    <div class="product-video">
+                        <div class="video-container">
+                            <iframe
+                                src="${video_url}"
+                                title="عرض توضيحي - ${title}"
+                                frameborder="0"
+                                allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture; web-share"
+                                referrerpolicy="strict-origin-when-cross-origin"
+                                allowfullscreen
+                                loading="lazy">
+                            </iframe>
+                        </div>
+                    </div>
+"""
+
+# ========== القالب ==========
+def load_template():
+    with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def template_key(template_text, stylesheet, minify):
+    """بصمة القالب + الـ stylesheet + أجزاء الكود - أي تغيير فيهم يعيد بناء كل الصفحات"""
+    h = hashlib.sha256()
+    for part in (template_text, stylesheet, str(minify), VIDEO_BLOCK, STORE_NAME,
+                 WHATSAPP_NUMBER, PRICE_VALID_UNTIL):
+        h.update(part.encode('utf-8'))
+    return h.hexdigest()[:16]
+
+def product_hash(product):
+    """hash لمدخلات صفحة المنتج (كل حقوله)"""
+    data = json.dumps(product, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+# ========== رسم الصفحة ==========
+# escaping بأقل تغيير (صالح في HTML5): "&" بتتحول بس لو بعدها حرف أو # (شكل entity)
+# و ">" و "&" قبل مسافة بيفضلوا زي ما هم - نفس شكل الصفحات الحالية
+AMBIGUOUS_AMP = re.compile(r'&(?=[#A-Za-z])')
+
+def esc(value):
+    text = AMBIGUOUS_AMP.sub('&amp;', str(value))
+    return text.replace('<', '&lt;').replace('"', '&quot;')
+
+def product_schema(product, summary):
+    """الـ Product schema - نفسه في صفحة المنتج وفي الـ ItemList"""
+    return {
+        '@type': 'Product',
+        'name': product.get('title'),
+        'description': summary,
+        'image': product.get('image_link'),
+        'sku': str(product.get('id')),
+        'brand': {
+            '@type': 'Brand',
+            'name': STORE_NAME,
+        },
+        'offers': {
+            '@type': 'Offer',
+            'price': product.get('sale_price') or product.get('price'),
+            'priceCurrency': product.get('currency') or 'AED',
+            'availability': 'https://schema.org/InStock' if product.get('availability') == 'in stock'
+                            else 'https://schema.org/OutOfStock',
+            'priceValidUntil': PRICE_VALID_UNTIL,
+            'itemCondition': 'https://schema.org/NewCondition',
+        },
+    }
+
+def product_jsonld(product, summary):
+    data = {'@context': 'https://schema.org', **product_schema(product, summary)}
+    # "</" جوه <script> ممكن يقفل الـ tag بدري
+    text = json.dumps(data, ensure_ascii=False, indent=2).replace('</', '<\\/')
+    return f'<script type="application/ld+json">\n{text}\n</script>'
+
+def price_box(product):
+    price = product.get('price')
+    sale_price = product.get('sale_price') or price
+    currency = product.get('currency') or 'AED'
+    lines = ['                    <div class="price-box">']
+    if price and sale_price < price:
+        discount = round((price - sale_price) / price * 100)
+        lines.append(f'                        <div class="original-price">{price} {currency}</div>')
+        lines.append(f'                        <div class="sale-price">{sale_price} {currency}</div>')
+        lines.append(f'                        <span class="discount-badge">-{discount}% خصم</span>')
+    else:
+        lines.append(f'                        <div class="sale-price">{sale_price} {currency}</div>')
+    lines.append('                    </div>')
+    return '\n'.join(lines) + '\n'
+
+def whatsapp_url(product):
+    sale_price = product.get('sale_price') or product.get('price')
+    currency = product.get('currency') or 'AED'
+    text = (f"مرحباً! أريد طلب المنتج التالي:\n\n📦 {product.get('title')}\n"
+            f"💰 السعر: {sale_price} {currency}\n\nالرجاء إرسال تفاصيل الطلب.")
+    # نفس encodeURIComponent في الـ JS
+    return f"https://wa.me/{WHATSAPP_NUMBER}?text={quote(text, safe=chr(39) + '-_.!~*()')}"
+
+def render_page(product, template_text, stylesheet):
+    """HTML صفحة منتج واحد"""
+    title = esc(product.get('title') or '')
+    description = product.get('description') or ''
+    summary = description.split('\n', 1)[0]
+    video_url = product.get('video_url')
+    video = Template(VIDEO_BLOCK).substitute(video_url=esc(video_url), title=title) if video_url else ''
+    page = Template(template_text).substitute(
+        title=title,
+        meta_description=esc(summary),
+        stylesheet=stylesheet,
+        jsonld=product_jsonld(product, summary),
+        image=esc(product.get('image_link') or ''),
+        video=video,
+        price_box=price_box(product),
+        whatsapp_url=whatsapp_url(product),
+        description_html='<br>'.join(esc(line) for line in description.split('\n')),
+        condition=esc(product.get('condition') or ''),
+        availability=esc(product.get('availability') or ''),
+        category=esc(product.get('category') or ''),
+        brand=esc(product.get('brand') or ''),
+    )
+    # الصفحات الأصلية محفوظة بـ BOM
+    return '﻿' + page
+
+# ========== الـ ItemList في الصفحة الرئيسية ==========
+ITEMLIST_SCRIPT = re.compile(r'[ \t]*<script type="application/ld\+json" id="itemlist">.*?</script>\n', re.S)
+
+def itemlist_jsonld(products, urls, start, stop):
+    """ItemList للمنتجات products[start:stop] - الـ position بترتيب القائمة كلها"""
+    items = []
+    for position, product in enumerate(products[start:stop], start + 1):
+        summary = (product.get('description') or '').split('\n', 1)[0]
+        url = SITE_URL + urls[str(product.get('id'))][0]
+        items.append({
+            '@type': 'ListItem',
+            'position': position,
+            'item': {**product_schema(product, summary), 'url': url},
+        })
+    data = {
+        '@context': 'https://schema.org',
+        '@type': 'ItemList',
+        'numberOfItems': len(items),
+        'itemListElement': items,
+    }
+    text = json.dumps(data, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    return f'    <script type="application/ld+json" id="itemlist">{text}</script>\n'
+
+def publish_index_schema(products, urls, shard_size, dry_run=False):
+    """كتابة الـ ItemList في index.html لمنتجات أول shard (اللي بتظهر أول ما الصفحة تفتح)
+    باقي المنتجات ليها Product schema في صفحاتها + الـ sitemap - قائمة بالكتالوج كله
+    كانت هتزود الصفحة الرئيسية ~140 KB
+    """
+    with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+        html = f.read()
+    script = itemlist_jsonld(products, urls, 0, shard_size)
+    if ITEMLIST_SCRIPT.search(html):
+        new_html = ITEMLIST_SCRIPT.sub(lambda m: script, html, count=1)
+    else:
+        new_html = html.replace('</head>', script + '</head>', 1)
+    changed = new_html != html
+    if changed and not dry_run:
+        write_if_changed(INDEX_FILE, new_html)
+    log.info(f"🧾 ItemList في {INDEX_FILE}: {min(shard_size, len(products))} منتج - "
+             f"{'اتحدث' if changed else 'من غير تغيير'}")
+    return changed
+
+# ========== الـ stylesheet المشترك ==========
+def publish_stylesheet(dry_run=False):
+    """تصغير product.css وكتابته باسم فيه hash المحتوى - يرجع المسار النسبي
+    الاسم بيتغير مع أي تعديل، فالملف ممكن يتكاش لمدة طويلة من غير ما يبقى قديم
+    """
+    with open(STYLESHEET_SOURCE, 'r', encoding='utf-8') as f:
+        css = minify_css(f.read()) + '\n'
+    digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:10]
+    filename = f"product.{digest}.css"
+    if not dry_run:
+        os.makedirs(ASSETS_DIR, exist_ok=True)
+        write_if_changed(os.path.join(ASSETS_DIR, filename), css)
+        # النسخ القديمة ما حدش بيشاور عليها بعد إعادة البناء
+        for old in glob.glob(os.path.join(ASSETS_DIR, 'product.*.css')):
+            if os.path.basename(old) != filename:
+                os.remove(old)
+    return f"{ASSETS_DIR}/{filename}", len(css.encode('utf-8'))
+
+# ========== كتابة الصفحات ==========
+def write_if_changed(path, content):
+    """كتابة الملف بس لو المحتوى مختلف - يرجع True لو اتكتب"""
+    data = content.encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+_worker_context = None
+
+def _init_worker(context):
+    global _worker_context
+    _worker_context = context
+
+def _render_job(job):
+    """شغل الـ worker: رسم صفحة وكتابتها
+    يرجع (id, اتكتبت؟, الحجم القديم, الحجم قبل التصغير, الحجم النهائي)
+    """
+    product, path, dry_run = job
+    raw = render_page(product, _worker_context['template'], _worker_context['stylesheet'])
+    content = minify_html(raw) if _worker_context['minify'] else raw
+    data = content.encode('utf-8')
+    try:
+        old_size = os.path.getsize(path)
+    except OSError:
+        old_size = 0
+    if dry_run:
+        try:
+            with open(path, 'rb') as f:
+                changed = f.read() != data
+        except OSError:
+            changed = True
+    else:
+        changed = write_if_changed(path, content)
+    return str(product.get('id')), changed, old_size, len(raw.encode('utf-8')), len(data)
+
+def render_all(jobs, context, workers=None):
+    """رسم كل الصفحات - بالتوازي لو العدد كبير"""
+    if len(jobs) >= POOL_THRESHOLD and (workers or os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(context,)) as pool:
+            return list(pool.map(_render_job, jobs, chunksize=CHUNK_SIZE))
+    _init_worker(context)
+    return [_render_job(job) for job in jobs]
+
+def report_sizes(results, stylesheet_size):
+    """تقرير الحجم: الصفحات قبل البناء، قبل التصغير، وبعده"""
+    if not results:
+        return
+    old = sum(r[2] for r in results)
+    raw = sum(r[3] for r in results)
+    final = sum(r[4] for r in results)
+    log.info(f"📉 حجم {len(results)} صفحة: {old // 1024} KB -> {final // 1024} KB "
+             f"({(old - final) * 100 // max(old, 1)}% أقل)")
+    log.info(f"   ✂️ التصغير وفّر {(raw - final) // 1024} KB، و الـ CSS المشترك {stylesheet_size // 1024} KB "
+             f"بيتحمل مرة واحدة بدل ما يتكرر في كل صفحة")
+    metrics.incr('pages_bytes_before', old)
+    metrics.incr('pages_bytes_after', final)
+
+# ========== الـ manifest ==========
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'template': None, 'pages': {}}
+
+def save_manifest(manifest):
+    tmp_path = MANIFEST_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, MANIFEST_FILE)
+
+# ========== البناء ==========
+def build(full=False, dry_run=False, workers=None, minify=True, shard_size=DEFAULT_SHARD_SIZE,
+          sitemap_max_urls=MAX_URLS):
+    """تحديث products/*.html - يرجع عدد الصفحات المكتوبة والمحذوفة"""
+    with metrics.phase('products_load'):
+        products = load_products()
+    if not products:
+        return None
+    urls, problems = build_url_index(products)
+    for problem in problems:
+        log.error(f"❌ {problem}")
+    if problems:
+        return None
+    template_text = load_template()
+    stylesheet, stylesheet_size = publish_stylesheet(dry_run)
+    key = template_key(template_text, stylesheet, minify)
+    manifest = load_manifest()
+    if manifest['template'] != key:
+        if manifest['template'] is not None:
+            log.info("🧱 القالب اتغير - إعادة بناء كل الصفحات")
+        full = True
+
+    old_pages = manifest['pages']
+    new_pages = {}
+    jobs = []
+    for product in products:
+        product_id = str(product.get('id'))
+        filename = os.path.basename(urls[product_id][0])
+        digest = product_hash(product)
+        new_pages[product_id] = [filename, digest]
+        path = os.path.join(PRODUCTS_DIR, filename)
+        if full or old_pages.get(product_id) != [filename, digest] or not os.path.exists(path):
+            jobs.append((product, path, dry_run))
+
+    # صفحات منتجات اتحذفت أو اتغير اسم ملفها
+    live_files = {filename for filename, _ in new_pages.values()}
+    stale = sorted({filename for filename, _ in old_pages.values()} - live_files)
+
+    log.info(f"🧮 {len(products)} منتج - {len(jobs)} صفحة محتاجة رسم، {len(stale)} صفحة قديمة")
+    with metrics.phase('render'):
+        context = {'template': template_text, 'stylesheet': stylesheet, 'minify': minify}
+        results = render_all(jobs, context, workers)
+    written = [result[0] for result in results if result[1]]
+    for product_id in written:
+        log.debug(f"📝 {new_pages[product_id][0]}")
+
+    if not dry_run:
+        for filename in stale:
+            path = os.path.join(PRODUCTS_DIR, filename)
+            if os.path.exists(path):
+                os.remove(path)
+                log.info(f"🗑️ حذف {filename}")
+        save_manifest({'version': MANIFEST_VERSION, 'template': key, 'pages': new_pages})
+
+    # صفحات في products/ مش تبع أي منتج (ما بنحذفهاش لوحدنا)
+    orphans = sorted(set(os.listdir(PRODUCTS_DIR)) - live_files - set(stale))
+    for filename in orphans:
+        log.warning(f"⚠️ صفحة مالهاش منتج في {PRODUCTS_FILE}: {filename}")
+
+    # كل رابط في data/urls.json لازم يشاور على صفحة موجودة
+    missing = [] if dry_run else [path for path, _ in urls.values() if not os.path.exists(path)]
+    for path in missing:
+        log.error(f"❌ الرابط في {URLS_FILE} مالوش صفحة: {path}")
+    if missing:
+        return None
+    changed = write_url_index(urls, dry_run)
+    log.info(f"🔗 {URLS_FILE}: {len(urls)} رابط - {'اتحدث' if changed else 'من غير تغيير'}")
+
+    report_sizes(results, stylesheet_size)
+    with metrics.phase('listing'):
+        build_listing(products, urls, shard_size, dry_run)
+        publish_index_schema(products, urls, shard_size, dry_run)
+    with metrics.phase('search_index'):
+        build_search_index(products, dry_run=dry_run)
+    with metrics.phase('sitemap'):
+        build_sitemap(products, new_pages, urls, max_urls=sitemap_max_urls, dry_run=dry_run)
+    with metrics.phase('feeds'):
+        export_feeds(products, dry_run=dry_run)
+    verb = "هتتكتب" if dry_run else "اتكتبت"
+    log.info(f"✅ {len(written)} صفحة {verb} ({len(jobs) - len(written)} من غير تغيير)، {len(stale)} اتحذفت")
+    return {'written': len(written), 'deleted': len(stale), 'rendered': len(jobs)}
+
+def main():
+    parser = argparse.ArgumentParser(description='Build product pages from products.json')
+    parser.add_argument('--full', action='store_true', help='إعادة بناء كل الصفحات')
+    parser.add_argument('--dry-run', action='store_true', help='عرض عدد الصفحات المتغيرة من غير كتابة')
+    parser.add_argument('--no-minify', action='store_true', help='كتابة الصفحات من غير تصغير')
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE,
+                        help='عدد المنتجات في كل shard من ملفات القائمة')
+    parser.add_argument('--sitemap-max-urls', type=int, default=MAX_URLS,
+                        help='أقصى عدد روابط في ملف sitemap واحد قبل التقسيم لـ sitemapindex')
+    parser.add_argument('--workers', type=int, default=None, help='عدد الـ processes (افتراضياً عدد الأنوية)')
+    args = parser.parse_args()
+
+    metrics.setup_logging()
+    metrics.set_info(script='build_site')
+    result = build(full=args.full, dry_run=args.dry_run, workers=args.workers,
+                   minify=not args.no_minify, shard_size=args.shard_size,
+                   sitemap_max_urls=args.sitemap_max_urls)
+    metrics.emit()
+    if result is None:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+نواة الكتالوج المشتركة بين السكربتات: قراءة products.json و sitemap.xml و data/urls.json
+(الكتالوج المضغوط لسكربتات النشر في product_store.py)
+
+data/urls.json (بيتولد من build_site.py) هو المصدر الوحيد لروابط المنتجات:
+    {"version", "total", "urls": {id: ["products/<اسم الملف>", "<الرابط الكامل encoded>"]}}
+"""
+
+import codecs
+import logging
+import json
+import os
+import re
+import hashlib
+import xml.etree.ElementTree as ET
+from urllib.parse import quote
+
+log = logging.getLogger(__name__)
+
+PRODUCTS_FILE = 'products.json'
+SITEMAP_FILE = 'sitemap.xml'
+SITE_URL = 'https://sherow1982.github.io/matjar-makhzoon-alemarat/'
+URLS_FILE = os.path.join('data', 'urls.json')
+URLS_VERSION = 1
+
+# ========== تحميل المنتجات ==========
+def load_products():
+    """تحميل المنتجات من products.json"""
+    try:
+        with open(PRODUCTS_FILE, 'r', encoding='utf-8') as f:
+            products = json.load(f)
+        log.info(f"✅ تم تحميل {len(products)} منتج")
+        return products
+    except Exception as e:
+        log.error(f"❌ خطأ في تحميل المنتجات: {e}")
+        return []
+
+STREAM_CHUNK = 1 << 20
+_decoder = json.JSONDecoder()
+
+def iter_products(path=None):
+    """المنتجات من products.json واحد واحد من غير ما الملف كله يتحمل في الذاكرة
+    (قراءة على دفعات + raw_decode لكل عنصر في الـ array)
+    """
+    for product, _, _ in iter_product_spans(path):
+        yield product
+
+def iter_product_spans(path=None):
+    """زي iter_products بس مع مكان كل منتج في الملف: (product, offset, length) بالـ bytes
+    (لفهرس product_store.py - أي منتج يتقري تاني بـ json.loads(data[offset:offset + length]))
+    """
+    path = path or PRODUCTS_FILE
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    with open(path, 'rb') as f:
+        raw = f.read(STREAM_CHUNK)
+        eof = not raw
+        # الـ BOM (لو موجود) بيتحسب في الـ offset
+        position = len(codecs.BOM_UTF8) if raw.startswith(codecs.BOM_UTF8) else 0
+        buffer = decoder.decode(raw[position:], eof)
+        stripped = buffer.lstrip()
+        if not stripped.startswith('['):
+            raise ValueError(f"{path}: متوقع JSON array")
+        pos = len(buffer) - len(stripped) + 1
+        position += pos
+        while True:
+            # المسافات والفواصل بين العناصر (ASCII - كل حرف byte واحد)
+            skip_from = pos
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            position += pos - skip_from
+            if pos < len(buffer) and buffer[pos] == ']':
+                return
+            try:
+                if pos >= len(buffer):
+                    raise ValueError(f"{path}: الملف انتهى قبل ]")
+                item, end = _decoder.raw_decode(buffer, pos)
+            except ValueError:
+                # العنصر مقطوع في آخر الدفعة - نقرا الدفعة اللي بعدها
+                if eof:
+                    raise
+                raw = f.read(STREAM_CHUNK)
+                eof = not raw
+                buffer = buffer[pos:] + decoder.decode(raw, eof)
+                pos = 0
+                continue
+            text = buffer[pos:end]
+            # الطول بالـ bytes - ASCII بس لو الطول هو هو من غير encode
+            length = len(text) if text.isascii() else len(text.encode('utf-8'))
+            yield item, position, length
+            position += length
+            pos = end
+
+# ========== قراءة sitemap.xml بالـ streaming ==========
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+
+def iter_sitemap_entries(path):
+    """قراءة sitemap عنصر بعنصر بـ iterparse ومسح كل عنصر بعد قراءته
+    يرجع (kind, loc) حيث kind = 'url' لصفحة أو 'sitemap' لملف فرعي في sitemapindex
+    الذاكرة ثابتة مهما كبر حجم الملف
+    """
+    root = None
+    for event, elem in ET.iterparse(path, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+        tag = elem.tag
+        if tag == SITEMAP_NS + 'url' or tag == SITEMAP_NS + 'sitemap':
+            loc = elem.findtext(SITEMAP_NS + 'loc')
+            if loc:
+                yield tag[len(SITEMAP_NS):], loc.strip()
+            # مسح العنصر ومسح مرجعه من الجذر عشان ما تتراكم العناصر الفاضية
+            elem.clear()
+            root.clear()
+
+def local_sitemap_path(loc, base_dir):
+    """تحويل رابط sitemap فرعي لمسار الملف المحلي جنب الـ sitemap الأصلي"""
+    return os.path.join(base_dir, loc.rstrip('/').rsplit('/', 1)[-1])
+
+def iter_product_urls(path=None, visited=None):
+    """روابط المنتجات من sitemap.xml مع تتبع ملفات sitemapindex الفرعية
+    visited (اختياري) بيتجمع فيه كل ملف sitemap اتقرأ
+    """
+    path = path or SITEMAP_FILE
+    if visited is None:
+        visited = []
+    if path in visited:
+        return
+    visited.append(path)
+    base_dir = os.path.dirname(path)
+    for kind, loc in iter_sitemap_entries(path):
+        if kind == 'sitemap':
+            child = local_sitemap_path(loc, base_dir)
+            if os.path.exists(child):
+                yield from iter_product_urls(child, visited)
+            else:
+                log.warning(f"⚠️ sitemap فرعي غير موجود محلياً: {loc}")
+        # فقط روابط المنتجات (اللي فيها /products/)
+        elif '/products/' in loc and loc.endswith('.html'):
+            yield loc
+
+# ========== اسم ملف صفحة المنتج ==========
+# نفس قاعدة getProductFileName() القديمة في index.html (الصفحات المنشورة بالأسماء دي)
+# الحروف العربية + \w (ASCII) + المسافات والشرطات بس
+SLUG_STRIP = re.compile(r'[^؀-ۿA-Za-z0-9_\s-]')
+SLUG_SPACES = re.compile(r'\s+')
+SLUG_DASHES = re.compile(r'--+')
+
+def product_file_name(product):
+    """اسم ملف صفحة المنتج تحت products/
+    مثال: {'title': 'جهاز مساج', 'id': '1'} -> جهاز-مساج-1.html
+    """
+    slug = SLUG_STRIP.sub('', product.get('title') or '')
+    slug = SLUG_SPACES.sub('-', slug).lower()
+    slug = SLUG_DASHES.sub('-', slug)
+    return f"{slug}-{product.get('id')}.html"
+
+# ========== فهرس الروابط (id -> path, url) ==========
+def product_url(path):
+    """الرابط الكامل لصفحة المنتج - اسم الملف بـ URL encoding
+    مثال: products/عرض-437.html -> .../products/%D8%B9%D8%B1%D8%B6-437.html
+    """
+    # safe='/-.' عشان ما يحولش الـ / والشرطات والامتداد
+    return SITE_URL + quote(path, safe='/-.')
+
+def build_url_index(products):
+    """id -> [path, url] لكل المنتجات - يرجع (index, problems)
+    problems: أي تعارض لازم يوقف البناء (id متكرر، اسم ملف متكرر، id مش في آخر اسم الملف)
+    """
+    index = {}
+    owners = {}
+    problems = []
+    for product in products:
+        product_id = str(product.get('id'))
+        path = f"products/{product_file_name(product)}"
+        if product_id in index:
+            problems.append(f"id متكرر: {product_id}")
+            continue
+        if path in owners:
+            problems.append(f"نفس الصفحة {path} للمنتجين {owners[path]} و {product_id}")
+            continue
+        # روابط قديمة (أو منشورة) بتطلع الـ id من آخر اسم الملف
+        if not product_id.isdigit() or not path.endswith(f"-{product_id}.html"):
+            problems.append(f"الـ id {product_id} مش رقم في آخر اسم الملف: {path}")
+        owners[path] = product_id
+        index[product_id] = [path, product_url(path)]
+    return index, problems
+
+def write_url_index(index, dry_run=False):
+    """كتابة data/urls.json لو اتغير - يرجع True لو اتكتب (أو هيتكتب)"""
+    text = json.dumps({'version': URLS_VERSION, 'total': len(index), 'urls': index},
+                      ensure_ascii=False, separators=(',', ':')) + '\n'
+    try:
+        with open(URLS_FILE, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    if not dry_run:
+        os.makedirs(os.path.dirname(URLS_FILE), exist_ok=True)
+        tmp_path = URLS_FILE + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, URLS_FILE)
+    return True
+
+def load_url_index():
+    """id -> [path, url] من data/urls.json"""
+    try:
+        with open(URLS_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == URLS_VERSION:
+            return data['urls']
+        log.error(f"❌ {URLS_FILE} نسخة قديمة - شغّل build_site.py")
+    except (OSError, ValueError) as e:
+        log.error(f"❌ خطأ في تحميل {URLS_FILE}: {e}")
+    return {}
+
+# ========== بصمة الملفات ==========
+def file_fingerprint(path):
+    """حجم ووقت تعديل الملف - فحص سريع قبل حساب الـ hash"""
+    st = os.stat(path)
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+def file_sha256(path):
+    """حساب sha256 لمحتوى الملف"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قنوات Meta: Facebook (صورة على /photos أو نص على /feed) و Instagram (container ثم media_publish)
+شوف channels.py
+"""
+
+import logging
+import os
+from io import BytesIO
+
+import http_client
+import metrics
+from channels import register
+from images import prepare_image
+from outbox import STEP_TTL
+from publisher import poll_until
+
+log = logging.getLogger(__name__)
+
+# أقصى وقت لانتظار معالجة صورة Instagram (ثانية)
+CONTAINER_TIMEOUT = 60
+
+# ========== النشر على Facebook ==========
+@register('facebook', requires=('FACEBOOK_PAGE_ID', 'FACEBOOK_ACCESS_TOKEN'))
+def post_to_facebook(content, job):
+    """النشر على Facebook مع الصورة - يرجع ID المنشور أو None"""
+    try:
+        page_id = os.getenv('FACEBOOK_PAGE_ID')
+        access_token = os.getenv('FACEBOOK_ACCESS_TOKEN')
+        
+        if not page_id or not access_token:
+            log.warning("⚠️ Facebook credentials missing")
+            return None
+        
+        # تحميل الصورة (من الكاش لو اتحملت قبل كده)
+        image = None
+        if content['image_url']:
+            image = prepare_image(content['image_url'], 'facebook')
+        
+        if image:
+            # نشر مع صورة
+            url = f"https://graph.facebook.com/v18.0/{page_id}/photos"
+            image_data, filename, mime = image
+            
+            files = {
+                'source': (filename, BytesIO(image_data), mime)
+            }
+            
+            data = {
+                'message': content['text'],
+                'access_token': access_token
+            }
+            
+            with metrics.phase('publish'):
+                response = http_client.post(url, files=files, data=data, timeout=30)
+            
+        else:
+            # نشر نص فقط
+            url = f"https://graph.facebook.com/v18.0/{page_id}/feed"
+            
+            data = {
+                'message': content['text'],
+                'access_token': access_token
+            }
+            
+            with metrics.phase('publish'):
+                response = http_client.post(url, data=data, timeout=30)
+        
+        if response.status_code == 200:
+            result = response.json()
+            post_id = str(result.get('id', 'N/A'))
+            job.complete(post_id)
+            log.info(f"✅ تم النشر على Facebook: {post_id}")
+            return post_id
+        else:
+            log.error(f"❌ فشل Facebook: {response.status_code}")
+            log.info(f"Response: {response.text}")
+            return None
+            
+    except Exception as e:
+        log.exception(f"❌ خطأ Facebook: {e}")
+        return None
+
+# ========== حالة Instagram container ==========
+def container_status(container_id, access_token):
+    """حالة الـ container: True جاهز، False فشل، None لسه بيتجهز"""
+    try:
+        response = http_client.get(
+            f"https://graph.facebook.com/v18.0/{container_id}",
+            params={'fields': 'status_code', 'access_token': access_token},
+            timeout=10
+        )
+        if response.status_code != 200:
+            log.warning(f"⚠️ فشل سؤال حالة container: {response.status_code}")
+            return None
+        status = response.json().get('status_code')
+    except Exception as e:
+        log.warning(f"⚠️ خطأ سؤال حالة container: {e}")
+        return None
+    if status == 'FINISHED':
+        return True
+    if status in ('ERROR', 'EXPIRED'):
+        log.error(f"❌ container {container_id} حالته {status}")
+        return False
+    return None
+
+def wait_for_container(container_id, access_token, timeout=CONTAINER_TIMEOUT):
+    """انتظار جاهزية الـ container بـ backoff أسي (1s, 2s, 4s ...)"""
+    with metrics.phase('container_wait'):
+        ready = poll_until(lambda: container_status(container_id, access_token), timeout=timeout)
+    if not ready:
+        log.error(f"❌ الـ container {container_id} ما جهزش خلال {timeout}s")
+    return ready
+
+# ========== النشر على Instagram ==========
+@register('instagram', requires=('INSTAGRAM_ACCOUNT_ID', 'INSTAGRAM_ACCESS_TOKEN'))
+def post_to_instagram(content, job):
+    """النشر على Instagram مع الصورة - يرجع ID المنشور أو None
+    الـ container بيتحفظ في الـ outbox عشان إعادة المحاولة تنشره على طول
+    """
+    try:
+        account_id = os.getenv('INSTAGRAM_ACCOUNT_ID')
+        access_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
+        
+        if not account_id or not access_token:
+            log.warning("⚠️ Instagram credentials missing")
+            return None
+        
+        if not content['image_url']:
+            log.warning("⚠️ Instagram يحتاج صورة")
+            return None
+        
+        # خطوة 1: إنشاء container (أو استخدام container من محاولة سابقة)
+        container_id = job.step('container_id', max_age=STEP_TTL)
+        if container_id:
+            log.info(f"♻️ استخدام container سابق: {container_id}")
+        else:
+            create_url = f"https://graph.facebook.com/v18.0/{account_id}/media"
+            
+            create_data = {
+                'image_url': content['image_url'],
+                'caption': content['text'],
+                'access_token': access_token
+            }
+            
+            with metrics.phase('upload'):
+                create_response = http_client.post(create_url, data=create_data, timeout=30)
+            
+            if create_response.status_code != 200:
+                log.error(f"❌ فشل إنشاء container: {create_response.status_code}")
+                log.info(f"Response: {create_response.text}")
+                return None
+            
+            container_id = create_response.json().get('id')
+            job.checkpoint('container_id', container_id)
+            log.info(f"✅ تم إنشاء container: {container_id}")
+        
+        # انتظار معالجة الصورة: سؤال عن حالة الـ container بدل sleep ثابت
+        log.info("⏳ انتظار معالجة الصورة...")
+        if not wait_for_container(container_id, access_token):
+            # container فاشل - المحاولة الجاية تعمل واحد جديد
+            job.checkpoint('container_id', None)
+            return None
+        
+        # خطوة 2: نشر container
+        publish_url = f"https://graph.facebook.com/v18.0/{account_id}/media_publish"
+        
+        publish_data = {
+            'creation_id': container_id,
+            'access_token': access_token
+        }
+        
+        with metrics.phase('publish'):
+            publish_response = http_client.post(publish_url, data=publish_data, timeout=30)
+        
+        if publish_response.status_code == 200:
+            result = publish_response.json()
+            post_id = str(result.get('id', 'N/A'))
+            job.complete(post_id)
+            log.info(f"✅ تم النشر على Instagram: {post_id}")
+            return post_id
+        else:
+            log.error(f"❌ فشل Instagram: {publish_response.status_code}")
+            log.info(f"Response: {publish_response.text}")
+            return None
+            
+    except Exception as e:
+        log.exception(f"❌ خطأ Instagram: {e}")
+        return None
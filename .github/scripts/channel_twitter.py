@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قناة Twitter/X: رفع الصورة (API v1.1) ثم التغريدة (API v2) - شوف channels.py
+"""
+
+import logging
+import os
+from io import BytesIO
+
+import http_client
+import metrics
+from channels import register
+from images import prepare_image
+from outbox import STEP_TTL
+
+log = logging.getLogger(__name__)
+
+TWITTER_KEYS = ('TWITTER_API_KEY', 'TWITTER_API_SECRET', 'TWITTER_ACCESS_TOKEN', 'TWITTER_ACCESS_SECRET')
+
+# ========== النشر على Twitter ==========
+@register('twitter', requires=TWITTER_KEYS)
+def post_to_twitter(content, job):
+    """النشر على Twitter/X مع الصورة - يرجع ID التغريدة أو None
+    media_id بيتحفظ في الـ outbox عشان إعادة المحاولة ما ترفعش الصورة تاني
+    """
+    try:
+        import tweepy
+        
+        api_key = os.getenv('TWITTER_API_KEY')
+        api_secret = os.getenv('TWITTER_API_SECRET')
+        access_token = os.getenv('TWITTER_ACCESS_TOKEN')
+        access_secret = os.getenv('TWITTER_ACCESS_SECRET')
+        
+        if not all([api_key, api_secret, access_token, access_secret]):
+            log.warning("⚠️ Twitter API keys missing")
+            return None
+        
+        # مصادقة API v1.1 لرفع الصور
+        auth = tweepy.OAuth1UserHandler(
+            api_key, api_secret,
+            access_token, access_secret
+        )
+        api_v1 = tweepy.API(auth)
+        
+        # API v2 للتغريدات
+        client = tweepy.Client(
+            consumer_key=api_key,
+            consumer_secret=api_secret,
+            access_token=access_token,
+            access_token_secret=access_secret
+        )
+        
+        # نفس الـ connection pool والـ retry والـ rate limit على sessions بتاعة tweepy
+        http_client.install(api_v1.session)
+        http_client.install(client.session)
+        
+        # الصورة اترفعت في محاولة سابقة؟
+        media_id = job.step('media_id', max_age=STEP_TTL)
+        if media_id:
+            log.info(f"♻️ استخدام الصورة المرفوعة قبل كده: {media_id}")
+        
+        # رفع الصورة إذا موجودة
+        elif content['image_url']:
+            # من كاش الصور - متحولة لـ JPEG في حدود Twitter
+            image = prepare_image(content['image_url'], 'twitter')
+            if image:
+                image_data, filename, _ = image
+                with metrics.phase('upload'):
+                    media = api_v1.media_upload(filename=filename, file=BytesIO(image_data))
+                media_id = media.media_id
+                job.checkpoint('media_id', media_id)
+                log.info(f"✅ تم رفع الصورة على Twitter")
+        
+        # نشر التغريدة
+        with metrics.phase('publish'):
+            if media_id:
+                response = client.create_tweet(text=content['text'], media_ids=[media_id])
+            else:
+                response = client.create_tweet(text=content['text'])
+        
+        tweet_id = str(response.data['id'])
+        job.complete(tweet_id)
+        log.info(f"✅ تم النشر على Twitter: {tweet_id}")
+        return tweet_id
+        
+    except Exception as e:
+        log.exception(f"❌ خطأ Twitter: {e}")
+        return None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+واجهة قنوات النشر (plugins)
+كل قناة ملف channel_<الاسم>.py في نفس المجلد بيسجل دالة النشر بتاعته بـ @register:
+
+    @register('twitter', requires=('TWITTER_API_KEY', ...))
+    def post_to_twitter(content, job):
+        ...   # يرجع ID المنشور أو None
+
+- content: نفس المحتوى لكل القنوات (create_post_content)
+- job: PostJob من الـ outbox (خطوات محفوظة لإعادة المحاولة + complete(remote_id))
+- requires: متغيرات البيئة اللازمة - القناة اللي ناقصها مفاتيح ما بتشتغلش (بدل ما تفشل وتأجل المنتج)
+
+قناة جديدة = ملف channel_*.py جديد، والـ runner بيحمله لوحده (load_plugins)
+"""
+
+import glob
+import importlib
+import logging
+import os
+import random
+
+log = logging.getLogger(__name__)
+
+PLUGINS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# اسم القناة -> {'post': دالة النشر, 'requires': متغيرات البيئة}
+CHANNELS = {}
+
+# ========== التسجيل ==========
+def register(name, requires=()):
+    """تسجيل دالة نشر كقناة باسم name"""
+    def decorator(post_fn):
+        CHANNELS[name] = {'post': post_fn, 'requires': tuple(requires)}
+        return post_fn
+    return decorator
+
+def load_plugins(directory=PLUGINS_DIR):
+    """تحميل كل ملفات channel_*.py - يرجع CHANNELS"""
+    for path in sorted(glob.glob(os.path.join(directory, 'channel_*.py'))):
+        importlib.import_module(os.path.splitext(os.path.basename(path))[0])
+    return CHANNELS
+
+def missing_credentials(name):
+    """متغيرات البيئة الناقصة للقناة"""
+    return [var for var in CHANNELS[name]['requires'] if not os.getenv(var)]
+
+# ========== المحتوى ==========
+def create_post_content(product, product_url):
+    """محتوى المنشور (نفسه لكل القنوات) - الرابط المحول من data/urls.json"""
+    title = product.get('title', 'منتج جديد')
+    price = product.get('price', 'N/A')
+    image_url = product.get('image_link', '')
+
+    emojis = ['✨', '🔥', '🛒', '🛍️', '🎁', '⭐', '💥', '👑']
+    emoji = random.choice(emojis)
+
+    post_text = f"""{emoji} {title}
+
+💰 السعر: {price} درهم
+🚚 شحن مجاني لجميع الإمارات
+📞 للطلب: +20 111 076 0081
+
+👉 {product_url}
+
+#متجر_مخزون_الإمارات #تسوق_الامارات #دبي #الشارقة #عروض"""
+
+    return {
+        'text': post_text,
+        'url': product_url,
+        'image_url': image_url,
+        'title': title
+    }
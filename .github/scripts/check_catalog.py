@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+فحص اتساق الكتالوج: products.json مقابل صفحات products/ و sitemap.xml و data/urls.json
+كل مصدر بيتقري مرة واحدة في dict/set - الفحص كله O(n)
+
+المشاكل اللي بتطلع في التقرير (كل واحدة قائمة في issues):
+- bad_id            id مش رقم
+- duplicate_id      نفس الـ id لأكتر من منتج
+- duplicate_page    منتجين ليهم نفس اسم الصفحة
+- missing_title     منتج من غير عنوان
+- bad_image         image_link فاضي أو مش http(s)
+- missing_page      منتج مالوش صفحة في products/
+- orphan_page       صفحة في products/ مالهاش منتج
+- page_slug         صفحة بنفس الـ id بس باسم غير المتوقع (العنوان اتغير ومااتبنتش)
+- missing_loc       منتج مالوش <loc> في sitemap.xml
+- orphan_loc        <loc> لمنتج مش موجود
+- duplicate_loc     نفس الرابط مكرر في الـ sitemap
+- loc_slug          <loc> بنفس الـ id بس باسم ملف غير المتوقع
+- url_index         data/urls.json مختلف عن المتوقع (ناقص أو مسار مختلف)
+
+الاستخدام:
+    python .github/scripts/check_catalog.py                    # ملخص + .cache/catalog-report.json
+    python .github/scripts/check_catalog.py --report - --strict  # JSON على stdout وexit 1 لو فيه مشاكل
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from urllib.parse import unquote
+
+import metrics
+from catalog import (PRODUCTS_FILE, SITEMAP_FILE, URLS_FILE, iter_product_urls, load_products,
+                     load_url_index, product_file_name)
+
+log = logging.getLogger(__name__)
+
+PAGES_DIR = 'products'
+REPORT_FILE = os.path.join('.cache', 'catalog-report.json')
+ISSUE_KINDS = (
+    'bad_id', 'duplicate_id', 'duplicate_page', 'missing_title', 'bad_image',
+    'missing_page', 'orphan_page', 'page_slug',
+    'missing_loc', 'orphan_loc', 'duplicate_loc', 'loc_slug',
+    'url_index',
+)
+
+# ========== أدوات ==========
+def page_id(filename):
+    """الـ id من آخر اسم الصفحة: جهاز-مساج-12.html -> '12' (أو None)"""
+    if not filename.endswith('.html'):
+        return None
+    product_id = filename[:-5].rsplit('-', 1)[-1]
+    return product_id if product_id.isdigit() else None
+
+def loc_file(loc):
+    """اسم الملف من <loc> (decoded) - None لو مش صفحة منتج"""
+    if '/products/' not in loc:
+        return None
+    filename = loc.rsplit('/products/', 1)[1]
+    # روابط sitemap.xml مكتوبة بالحروف العربية - unquote بس لو فيه %
+    return unquote(filename) if '%' in filename else filename
+
+# ========== الفحص ==========
+def check_catalog(products, page_files, sitemap_locs, url_index=None):
+    """تقاطع المصادر الأربعة في pass واحد لكل مصدر - يرجع التقرير (dict)
+    page_files: أسماء الملفات في products/، sitemap_locs: روابط المنتجات في الـ sitemap (أي iterable)
+    url_index: محتوى data/urls.json (id -> [path, url]) أو None لو مش عايزين نفحصه
+    """
+    issues = {kind: [] for kind in ISSUE_KINDS}
+
+    # 1. المنتجات: id -> اسم الصفحة المتوقع
+    expected = {}
+    owners = {}
+    for product in products:
+        product_id = str(product.get('id'))
+        filename = product_file_name(product)
+        if not product_id.isdigit():
+            issues['bad_id'].append({'id': product_id})
+        if product_id in expected:
+            issues['duplicate_id'].append({'id': product_id})
+            continue
+        if filename in owners:
+            issues['duplicate_page'].append({'id': product_id, 'other': owners[filename], 'page': filename})
+        owners[filename] = product_id
+        expected[product_id] = filename
+        if not product.get('title'):
+            issues['missing_title'].append({'id': product_id})
+        image = product.get('image_link') or ''
+        if not image.startswith(('https://', 'http://')):
+            issues['bad_image'].append({'id': product_id, 'image_link': image})
+
+    # 2. الصفحات
+    pages_by_id = {}
+    for filename in page_files:
+        if filename in owners:
+            pages_by_id[owners[filename]] = filename
+            continue
+        product_id = page_id(filename)
+        if product_id in expected:
+            issues['page_slug'].append({'id': product_id, 'page': filename, 'expected': expected[product_id]})
+            pages_by_id.setdefault(product_id, filename)
+        else:
+            issues['orphan_page'].append({'page': filename})
+    for product_id, filename in expected.items():
+        if product_id not in pages_by_id:
+            issues['missing_page'].append({'id': product_id, 'expected': filename})
+
+    # 3. الـ sitemap
+    seen_locs = set()
+    locs_by_id = set()
+    for loc in sitemap_locs:
+        if loc in seen_locs:
+            issues['duplicate_loc'].append({'loc': loc})
+            continue
+        seen_locs.add(loc)
+        filename = loc_file(loc)
+        if filename is None:
+            continue
+        if filename in owners:
+            locs_by_id.add(owners[filename])
+            continue
+        product_id = page_id(filename)
+        if product_id in expected:
+            issues['loc_slug'].append({'id': product_id, 'loc': loc, 'expected': expected[product_id]})
+            locs_by_id.add(product_id)
+        else:
+            issues['orphan_loc'].append({'loc': loc})
+    for product_id in expected:
+        if product_id not in locs_by_id:
+            issues['missing_loc'].append({'id': product_id})
+
+    # 4. data/urls.json
+    if url_index is not None:
+        for product_id, filename in expected.items():
+            entry = url_index.get(product_id)
+            if not entry or entry[0] != f"{PAGES_DIR}/{filename}":
+                issues['url_index'].append({'id': product_id, 'found': entry[0] if entry else None,
+                                            'expected': f"{PAGES_DIR}/{filename}"})
+        for product_id in url_index.keys() - expected.keys():
+            issues['url_index'].append({'id': product_id, 'found': url_index[product_id][0], 'expected': None})
+
+    counts = {kind: len(found) for kind, found in issues.items()}
+    return {
+        'ok': not any(counts.values()),
+        'products': len(expected),
+        'counts': counts,
+        'issues': {kind: found for kind, found in issues.items() if found},
+    }
+
+# ========== التشغيل ==========
+def load_sources():
+    """(products, page_files, sitemap_locs, url_index) من ملفات المستودع"""
+    with metrics.phase('products_load'):
+        products = load_products()
+    page_files = os.listdir(PAGES_DIR) if os.path.isdir(PAGES_DIR) else []
+    # الـ sitemap بيتقري streaming جوه الفحص نفسه
+    sitemap_locs = iter_product_urls(SITEMAP_FILE) if os.path.exists(SITEMAP_FILE) else []
+    url_index = load_url_index() if os.path.exists(URLS_FILE) else None
+    return products, page_files, sitemap_locs, url_index
+
+def main():
+    parser = argparse.ArgumentParser(description='Cross-check products.json, product pages and sitemap.xml')
+    parser.add_argument('--report', default=REPORT_FILE, help='مسار تقرير JSON (- للـ stdout)')
+    parser.add_argument('--strict', action='store_true', help='exit 1 لو فيه أي مشكلة')
+    args = parser.parse_args()
+
+    metrics.setup_logging()
+    metrics.set_info(script='check_catalog')
+    products, page_files, sitemap_locs, url_index = load_sources()
+    if not products:
+        sys.exit(1)
+    with metrics.phase('check'):
+        report = check_catalog(products, page_files, sitemap_locs, url_index)
+
+    text = json.dumps(report, ensure_ascii=False, indent=1)
+    if args.report == '-':
+        print(text)
+    else:
+        os.makedirs(os.path.dirname(args.report) or '.', exist_ok=True)
+        with open(args.report, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+
+    if report['ok']:
+        log.info(f"✅ الكتالوج متسق: {report['products']} منتج في {PRODUCTS_FILE} والصفحات والـ sitemap")
+    else:
+        for kind, count in report['counts'].items():
+            if count:
+                log.warning(f"⚠️ {kind}: {count}")
+        log.warning(f"📄 التفاصيل في {args.report}")
+    metrics.emit()
+    if args.strict and not report['ok']:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
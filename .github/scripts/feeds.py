@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تصدير feeds المنتجات لـ Google Merchant و Meta (Facebook/Instagram) catalog
+- google-merchant-feed.xml   RSS 2.0 بـ g: (نفس الملف اللي Merchant Center بيقراه)
+- feeds/google.tsv           نفس الحقول كـ TSV
+- feeds/meta.csv             Meta catalog CSV
+- feeds/*-delta.*            المنتجات اللي اتغيرت أو اتضافت بس من آخر تصدير
+  (hash لكل منتج في .github/feeds-state.json) + tombstone لكل منتج اتشال من products.json:
+  صف فيه الـ id بس و availability = out of stock و quantity 0 (feeds التحديث في Google و Meta
+  ما بتمسحش منتجات - ده اللي بيوقف عرضه). الـ tombstone بيطلع في أول delta بعد الحذف بس
+
+الكتابة streaming: المنتجات بتتقري من products.json واحد واحد (catalog.iter_products)
+وكل منتج بيتكتب في كل الملفات وبعدين يتنسي - الذاكرة ما بتكبرش مع الكتالوج
+(غير الـ state: hash من 16 حرف لكل منتج)
+
+الاستخدام:
+    python .github/scripts/feeds.py
+    python .github/scripts/feeds.py --dry-run   # عدد المتغير بس
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import logging
+import os
+import sys
+from contextlib import ExitStack
+from xml.sax.saxutils import escape
+
+import metrics
+from catalog import SITE_URL, iter_products, product_file_name, product_url
+
+log = logging.getLogger(__name__)
+
+GOOGLE_XML = 'google-merchant-feed.xml'
+FEEDS_DIR = 'feeds'
+STATE_FILE = os.path.join('.github', 'feeds-state.json')
+STATE_VERSION = 1
+STORE_NAME = 'متجر مخزون الإمارات'
+
+# ترتيب الأعمدة في TSV/CSV
+GOOGLE_COLUMNS = ('id', 'title', 'description', 'link', 'image_link', 'price', 'sale_price',
+                  'availability', 'condition', 'brand', 'product_type', 'google_product_category')
+META_COLUMNS = ('id', 'title', 'description', 'availability', 'condition', 'price', 'sale_price',
+                'link', 'image_link', 'brand', 'product_type', 'google_product_category',
+                'quantity_to_sell_on_facebook')
+
+XML_HEAD = ('﻿<?xml version="1.0" encoding="utf-8"?>\n'
+            '<rss version="2.0" xmlns:g="http://base.google.com/ns/1.0">\n'
+            '  <channel>\n'
+            f'    <title>{STORE_NAME}</title>\n'
+            f'    <link>{SITE_URL}</link>\n'
+            f'    <description>منتجات {STORE_NAME} - Google Merchant Feed</description>\n')
+XML_TAIL = '  </channel>\n</rss>\n'
+
+# ========== صف المنتج ==========
+def money(value, currency):
+    # نفس شكل الـ feed القديم: "251 AED" - والكسور برقمين بس
+    value = float(value)
+    return f"{int(value)} {currency}" if value.is_integer() else f"{value:.2f} {currency}"
+
+def feed_row(product):
+    """حقول المنتج في الـ feeds (نفس الصف لكل الصيغ)"""
+    currency = product.get('currency') or 'AED'
+    price = product.get('price') or 0
+    sale_price = product.get('sale_price')
+    category = product.get('category') or ''
+    stock = product.get('stock')
+    availability = product.get('availability') or ('in stock' if stock != 0 else 'out of stock')
+    return {
+        'id': str(product.get('id')),
+        'title': product.get('title') or '',
+        'description': product.get('description') or product.get('title') or '',
+        # الرابط من نفس قاعدة data/urls.json - من غير ما نحمل الفهرس كله
+        'link': product_url(f"products/{product_file_name(product)}"),
+        'image_link': product.get('image_link') or '',
+        'price': money(price, currency),
+        # سعر الخصم بيتكتب بس لو أقل من السعر الأصلي
+        'sale_price': money(sale_price, currency) if sale_price and sale_price < price else '',
+        'availability': availability,
+        'condition': product.get('condition') or 'new',
+        'brand': product.get('brand') or STORE_NAME,
+        'product_type': category,
+        'google_product_category': category,
+        'quantity_to_sell_on_facebook': '' if stock is None else str(stock),
+    }
+
+def tombstone_row(product_id):
+    """صف منتج اتشال: الـ id والتوفر بس (باقي الأعمدة فاضية = ما بتتغيرش عند المستهلك)"""
+    row = dict.fromkeys(META_COLUMNS, '')
+    row.update(id=product_id, availability='out of stock', quantity_to_sell_on_facebook='0')
+    return row
+
+def row_hash(row):
+    data = json.dumps(row, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()[:16]
+
+# ========== الصيغ ==========
+def xml_item(row):
+    lines = ['    <item>']
+    for column in GOOGLE_COLUMNS:
+        if row[column]:
+            lines.append(f'      <g:{column}>{escape(row[column])}</g:{column}>')
+    lines.append('    </item>\n')
+    return '\n'.join(lines)
+
+def tsv_line(row):
+    # Google TSV ما بيدعمش quoting - التاب والسطر الجديد بيتحولوا لمسافة
+    return '\t'.join(row[c].replace('\t', ' ').replace('\r', ' ').replace('\n', ' ')
+                     for c in GOOGLE_COLUMNS) + '\n'
+
+class FeedSet:
+    """ملفات صيغة واحدة لكل feed (XML + TSV + CSV) - الكتابة لملفات مؤقتة ثم rename"""
+
+    def __init__(self, stack, paths):
+        self.paths = paths
+        self.xml = stack.enter_context(open(paths['xml'] + '.tmp', 'w', encoding='utf-8'))
+        self.tsv = stack.enter_context(open(paths['tsv'] + '.tmp', 'w', encoding='utf-8'))
+        csv_file = stack.enter_context(open(paths['csv'] + '.tmp', 'w', encoding='utf-8', newline=''))
+        self.csv = csv.writer(csv_file)
+        self.count = 0
+        self.xml.write(XML_HEAD)
+        self.tsv.write('\t'.join(GOOGLE_COLUMNS) + '\n')
+        self.csv.writerow(META_COLUMNS)
+
+    def write(self, row):
+        self.xml.write(xml_item(row))
+        self.tsv.write(tsv_line(row))
+        self.csv.writerow([row[c] for c in META_COLUMNS])
+        self.count += 1
+
+    def close(self):
+        self.xml.write(XML_TAIL)
+        for handle in (self.xml, self.tsv):
+            handle.close()
+
+    def commit(self):
+        for path in self.paths.values():
+            os.replace(path + '.tmp', path)
+
+    def discard(self):
+        for path in self.paths.values():
+            if os.path.exists(path + '.tmp'):
+                os.remove(path + '.tmp')
+
+# ========== الـ state ==========
+def load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': STATE_VERSION, 'hashes': {}}
+
+def save_state(state):
+    tmp_path = STATE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, separators=(',', ':'), sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, STATE_FILE)
+
+# ========== التصدير ==========
+def export_feeds(products=None, dry_run=False):
+    """كتابة الـ feeds الكاملة والـ delta في pass واحد - يرجع (عدد المنتجات, عدد المتغير, عدد المحذوف)
+    products: أي iterable (افتراضياً products.json بالـ streaming)
+    """
+    products = iter_products() if products is None else products
+    state = load_state()
+    previous = state['hashes']
+    hashes = {}
+    full_paths = {'xml': GOOGLE_XML, 'tsv': os.path.join(FEEDS_DIR, 'google.tsv'),
+                  'csv': os.path.join(FEEDS_DIR, 'meta.csv')}
+    delta_paths = {'xml': os.path.join(FEEDS_DIR, 'google-delta.xml'),
+                   'tsv': os.path.join(FEEDS_DIR, 'google-delta.tsv'),
+                   'csv': os.path.join(FEEDS_DIR, 'meta-delta.csv')}
+
+    changed = 0
+    if dry_run:
+        for product in products:
+            row = feed_row(product)
+            hashes[row['id']] = digest = row_hash(row)
+            changed += previous.get(row['id']) != digest
+    else:
+        os.makedirs(FEEDS_DIR, exist_ok=True)
+        with ExitStack() as stack:
+            full = FeedSet(stack, full_paths)
+            delta = FeedSet(stack, delta_paths)
+            try:
+                for product in products:
+                    row = feed_row(product)
+                    hashes[row['id']] = digest = row_hash(row)
+                    full.write(row)
+                    if previous.get(row['id']) != digest:
+                        delta.write(row)
+                changed = delta.count
+                for product_id in sorted(previous.keys() - hashes.keys()):
+                    delta.write(tombstone_row(product_id))
+                full.close()
+                delta.close()
+            except Exception:
+                full.discard()
+                delta.discard()
+                raise
+        full.commit()
+        delta.commit()
+
+    removed = len(previous.keys() - hashes.keys())
+    if not dry_run:
+        state['hashes'] = hashes
+        save_state(state)
+    log.info(f"🛒 feeds: {len(hashes)} منتج - {changed} متغير/جديد في الـ delta، {removed} اتشال (tombstone)")
+    return len(hashes), changed, removed
+
+def main():
+    parser = argparse.ArgumentParser(description='Export Google Merchant and Meta catalog feeds')
+    parser.add_argument('--dry-run', action='store_true', help='عدد المنتجات المتغيرة من غير كتابة')
+    args = parser.parse_args()
+
+    metrics.setup_logging()
+    metrics.set_info(script='feeds')
+    with metrics.phase('feeds'):
+        try:
+            export_feeds(dry_run=args.dry_run)
+        except (OSError, ValueError) as e:
+            log.error(f"❌ فشل تصدير الـ feeds: {e}")
+            metrics.emit()
+            sys.exit(1)
+    metrics.emit()
+
+if __name__ == "__main__":
+    main()
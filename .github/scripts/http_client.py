@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+طبقة HTTP مشتركة لسكربتات النشر
+- Session واحدة مع connection pool (keep-alive) بدل handshake جديد لكل طلب
+- إعادة محاولة محدودة مع backoff أسي عشوائي (jitter) واحترام Retry-After
+- token bucket لكل host عشان ما نتخطاش حدود Graph API و Twitter و CDN الصور
+- PLATFORM_EMULATOR=http://127.0.0.1:8800 بيحول طلبات Graph و Twitter لمحاكي محلي
+  (benchmarks/platform_emulator.py) - نفس كود النشر من غير ما يلمس المنصات الحقيقية
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import metrics
+
+log = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 30
+MAX_RETRIES = 3
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+POOL_SIZE = 10
+
+# الحالات اللي تستاهل إعادة محاولة
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# الطلبات اللي ممكن تتعاد بأمان بعد أي خطأ - POST بيتعاد بس على 429 (الطلب ما اتنفذش)
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+# (طلبات في الثانية، أقصى دفعة) لكل host
+RATE_LIMITS = {
+    'graph.facebook.com': (1.0, 5),
+    'upload.twitter.com': (0.5, 2),
+    'api.twitter.com': (0.2, 2),
+    'm5zoon.com': (5.0, 10),
+}
+
+# المحاكي المحلي: https://graph.facebook.com/v18.0/x -> {PLATFORM_EMULATOR}/graph.facebook.com/v18.0/x
+EMULATOR_ENV = 'PLATFORM_EMULATOR'
+EMULATED_HOSTS = ('graph.facebook.com', 'upload.twitter.com', 'api.twitter.com')
+
+# ========== Token bucket ==========
+class TokenBucket:
+    """token bucket آمن مع الـ threads: rate توكن في الثانية وسعة capacity"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+def bucket_for(host):
+    """الـ bucket الخاص بالـ host (أو None لو مالوش حد)"""
+    limit = RATE_LIMITS.get(host)
+    if limit is None:
+        return None
+    with _buckets_lock:
+        if host not in _buckets:
+            _buckets[host] = TokenBucket(*limit)
+        return _buckets[host]
+
+# ========== Backoff ==========
+def retry_after_seconds(response):
+    """قراءة Retry-After (ثواني أو تاريخ HTTP)"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def backoff_delay(attempt, response=None):
+    """full jitter: رقم عشوائي بين 0 و base*2^attempt - أو Retry-After لو السيرفر حدده"""
+    if response is not None:
+        retry_after = retry_after_seconds(response)
+        if retry_after is not None:
+            return min(retry_after, BACKOFF_MAX)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+# ========== Adapter ==========
+class RetryingAdapter(HTTPAdapter):
+    """HTTPAdapter بـ connection pool + rate limit لكل host + إعادة محاولة"""
+
+    def __init__(self, max_retries=MAX_RETRIES, pool_size=POOL_SIZE):
+        self.retries = max_retries
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+
+    def route(self, request):
+        """تعديل عنوان الطلب قبل الإرسال (بعد اختيار الـ bucket بتاع الـ host الأصلي)"""
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_TIMEOUT
+        bucket = bucket_for(urlsplit(request.url).hostname)
+        idempotent = request.method in IDEMPOTENT_METHODS
+        self.route(request)
+
+        attempt = 0
+        while True:
+            if bucket:
+                bucket.acquire()
+            try:
+                response = super().send(request, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if not idempotent or attempt >= self.retries:
+                    raise
+                delay = backoff_delay(attempt)
+                log.warning(f"🔁 {request.method} {urlsplit(request.url).hostname}: {e.__class__.__name__} - "
+                            f"إعادة بعد {delay:.1f}s ({attempt + 1}/{self.retries})")
+            else:
+                retryable = response.status_code in RETRY_STATUSES and (
+                    idempotent or response.status_code == 429)
+                if not retryable or attempt >= self.retries:
+                    return response
+                delay = backoff_delay(attempt, response)
+                log.warning(f"🔁 {request.method} {urlsplit(request.url).hostname}: {response.status_code} - "
+                            f"إعادة بعد {delay:.1f}s ({attempt + 1}/{self.retries})")
+                response.close()
+            metrics.incr('http_retries')
+            time.sleep(delay)
+            attempt += 1
+
+class EmulatorAdapter(RetryingAdapter):
+    """نفس الـ adapter بس الطلب بيروح للمحاكي: {base_url}/{host}{path}"""
+
+    def __init__(self, base_url, **kwargs):
+        self.base_url = base_url.rstrip('/')
+        super().__init__(**kwargs)
+
+    def route(self, request):
+        parts = urlsplit(request.url)
+        request.url = f"{self.base_url}/{parts.hostname}{parts.path}" + (f"?{parts.query}" if parts.query else '')
+
+# ========== Session مشتركة ==========
+_session = None
+_session_lock = threading.Lock()
+
+def install(session):
+    """تركيب الـ adapter على session موجودة (مثلاً sessions بتاعة tweepy)"""
+    adapter = RetryingAdapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    emulator = os.getenv(EMULATOR_ENV)
+    if emulator:
+        emulated = EmulatorAdapter(emulator)
+        for host in EMULATED_HOSTS:
+            session.mount(f'https://{host}/', emulated)
+    return session
+
+def session():
+    """الـ Session المشتركة (بتتعمل مرة واحدة)"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = install(requests.Session())
+        return _session
+
+def request(method, url, **kwargs):
+    return session().request(method, url, **kwargs)
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
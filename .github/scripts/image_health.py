@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+فحص صحة روابط صور المنتجات قبل النشر
+- كل الصور بتتفحص بالتوازي (thread pool محدود) عبر http_client (نفس الـ rate limit لكل host)
+- HEAD مع If-None-Match / If-Modified-Since من آخر فحص - الصورة اللي ما اتغيرتش بترجع 304 من غير body
+  ولو السيرفر ما بيدعمش HEAD (405/501) بنرجع لـ GET بـ stream من غير ما نقرا المحتوى
+- الصورة اللي اتفحصت من أقل من --max-age ساعة ما بتتفحصش تاني خالص
+- المكسورة (404/410/مش صورة) بتتعلم على طول، والأخطاء المؤقتة (5xx/timeout)
+  بعد FAILURES_TO_BREAK مرات ورا بعض بس
+- اختيار المنتج في سكربتات النشر بيتخطى المنتجات اللي صورتها مكسورة
+
+.cache/image-health.json   {"version", "images": {url: {status, ok, content_type, etag, last_modified,
+                                                          checked, failures}}}
+
+الاستخدام:
+    python .github/scripts/image_health.py                   # فحص الصور اللي عدى عليها 24 ساعة
+    python .github/scripts/image_health.py --max-age 0 --workers 16
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+
+import http_client
+import metrics
+from catalog import load_products
+
+log = logging.getLogger(__name__)
+
+HEALTH_FILE = os.path.join('.cache', 'image-health.json')
+HEALTH_VERSION = 1
+DEFAULT_WORKERS = 8
+DEFAULT_MAX_AGE_HOURS = 24
+REQUEST_TIMEOUT = 10
+# عدد الأخطاء المؤقتة ورا بعض قبل ما الصورة تتعتبر مكسورة
+FAILURES_TO_BREAK = 2
+# حالات معناها إن الصورة مش موجودة فعلاً (مش عطل مؤقت)
+BROKEN_STATUSES = {401, 403, 404, 410, 451}
+HEAD_UNSUPPORTED = {405, 501}
+
+_lock = threading.Lock()
+
+# ========== ملف الصحة ==========
+def load_health(path=HEALTH_FILE):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            health = json.load(f)
+        if health.get('version') == HEALTH_VERSION:
+            return health
+    except (OSError, ValueError):
+        pass
+    return {'version': HEALTH_VERSION, 'images': {}}
+
+def save_health(health, path=HEALTH_FILE):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(health, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+def broken_product_ids(catalog, path=HEALTH_FILE):
+    """IDs المنتجات اللي صورتها مكسورة - للاختيار في سكربتات النشر
+    catalog: product_id -> {image_link, ...} (dict أو ProductStore، أو قائمة منتجات فيها id)
+    """
+    images = load_health(path)['images']
+    items = catalog.items() if isinstance(catalog, Mapping) else ((str(p.get('id')), p) for p in catalog)
+    # من غير رابط صورة = مكسورة، ولو الصورة ما اتفحصتش لسه بنعتبرها سليمة
+    return {product_id for product_id, product in items
+            if not product.get('image_link') or images.get(product['image_link'], {}).get('ok') is False}
+
+# ========== فحص صورة واحدة ==========
+def probe(url, entry):
+    """طلب شرطي واحد للصورة - يرجع (status, headers, error)"""
+    headers = {}
+    if entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry.get('last_modified'):
+        headers['If-Modified-Since'] = entry['last_modified']
+    try:
+        response = http_client.request('HEAD', url, headers=headers, timeout=REQUEST_TIMEOUT,
+                                       allow_redirects=True)
+        if response.status_code in HEAD_UNSUPPORTED:
+            response = http_client.request('GET', url, headers=headers, timeout=REQUEST_TIMEOUT,
+                                           stream=True)
+            response.close()
+    except Exception as e:
+        return None, {}, e.__class__.__name__
+    return response.status_code, response.headers, None
+
+def is_image(content_type):
+    # من غير Content-Type بنعتبرها صورة - الحكم على الحالة بس
+    return content_type.startswith('image/') or not content_type
+
+def check_image(url, entry):
+    """الحالة الجديدة للصورة بعد الفحص (entry القديم ما بيتعدلش)"""
+    status, headers, error = probe(url, entry)
+    result = dict(entry, checked=int(time.time()))
+    if status == 304:
+        # نفس المحتوى اللي اتفحص آخر مرة بـ 200 - نفس الحكم على نوعه
+        metrics.incr('image_health_304')
+        result.update(status=304, ok=is_image(entry.get('content_type', '')), failures=0)
+    elif status is not None and 200 <= status < 300:
+        content_type = headers.get('Content-Type', '')
+        result.update(status=status, ok=is_image(content_type), failures=0, content_type=content_type,
+                      etag=headers.get('ETag'), last_modified=headers.get('Last-Modified'))
+    elif status in BROKEN_STATUSES:
+        result.update(status=status, ok=False, failures=entry.get('failures', 0) + 1)
+    else:
+        # 5xx أو timeout - ممكن يكون عطل مؤقت
+        failures = entry.get('failures', 0) + 1
+        result.update(status=status or error, failures=failures,
+                      ok=entry.get('ok', True) if failures < FAILURES_TO_BREAK else False)
+    return result
+
+# ========== فحص الكتالوج ==========
+def scan(urls, health, workers=DEFAULT_WORKERS, max_age_hours=DEFAULT_MAX_AGE_HOURS):
+    """فحص الروابط اللي عدى عليها max_age - يحدث health في مكانه ويرجع عدد اللي اتفحص"""
+    images = health['images']
+    cutoff = time.time() - max_age_hours * 3600
+    due = [url for url in dict.fromkeys(urls)
+           if url and images.get(url, {}).get('checked', 0) <= cutoff]
+    metrics.incr('image_health_skipped', len(set(urls)) - len(due))
+
+    def work(url):
+        result = check_image(url, images.get(url, {}))
+        with _lock:
+            was_ok = images.get(url, {}).get('ok')
+            images[url] = result
+        if result['ok'] is False and was_ok is not False:
+            log.warning(f"💔 صورة مكسورة ({result['status']}): {url}")
+        elif result['ok'] and was_ok is False:
+            log.info(f"💚 الصورة رجعت تشتغل: {url}")
+
+    if due:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(work, due))
+    # روابط مش في الكتالوج تاني
+    live = set(urls)
+    for url in [url for url in images if url not in live]:
+        del images[url]
+    return len(due)
+
+def main():
+    parser = argparse.ArgumentParser(description='Check product image links (conditional requests, cached)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='عدد الطلبات المتوازية')
+    parser.add_argument('--max-age', type=float, default=DEFAULT_MAX_AGE_HOURS,
+                        help='الصورة اللي اتفحصت من أقل من كده (ساعات) ما بتتفحصش تاني')
+    parser.add_argument('--health-file', default=HEALTH_FILE)
+    args = parser.parse_args()
+
+    metrics.setup_logging()
+    metrics.set_info(script='image_health')
+    with metrics.phase('products_load'):
+        products = load_products()
+    if not products:
+        sys.exit(1)
+
+    health = load_health(args.health_file)
+    urls = [p.get('image_link') or '' for p in products]
+    with metrics.phase('image_scan'):
+        checked = scan(urls, health, args.workers, args.max_age)
+    save_health(health, args.health_file)
+
+    broken = broken_product_ids(products, args.health_file)
+    log.info(f"🩺 فحص الصور: {checked} اتفحص، {len(set(urls)) - checked} من الكاش - "
+             f"{len(broken)} منتج صورته مكسورة")
+    metrics.emit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+كاش الصور وتحويلها لصيغة كل منصة
+- الصورة بتتحمل مرة واحدة وتتخزن على الديسك باسم الـ sha256 بتاع محتواها
+- التحويل (webp -> JPEG، تصغير، ضغط لحد أقصى حجم) بيحصل مرة واحدة لكل منصة
+- النشر في الدورات الجاية بيستخدم الملفات المتخزنة من غير أي طلب شبكة
+"""
+
+import logging
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from io import BytesIO
+
+import http_client
+import metrics
+
+log = logging.getLogger(__name__)
+
+CACHE_DIR = os.path.join('.cache', 'images')
+BLOBS_DIR = os.path.join(CACHE_DIR, 'blobs')
+INDEX_FILE = os.path.join(CACHE_DIR, 'index.json')
+
+# حدود كل منصة للصور المرفوعة كملف
+PLATFORM_SPECS = {
+    'twitter': {'max_bytes': 5 * 1024 * 1024, 'max_side': 4096},
+    'facebook': {'max_bytes': 4 * 1024 * 1024, 'max_side': 2048},
+}
+JPEG_QUALITY = 90
+MIN_JPEG_QUALITY = 50
+
+_index = None
+_lock = threading.Lock()
+
+# ========== الفهرس ==========
+def load_index():
+    """فهرس الكاش: url -> {etag, last_modified, sha256, mime, variants}"""
+    global _index
+    if _index is None:
+        try:
+            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                _index = json.load(f)
+        except (OSError, ValueError):
+            _index = {}
+    return _index
+
+def save_index():
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = INDEX_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(_index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, INDEX_FILE)
+
+# ========== الملفات (content-addressed) ==========
+def blob_path(digest, ext):
+    return os.path.join(BLOBS_DIR, f"{digest}.{ext}")
+
+def write_blob(data, ext):
+    """تخزين المحتوى باسم الـ sha256 بتاعه - نفس المحتوى = نفس الملف"""
+    digest = hashlib.sha256(data).hexdigest()
+    path = blob_path(digest, ext)
+    if not os.path.exists(path):
+        os.makedirs(BLOBS_DIR, exist_ok=True)
+        # ملف مؤقت خاص بكل كاتب: قناتين بيحملوا نفس الصورة في نفس الوقت من غير ما حد يمسح ملف التاني
+        fd, tmp_path = tempfile.mkstemp(dir=BLOBS_DIR, prefix=f".{digest}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            # كاتب تاني سبقنا بنفس المحتوى - الملف موجود وده نجاح
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            if not os.path.exists(path):
+                raise
+    return digest
+
+def read_blob(digest, ext):
+    try:
+        with open(blob_path(digest, ext), 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+def mime_extension(mime):
+    return {'image/jpeg': 'jpg', 'image/png': 'png', 'image/webp': 'webp',
+            'image/gif': 'gif'}.get(mime, 'bin')
+
+# ========== تحميل الصورة ==========
+def fetch_image(image_url, revalidate=False):
+    """الصورة الأصلية (bytes, mime) من الكاش أو من الشبكة
+    revalidate=True بيبعت If-None-Match / If-Modified-Since بدل ما يثق في الكاش
+    """
+    with _lock:
+        entry = load_index().get(image_url)
+    if entry:
+        data = read_blob(entry['sha256'], mime_extension(entry['mime']))
+        if data is not None and not revalidate:
+            metrics.incr('image_cache_hit')
+            return data, entry['mime']
+    else:
+        data = None
+
+    headers = {}
+    if data is not None:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    metrics.incr('image_cache_miss')
+    try:
+        with metrics.phase('image_fetch'):
+            response = http_client.get(image_url, headers=headers, timeout=10)
+    except Exception as e:
+        log.error(f"❌ خطأ تحميل الصورة: {e}")
+        return None
+    if response.status_code == 304 and data is not None:
+        log.info("✅ الصورة ما اتغيرتش (304)")
+        return data, entry['mime']
+    if response.status_code != 200:
+        log.error(f"❌ فشل تحميل الصورة: {response.status_code}")
+        return None
+
+    data = response.content
+    mime = response.headers.get('Content-Type', 'application/octet-stream').split(';')[0].strip()
+    digest = write_blob(data, mime_extension(mime))
+    with _lock:
+        index = load_index()
+        old = index.get(image_url, {})
+        index[image_url] = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'sha256': digest,
+            'mime': mime,
+            # التحويلات القديمة تفضل صالحة بس لو المحتوى ما اتغيرش
+            'variants': old.get('variants', {}) if old.get('sha256') == digest else {},
+        }
+        save_index()
+    log.info(f"✅ تم تحميل الصورة ({len(data) // 1024} KB)")
+    return data, mime
+
+# ========== التحويل ==========
+def transcode(data, spec):
+    """تحويل لـ JPEG في حدود المنصة (أقصى ضلع وأقصى حجم)"""
+    from PIL import Image
+
+    image = Image.open(BytesIO(data))
+    if image.mode in ('RGBA', 'LA', 'P'):
+        # JPEG ما بيدعمش الشفافية - نحط الصورة على خلفية بيضا
+        image = image.convert('RGBA')
+        background = Image.new('RGB', image.size, (255, 255, 255))
+        background.paste(image, mask=image.split()[-1])
+        image = background
+    elif image.mode != 'RGB':
+        image = image.convert('RGB')
+    image.thumbnail((spec['max_side'], spec['max_side']))
+
+    quality = JPEG_QUALITY
+    while True:
+        out = BytesIO()
+        image.save(out, format='JPEG', quality=quality, optimize=True)
+        if out.tell() <= spec['max_bytes'] or quality <= MIN_JPEG_QUALITY:
+            return out.getvalue()
+        quality -= 10
+
+def prepare_image(image_url, platform):
+    """الصورة جاهزة للرفع على المنصة: (bytes, filename, mime) أو None"""
+    original = fetch_image(image_url)
+    if original is None:
+        return None
+    data, mime = original
+
+    with _lock:
+        entry = load_index()[image_url]
+        digest = entry['variants'].get(platform)
+    if digest:
+        cached = read_blob(digest, 'jpg')
+        if cached is not None:
+            log.info(f"♻️ صورة {platform} من الكاش")
+            return cached, 'product.jpg', 'image/jpeg'
+
+    try:
+        with metrics.phase('image_transcode'):
+            converted = transcode(data, PLATFORM_SPECS[platform])
+    except ImportError:
+        log.warning("⚠️ Pillow غير مثبت - رفع الصورة الأصلية من غير تحويل")
+        return data, f"product.{mime_extension(mime)}", mime
+    except Exception as e:
+        log.warning(f"⚠️ فشل تحويل الصورة ({e}) - رفع الصورة الأصلية")
+        return data, f"product.{mime_extension(mime)}", mime
+
+    digest = write_blob(converted, 'jpg')
+    with _lock:
+        load_index()[image_url]['variants'][platform] = digest
+        save_index()
+    log.info(f"🖼️ تم تحويل الصورة لـ {platform}: {len(data) // 1024} KB -> {len(converted) // 1024} KB")
+    return converted, 'product.jpg', 'image/jpeg'
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ملفات القائمة (listing) للصفحة الرئيسية مقسمة على shards بحجم صفحة عرض
+كل كارت فيه اللي الكارت محتاجه بس: id, title, summary (أول سطر من الوصف), الأسعار, الصورة, مسار الصفحة
+(المسار من data/urls.json - المتصفح ما بيحسبش أسماء الملفات)
+الصفحة الرئيسية بتحمل manifest.json + أول shard بدل products.json كله (~1.1 MB)
+
+data/listing/manifest.json             {"version", "total", "shard_size", "shards": [...]}
+data/listing/page-0000.<hash>.json     [{card}, ...]
+اسم كل shard فيه hash محتواه - ينفع يتكاش لمدة طويلة، والـ shard بيتكتب بس لو اتغير
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+
+log = logging.getLogger(__name__)
+
+LISTING_DIR = os.path.join('data', 'listing')
+LISTING_MANIFEST = os.path.join(LISTING_DIR, 'manifest.json')
+LISTING_VERSION = 1
+# نفس PRODUCTS_PER_PAGE في index.html - أول صفحة عرض = shard واحد
+DEFAULT_SHARD_SIZE = 24
+
+# ========== الكروت ==========
+def product_card(product, path):
+    description = product.get('description') or ''
+    return {
+        'id': str(product.get('id')),
+        'title': product.get('title'),
+        'summary': description.split('\n', 1)[0],
+        'price': product.get('price'),
+        'sale_price': product.get('sale_price'),
+        'currency': product.get('currency') or 'AED',
+        'image': product.get('image_link'),
+        'path': path,
+    }
+
+def encode_shard(cards):
+    return json.dumps(cards, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def iter_shards(products, urls, shard_size):
+    """(اسم الملف, المحتوى) لكل shard بالترتيب - urls: product_id -> [path, url]"""
+    for start in range(0, len(products), shard_size):
+        chunk = products[start:start + shard_size]
+        text = encode_shard([product_card(p, urls[str(p.get('id'))][0]) for p in chunk])
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]
+        yield f"page-{start // shard_size:04d}.{digest}.json", text
+
+# ========== الكتابة ==========
+def build_listing(products, urls, shard_size=DEFAULT_SHARD_SIZE, dry_run=False):
+    """كتابة shards القائمة + الـ manifest - يرجع (عدد الـ shards, عدد اللي اتكتب)"""
+    shards = list(iter_shards(products, urls, shard_size))
+    names = [name for name, _ in shards]
+    existing = {os.path.basename(path) for path in glob.glob(os.path.join(LISTING_DIR, 'page-*.json'))}
+    # الـ hash في الاسم: لو الملف موجود يبقى محتواه هو هو
+    changed = [(name, text) for name, text in shards if name not in existing]
+    stale = existing - set(names)
+
+    if not dry_run:
+        os.makedirs(LISTING_DIR, exist_ok=True)
+        for name, text in changed:
+            with open(os.path.join(LISTING_DIR, name), 'w', encoding='utf-8') as f:
+                f.write(text)
+        manifest = {
+            'version': LISTING_VERSION,
+            'total': len(products),
+            'shard_size': shard_size,
+            'shards': names,
+        }
+        tmp_path = LISTING_MANIFEST + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+            f.write('\n')
+        os.replace(tmp_path, LISTING_MANIFEST)
+        for name in stale:
+            os.remove(os.path.join(LISTING_DIR, name))
+
+    first = len(shards[0][1].encode('utf-8')) if shards else 0
+    log.info(f"🗂️ القائمة: {len(shards)} shard × {shard_size} منتج - {len(changed)} اتكتب، {len(stale)} اتحذف "
+             f"(أول صفحة {first / 1024:.1f} KB)")
+    return len(shards), len(changed)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+قياس زمن كل مرحلة في التشغيل وإخراج سجل JSON واحد للتشغيل كله
+المراحل:
+- النشر (runner.py والقنوات): catalog_load, url_index_load, products_load, tracking_load, selection,
+  image_fetch, image_transcode, upload, container_wait, publish
+- بناء الموقع (build_site.py): products_load, render, listing, search_index, sitemap, feeds
+- الفحص: check (check_catalog.py), image_scan (image_health.py)
+
+الاستخدام:
+    with metrics.phase('selection'):
+        ...
+    metrics.incr('image_cache_hit')
+    metrics.emit(history_path)   # آخر التشغيل
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+log = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_run = {
+    'started': time.time(),
+    'phases': {},
+    'counters': {},
+    'info': {},
+}
+
+# ========== Logging ==========
+def setup_logging(level=None):
+    """logging بنفس شكل الرسائل القديمة (سطر الرسالة بس)
+    المستوى من LOG_LEVEL (INFO افتراضياً، DEBUG يطلع التفاصيل لكل عنصر)
+    """
+    level = level or os.getenv('LOG_LEVEL', 'INFO')
+    logging.basicConfig(level=getattr(logging, level.upper(), logging.INFO),
+                        format='%(message)s')
+
+# ========== المراحل ==========
+@contextmanager
+def phase(name):
+    """قياس زمن مرحلة - لو المرحلة اتكررت (batch أو قنوات متوازية) الزمن بيتجمع"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        with _lock:
+            entry = _run['phases'].setdefault(name, {'seconds': 0.0, 'count': 0})
+            entry['seconds'] += elapsed
+            entry['count'] += 1
+        log.debug(f"⏱️ {name}: {elapsed * 1000:.1f}ms")
+
+def incr(name, amount=1):
+    with _lock:
+        _run['counters'][name] = _run['counters'].get(name, 0) + amount
+
+def set_info(**fields):
+    """معلومات ثابتة عن التشغيل (اسم السكربت، القناة، حجم الدفعة ...)"""
+    with _lock:
+        _run['info'].update(fields)
+
+# ========== السجل النهائي ==========
+def snapshot():
+    with _lock:
+        return {
+            'ts': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            **_run['info'],
+            'total_seconds': round(time.time() - _run['started'], 3),
+            'phases': {name: {'seconds': round(v['seconds'], 4), 'count': v['count']}
+                       for name, v in _run['phases'].items()},
+            'counters': dict(_run['counters']),
+        }
+
+def emit(history_path=None):
+    """طباعة سجل المقاييس كسطر JSON واحد، وإضافته لملف التاريخ لو محدد"""
+    record = snapshot()
+    line = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+    log.info(f"📈 METRICS {line}")
+    if history_path:
+        try:
+            directory = os.path.dirname(history_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(history_path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        except OSError as e:
+            log.warning(f"⚠️ فشل حفظ المقاييس في {history_path}: {e}")
+    return record
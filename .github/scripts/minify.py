@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+تصغير HTML و CSS للصفحات المولّدة (من غير أي مكتبة خارجية)
+- HTML: مسح التعليقات والمسافات بين الـ tags البلوك، وضغط أي مسافات متكررة لمسافة واحدة
+- <script>/<style>/<pre>/<textarea> محتواهم ما بيتلمسش (الـ JSON-LD بيتكتب compact)
+- CSS: مسح التعليقات والمسافات حوالين { } : ; ,
+"""
+
+import json
+import re
+
+# الـ tags اللي المسافة قبلها أو بعدها ما بتأثرش على العرض
+BLOCK_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style', 'header', 'footer',
+    'main', 'nav', 'section', 'article', 'aside', 'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5',
+    'h6', 'ul', 'ol', 'li', 'table', 'thead', 'tbody', 'tr', 'td', 'th', 'form', 'iframe',
+    'br', 'hr', '!doctype',
+}
+
+RAW_BLOCK = re.compile(r'(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2>)', re.S | re.I)
+COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+# \s في Python بتشمل المسافة غير القابلة للكسر (nbsp) - وده جزء من النص مش مسافة تنسيق
+SPACES = re.compile(r'[ \t\r\n\f]+')
+BETWEEN_TAGS = re.compile(r'(<(/?)([!\w]+)[^>]*>)[ ](?=<(/?)([!\w]+))')
+
+# ========== HTML ==========
+def _compact_jsonld(open_tag, body):
+    if 'ld+json' not in open_tag:
+        return body
+    try:
+        return json.dumps(json.loads(body), ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+    except ValueError:
+        return body
+
+def _drop_space(match):
+    left, right = match.group(3).lower(), match.group(5).lower()
+    if left in BLOCK_TAGS or right in BLOCK_TAGS:
+        return match.group(1)
+    return match.group(0)
+
+def minify_html(text):
+    """تصغير صفحة HTML مع الحفاظ على شكل العرض"""
+    raw_blocks = []
+
+    def stash(match):
+        open_tag, tag, body, close_tag = match.groups()
+        if tag.lower() == 'style':
+            body = minify_css(body)
+        elif tag.lower() == 'script':
+            body = _compact_jsonld(open_tag, body.strip())
+        raw_blocks.append(SPACES.sub(' ', open_tag) + body + close_tag)
+        return f'\x00{len(raw_blocks) - 1}\x00'
+
+    bom = text.startswith('﻿')
+    text = RAW_BLOCK.sub(stash, text.lstrip('﻿'))
+    text = COMMENT.sub('', text)
+    text = SPACES.sub(' ', text).strip()
+    # placeholders للـ script/style بيتعاملوا كـ tags بلوك
+    text = re.sub(r' ?(\x00\d+\x00) ?', r'\1', text)
+    text = BETWEEN_TAGS.sub(_drop_space, text)
+    text = re.sub(r'\x00(\d+)\x00', lambda m: raw_blocks[int(m.group(1))], text)
+    return ('﻿' if bom else '') + text
+
+# ========== CSS ==========
+def minify_css(text):
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = SPACES.sub(' ', text)
+    text = re.sub(r' ?([{};,>]) ?', r'\1', text)
+    text = re.sub(r': ', ':', text)
+    text = text.replace(';}', '}')
+    return text.strip()
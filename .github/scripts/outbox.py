@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+صندوق الصادر (outbox) للمنشورات اللي لسه ما خلصتش
+كل منشور ليه مفتاح ثابت: product_id:channel:cycle
+وكل خطوة خلصت (رفع الصورة، container، النص) بتتحفظ فيه،
+فالمحاولة الجاية تكمل من آخر خطوة بدل ما تعيد التحميل والرفع من الأول
+ولو المنشور اتنشر فعلاً (remote_id موجود) ما بيتنشرش تاني أبداً
+"""
+
+import logging
+import json
+import os
+import threading
+import time
+
+from tracking import mark_posted, defer_product
+
+log = logging.getLogger(__name__)
+
+# عدد المحاولات قبل ما المنتج يتأجل لآخر الدورة
+MAX_ATTEMPTS = 3
+# media_id في Twitter و container في Instagram صالحين 24 ساعة
+STEP_TTL = 23 * 3600
+
+def outbox_path(tracking_file):
+    """posted_products.jsonl -> posted_products.outbox.json"""
+    return os.path.splitext(tracking_file)[0] + '.outbox.json'
+
+def outbox_key(product_id, channel, cycle):
+    return f"{product_id}:{channel}:{cycle}"
+
+# ========== منشور واحد ==========
+class PostJob:
+    """منشور واحد في الـ outbox (منتج + قناة + دورة)"""
+
+    def __init__(self, outbox, entry):
+        self.outbox = outbox
+        self.entry = entry
+
+    @property
+    def key(self):
+        return self.entry['key']
+
+    @property
+    def remote_id(self):
+        return self.entry.get('remote_id')
+
+    @property
+    def attempts(self):
+        return self.entry.get('attempts', 0)
+
+    def step(self, name, max_age=None):
+        """قيمة خطوة خلصت قبل كده (أو None لو مش موجودة أو انتهت صلاحيتها)"""
+        step = self.entry['steps'].get(name)
+        if not step:
+            return None
+        if max_age is not None and time.time() - step['at'] > max_age:
+            return None
+        return step['value']
+
+    def checkpoint(self, name, value):
+        """حفظ خطوة خلصت فوراً على الديسك"""
+        with self.outbox.lock:
+            self.entry['steps'][name] = {'value': value, 'at': time.time()}
+            self.outbox.save()
+
+    def complete(self, remote_id):
+        """المنشور اتنشر - بيتحفظ قبل أي حاجة تانية عشان أي إعادة ما تكررهوش"""
+        with self.outbox.lock:
+            self.entry['remote_id'] = remote_id
+            self.outbox.save()
+
+    def failed(self):
+        """تسجيل محاولة فاشلة - يرجع True لو لسه فيه محاولات"""
+        with self.outbox.lock:
+            self.entry['attempts'] = self.attempts + 1
+            self.outbox.save()
+        return self.attempts < MAX_ATTEMPTS
+
+# ========== الـ outbox ==========
+class Outbox:
+    """ملف JSON صغير فيه المنشورات المعلقة بس (بيتكتب بملف مؤقت ثم rename)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.RLock()
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def save(self):
+        with self.lock:
+            if not self.entries:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def job(self, product_id, channel, cycle):
+        """المنشور الخاص بالمفتاح ده - بيتعمل جديد لو مش موجود"""
+        key = outbox_key(product_id, channel, cycle)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = {'key': key, 'product_id': product_id, 'channel': channel,
+                         'cycle': cycle, 'attempts': 0, 'steps': {}, 'remote_id': None}
+                self.entries[key] = entry
+                self.save()
+        return PostJob(self, entry)
+
+    def drop(self, job):
+        with self.lock:
+            self.entries.pop(job.key, None)
+            self.save()
+
+    def pending(self, cycle, catalog, channels=None):
+        """المنشورات المعلقة في الدورة الحالية: {product_id: [channels]}
+        أي حاجة من دورة قديمة أو لمنتج اتشال من الكتالوج بتتشال
+        channels: قنوات الـ rotation ده بس (الـ outbox مشترك بين كل الـ rotations)
+        """
+        with self.lock:
+            mine = [entry for entry in self.entries.values()
+                    if channels is None or entry['channel'] in channels]
+            stale = [entry['key'] for entry in mine
+                     if entry['cycle'] != cycle or entry['product_id'] not in catalog]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self.save()
+            result = {}
+            for entry in mine:
+                if entry['key'] in self.entries:
+                    result.setdefault(entry['product_id'], []).append(entry['channel'])
+            return result
+
+    def merge(self, path):
+        """نقل المنشورات المعلقة من outbox تاني (قديم) - وبعدين بيتمسح"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self.lock:
+            for key, entry in entries.items():
+                self.entries.setdefault(key, entry)
+            self.save()
+        os.remove(path)
+
+# ========== بعد النشر ==========
+def settle_jobs(outbox, tracking, product_id, jobs, results):
+    """تسجيل نتيجة كل قناة: النجاح يروح للتتبع ويطلع من الـ outbox
+    لو كل القنوات فشلت المنشور يفضل معلق للتشغيل الجاي لحد MAX_ATTEMPTS،
+    وبعدها المنتج بيتأجل لآخر الدورة
+    لو قناة واحدة على الأقل نجحت المنتج بيتحسب منشور والباقي ما بيتعادش
+    يرجع قائمة القنوات اللي نجحت
+    """
+    succeeded = [channel for channel in jobs if results[channel]['post_id'] is not None]
+    for channel in succeeded:
+        mark_posted(tracking, product_id, channel, results[channel]['post_id'])
+
+    if succeeded:
+        for job in jobs.values():
+            outbox.drop(job)
+        return succeeded
+
+    retrying = False
+    for channel, job in jobs.items():
+        if job.failed():
+            retrying = True
+            log.info(f"🔁 {channel}: المنشور معلق في الـ outbox (محاولة {job.attempts}/{MAX_ATTEMPTS})")
+        else:
+            log.warning(f"⛔ {channel}: خلصت المحاولات ({MAX_ATTEMPTS})")
+            outbox.drop(job)
+    if not retrying:
+        # تأجيل المنتج لآخر الدورة عشان الدورة ما تقفش عنده
+        defer_product(tracking, product_id)
+    return succeeded
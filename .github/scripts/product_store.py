@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مخزن الكتالوج المضغوط لسكربتات النشر (بدل الـ snapshot JSON القديم)
+ملف ثنائي واحد .cache/catalog.store بيتفتح بـ mmap - ما فيش ولا dict لكل منتج في الذاكرة:
+- الحقول اللي النشر محتاجها (title, price, sale_price, stock, category, image_link, url) أعمدة (columnar):
+  أرقام في arrays ثابتة الحجم، والنصوص كلها في heap واحد بـ offsets
+- offset وطول كل منتج جوه products.json - أي حقل تاني (الوصف مثلاً) بيتقري وقت الطلب بس
+  من products.json نفسه (mmap + json.loads للمنتج ده لوحده) عبر store.details(id)
+- البحث بالـ id: bisect على عمود ids مترتب ومتصل - O(log n) من غير فهرس في الذاكرة
+- الملف مربوط ببصمة products.json و data/urls.json وبيتبني تاني تلقائياً لما أي واحد فيهم يتغير
+
+شكل الملف:
+    MAGIC, version, طول الـ header, header JSON (sources, key, total, count, sections)
+    ids Q[n] | offsets Q[n] | lengths I[n] | price d[n] | sale_price d[n] | stock d[n]
+    text Q[4n+1]   (حدود title, category, image_link, url لكل صف في الـ heap)
+    sorted_ids Q[n] | by_id I[n] (الـ ids مترتبة ورقم الصف لكل واحد) | heap (UTF-8)
+
+الاستخدام:
+    catalog, total, key = load_catalog()
+    catalog['75']['title']              # dict صغير بالحقول المهمة بيتعمل وقت الطلب
+    catalog.details('75')['description']
+"""
+
+import hashlib
+import json
+import logging
+import math
+import mmap
+import os
+import struct
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+
+import metrics
+from catalog import (PRODUCTS_FILE, URLS_FILE, file_fingerprint, file_sha256, iter_product_spans,
+                     load_url_index)
+
+log = logging.getLogger(__name__)
+
+STORE_FILE = os.path.join('.cache', 'catalog.store')
+STORE_MAGIC = b'MZST'
+STORE_VERSION = 2
+PREAMBLE = struct.Struct('<4sII')
+
+# أقسام الملف (الاسم, نوع array) - النصوص في الـ heap بالترتيب title, category, image_link, url لكل صف
+# والحقول التانية بتتقري من products.json وقت الطلب
+SECTIONS = (
+    ('ids', 'Q'), ('offsets', 'Q'), ('lengths', 'I'),
+    ('price', 'd'), ('sale_price', 'd'), ('stock', 'd'),
+    ('text', 'Q'), ('sorted_ids', 'Q'), ('by_id', 'I'),
+)
+
+# ========== الأرقام ==========
+def pack_number(value):
+    """السعر (أو المخزون) كـ float (NaN = مالوش قيمة)"""
+    try:
+        return float(value) if value is not None else math.nan
+    except (TypeError, ValueError):
+        return math.nan
+
+def unpack_number(value):
+    # الأسعار في products.json أرقام صحيحة - ترجع int عشان "251 AED" ما تبقاش "251.0 AED"
+    if math.isnan(value):
+        return None
+    return int(value) if value.is_integer() else value
+
+# ========== بناء الملف ==========
+def store_sources():
+    return {path: dict(file_fingerprint(path), sha256=file_sha256(path))
+            for path in (PRODUCTS_FILE, URLS_FILE)}
+
+def build_store(path=STORE_FILE):
+    """بناء catalog.store من products.json (streaming) و data/urls.json - يرجع عدد المنتجات أو None"""
+    with metrics.phase('url_index_load'):
+        id_to_url = load_url_index()
+    if not id_to_url:
+        return None
+
+    columns = {name: array(code) for name, code in SECTIONS}
+    columns['text'].append(0)
+    heap = bytearray()
+    total = 0
+    with metrics.phase('products_load'):
+        try:
+            for product, offset, length in iter_product_spans():
+                total += 1
+                product_id = str(product.get('id'))
+                entry = id_to_url.get(product_id)
+                if not entry or not product_id.isdigit():
+                    continue
+                columns['ids'].append(int(product_id))
+                columns['offsets'].append(offset)
+                columns['lengths'].append(length)
+                columns['price'].append(pack_number(product.get('price')))
+                columns['sale_price'].append(pack_number(product.get('sale_price')))
+                columns['stock'].append(pack_number(product.get('stock')))
+                for text in (product.get('title'), product.get('category'), product.get('image_link'),
+                             entry[1]):
+                    heap += (text or '').encode('utf-8')
+                    columns['text'].append(len(heap))
+        except (OSError, ValueError) as e:
+            log.error(f"❌ خطأ في تحميل المنتجات: {e}")
+            return None
+    count = len(columns['ids'])
+    if not count:
+        return None
+    if count < total:
+        log.warning(f"⚠️ {total - count} منتج مالهمش رابط في {URLS_FILE} - شغّل build_site.py")
+
+    ids = columns['ids']
+    columns['by_id'] = array('I', sorted(range(count), key=ids.__getitem__))
+    columns['sorted_ids'] = array('Q', (ids[row] for row in columns['by_id']))
+
+    sources = store_sources()
+    key = hashlib.sha256(''.join(src['sha256'] for src in sources.values()).encode()).hexdigest()[:16]
+    write_store(path, columns, heap, {'sources': sources, 'key': key, 'total': total, 'count': count})
+    log.info(f"💾 تم بناء مخزن الكتالوج: {count} منتج ({os.path.getsize(path) // 1024} KB)")
+    return count
+
+def write_store(path, columns, heap, header):
+    """كتابة الأعمدة والـ heap (ملف مؤقت ثم rename) - كل قسم بيبدأ على حد 8 bytes"""
+    sections = {}
+    offset = 0
+    for name, _ in SECTIONS:
+        size = len(columns[name]) * columns[name].itemsize
+        sections[name] = [offset, size]
+        offset += size + (-size % 8)
+    sections['heap'] = [offset, len(heap)]
+    header_bytes = json.dumps(dict(header, sections=sections), separators=(',', ':')).encode('utf-8')
+    header_bytes += b' ' * (-(PREAMBLE.size + len(header_bytes)) % 8)
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(PREAMBLE.pack(STORE_MAGIC, STORE_VERSION, len(header_bytes)))
+        f.write(header_bytes)
+        for name, _ in SECTIONS:
+            data = columns[name].tobytes()
+            f.write(data + bytes(-len(data) % 8))
+        f.write(heap)
+    os.replace(tmp_path, path)
+
+# ========== المخزن ==========
+class ProductStore(Mapping):
+    """product_id -> dict الحقول المهمة (بيتعمل وقت الطلب) فوق catalog.store بـ mmap
+    iteration بترتيب products.json زي الـ dict القديم
+    """
+
+    def __init__(self, path=STORE_FILE, products_path=PRODUCTS_FILE):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, header_size = PREAMBLE.unpack_from(self._mm)
+            if magic != STORE_MAGIC or version != STORE_VERSION:
+                raise ValueError(f"{path}: نسخة قديمة")
+            self.header = json.loads(self._mm[PREAMBLE.size:PREAMBLE.size + header_size])
+            if not isinstance(self.header, dict):
+                raise ValueError(f"{path}: header تالف")
+            base = PREAMBLE.size + header_size
+            self._view = memoryview(self._mm)
+            self._columns = {}
+            for name, code in SECTIONS + (('heap', None),):
+                start, size = self.header['sections'][name]
+                start, end = base + start, base + start + size
+                # ملف مقطوع: الـ slice بيرجع أقصر من غير خطأ - لازم نتأكد بنفسنا
+                if end > len(self._mm):
+                    raise ValueError(f"{path}: الملف مقطوع (القسم {name})")
+                self._columns[name] = self._view[start:end].cast(code) if code else self._view[start:end]
+            self._heap = self._columns.pop('heap')
+            self._ids = self._columns['ids']
+            self._sorted_ids = self._columns['sorted_ids']
+            self._by_id = self._columns['by_id']
+            self.total = self.header['total']
+            self.key = self.header['key']
+        except Exception:
+            self.close()
+            raise
+        self._products_path = products_path
+        self._products_mm = None
+
+    def close(self):
+        # الـ memoryviews لازم تتقفل قبل الـ mmap
+        for view in getattr(self, '_columns', {}).values():
+            view.release()
+        for name in ('_heap', '_view'):
+            if getattr(self, name, None) is not None:
+                getattr(self, name).release()
+        for mm in (self._mm, getattr(self, '_products_mm', None)):
+            if mm is not None:
+                mm.close()
+
+    def row(self, product_id):
+        """رقم الصف للـ id (bisect على sorted_ids) أو -1"""
+        try:
+            target = int(product_id)
+        except (TypeError, ValueError):
+            return -1
+        sorted_ids = self._sorted_ids
+        position = bisect_left(sorted_ids, target)
+        if position < len(sorted_ids) and sorted_ids[position] == target:
+            return self._by_id[position]
+        return -1
+
+    def product_at(self, row):
+        """الحقول المهمة للصف - نفس شكل منتجات الـ snapshot القديم"""
+        columns, heap = self._columns, self._heap
+        bounds = columns['text'][4 * row:4 * row + 5]
+        title, category, image_link, url = (str(heap[bounds[i]:bounds[i + 1]], 'utf-8') for i in range(4))
+        return {
+            'title': title,
+            'price': unpack_number(columns['price'][row]),
+            'sale_price': unpack_number(columns['sale_price'][row]),
+            'stock': unpack_number(columns['stock'][row]),
+            'category': category,
+            'image_link': image_link,
+            'url': url,
+            'id': str(self._ids[row]),
+        }
+
+    def details(self, product_id):
+        """المنتج كامل (كل الحقول) من products.json - بيتقري المنتج ده بس"""
+        row = self.row(product_id)
+        if row < 0:
+            raise KeyError(product_id)
+        if self._products_mm is None:
+            with open(self._products_path, 'rb') as f:
+                self._products_mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        offset = self._columns['offsets'][row]
+        return json.loads(self._products_mm[offset:offset + self._columns['lengths'][row]])
+
+    def __getitem__(self, product_id):
+        row = self.row(product_id)
+        if row < 0:
+            raise KeyError(product_id)
+        return self.product_at(row)
+
+    def __contains__(self, product_id):
+        return self.row(product_id) >= 0
+
+    def __iter__(self):
+        for product_id in self._ids:
+            yield str(product_id)
+
+    def __len__(self):
+        return len(self._ids)
+
+def open_store(path=STORE_FILE):
+    """فتح catalog.store لو موجود ومطابق لملفات المصدر - وإلا None"""
+    try:
+        store = ProductStore(path)
+    except (OSError, ValueError, struct.error, KeyError, TypeError) as e:
+        # ملف مقطوع (struct.error) أو فهرس تالف (KeyError/TypeError) = نبني من products.json
+        if not isinstance(e, FileNotFoundError):
+            log.warning(f"⚠️ مخزن الكتالوج تالف أو قديم: {e}")
+        return None
+    if not sources_are_fresh(store.header.get('sources', {})):
+        store.close()
+        return None
+    return store
+
+def sources_are_fresh(sources):
+    """التحقق إن الملف مطابق لملفات المصدر الحالية
+    لو الحجم ووقت التعديل ما تغيروا ما نحسب الـ hash أصلاً
+    """
+    if not isinstance(sources, dict) or PRODUCTS_FILE not in sources or URLS_FILE not in sources:
+        return False
+    for path, saved in sources.items():
+        if not isinstance(saved, dict) or not os.path.exists(path):
+            return False
+        fp = file_fingerprint(path)
+        if fp['size'] == saved.get('size') and fp['mtime_ns'] == saved.get('mtime_ns'):
+            continue
+        # checkout جديد بيغير وقت التعديل - نرجع للمقارنة بالمحتوى
+        if file_sha256(path) != saved.get('sha256'):
+            return False
+    return True
+
+def load_catalog(path=STORE_FILE):
+    """تحميل الكتالوج: من catalog.store لو صالح، وإلا يعاد بناؤه من المصدر
+
+    يرجع (catalog, total, key) حيث catalog هو ProductStore (Mapping):
+    product_id -> {title, price, sale_price, stock, category, image_link, url, id}
+    و key بصمة قصيرة بتتغير مع أي تغيير في ملفات المصدر
+    """
+    store = open_store(path)
+    if store is not None:
+        metrics.incr('snapshot_hit')
+        log.info(f"⚡ تم تحميل الكتالوج من المخزن: {len(store)} منتج")
+    else:
+        metrics.incr('snapshot_rebuild')
+        log.info("🔄 مخزن الكتالوج قديم أو غير موجود - إعادة بناء الكتالوج...")
+        if not build_store(path):
+            return {}, 0, None
+        store = ProductStore(path)
+    return store, store.total, store.key
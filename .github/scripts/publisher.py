@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+محرك النشر المتوازي على أكثر من قناة
+كل القنوات تنشر نفس المنتج في نفس الوقت (thread pool) - زمن التشغيل = أبطأ قناة مش مجموعهم
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+# ========== النشر المتوازي ==========
+def run_channel(name, post_fn, content, job=None):
+    """تشغيل قناة واحدة وقياس زمنها - أي استثناء يتحسب فشل للقناة دي بس"""
+    start = time.perf_counter()
+    if job is not None and job.remote_id is not None:
+        # اتنشر قبل كده (نفس مفتاح الـ outbox) - ما نكررش المنشور
+        log.info(f"♻️ {name}: منشور بالفعل ({job.remote_id})")
+        return {'post_id': job.remote_id, 'seconds': 0.0}
+    try:
+        post_id = post_fn(content, job) if job is not None else post_fn(content)
+    except Exception as e:
+        log.error(f"❌ خطأ غير متوقع في {name}: {e}")
+        post_id = None
+    return {'post_id': post_id, 'seconds': time.perf_counter() - start}
+
+def publish_all(content, channels, jobs=None):
+    """نشر المحتوى على كل القنوات بالتوازي
+    channels: قاموس {اسم القناة: دالة النشر} - الدالة ترجع ID المنشور أو None
+    jobs (اختياري): {اسم القناة: PostJob من الـ outbox} بيتبعت للدالة كـ argument تاني
+    يرجع {اسم القناة: {'post_id': ..., 'seconds': ...}}
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, len(channels))) as pool:
+        futures = {name: pool.submit(run_channel, name, post_fn, content, (jobs or {}).get(name))
+                   for name, post_fn in channels.items()}
+        results = {name: future.result() for name, future in futures.items()}
+    wall = time.perf_counter() - start
+
+    log.info("\n⏱️ زمن كل قناة:")
+    for name, result in results.items():
+        status = "✅" if result['post_id'] is not None else "❌"
+        log.info(f"   {status} {name}: {result['seconds']:.2f}s")
+    log.info(f"   ⏱️ الإجمالي: {wall:.2f}s (مجموع القنوات {sum(r['seconds'] for r in results.values()):.2f}s)")
+    return results
+
+# ========== الانتظار مع backoff ==========
+def poll_until(check, timeout=60, initial_delay=1.0, max_delay=8.0):
+    """استدعاء check() لحد ما ترجع True أو False (جاهز / فشل نهائي)
+    None معناها لسه بيتجهز - نستنى بـ backoff أسي لحد timeout
+    يرجع True / False، و False لو الوقت خلص
+    """
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    while True:
+        state = check()
+        if state is not None:
+            return state
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+النشر التلقائي على كل القنوات من تشغيل واحد
+- الكتالوج وفحص الصور بيتحملوا مرة واحدة والمنتج بيتبعت لكل قنوات الـ plugins (شوف channels.py)
+- سجل تتبع واحد (posted_products.jsonl) وoutbox واحد لكل القنوات
+- الـ rotation: مجموعة قنوات بتمشي على نفس الدورة وبتنشر نفس المنتج
+  .github/posting.json بيحدد القنوات وإزاي بتتقسم:
+    "rotation": "shared"        كل القنوات نفس المنتج ونفس الدورة
+    "rotation": "independent"   كل قناة دورتها واختيارها لوحدها
+    "rotation": {"twitter": ["twitter"], "fb_ig": ["facebook", "instagram"]}   مجموعات
+  (تغيير التقسيم بيبدأ دورة جديدة للـ rotation الجديد - التاريخ القديم بيفضل في السجل)
+
+الاستخدام:
+    python .github/scripts/runner.py
+    python .github/scripts/runner.py --channels twitter,instagram --rotation independent --batch 3
+"""
+
+import logging
+import json
+import os
+import sys
+from datetime import datetime
+
+import metrics
+from batch import parse_batch_args, run_batch, queue_path
+from channels import create_post_content, load_plugins, missing_credentials
+from image_health import broken_product_ids
+from outbox import Outbox, outbox_path, settle_jobs
+from product_store import load_catalog
+from publisher import publish_all
+from tracking import load_tracking, merge_log, migrate_legacy, select_next_product, tag_untagged
+
+log = logging.getLogger(__name__)
+
+TRACKING_FILE = 'posted_products.jsonl'
+CONFIG_FILE = os.path.join('.github', 'posting.json')
+SCRIPT_NAME = 'runner'
+DEFAULT_CONFIG = {
+    'channels': ['twitter'],
+    'rotation': {'twitter': ['twitter'], 'fb_ig': ['facebook', 'instagram']},
+}
+# سجل auto_post_fb_ig.py القديم - بيتدمج في السجل المشترك كـ rotation "fb_ig"
+LEGACY_FB_IG_FILE = 'posted_products_fb_ig.jsonl'
+
+# ========== الإعدادات ==========
+def load_config(path=CONFIG_FILE):
+    config = dict(DEFAULT_CONFIG)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            config.update(json.load(f))
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        log.warning(f"⚠️ فشل قراءة {path}: {e} - الإعدادات الافتراضية")
+    return config
+
+def rotation_groups(channels, rotation):
+    """{اسم الـ rotation: [القنوات]} - أي قناة مش في مجموعة بتبقى rotation لوحدها"""
+    if rotation == 'shared':
+        return {'shared': list(channels)}
+    if rotation == 'independent':
+        return {channel: [channel] for channel in channels}
+    groups = {}
+    for name, members in rotation.items():
+        members = [channel for channel in members if channel in channels]
+        if members:
+            groups[name] = members
+    grouped = {channel for members in groups.values() for channel in members}
+    for channel in channels:
+        if channel not in grouped:
+            groups[channel] = [channel]
+    return groups
+
+def migrate_logs(outbox):
+    """السجلات القديمة (سكربت لكل منصة) -> السجل المشترك - مرة واحدة"""
+    migrate_legacy(TRACKING_FILE, 'twitter')
+    tag_untagged(TRACKING_FILE, 'twitter')
+    migrate_legacy(LEGACY_FB_IG_FILE, 'fb_ig')
+    merge_log(TRACKING_FILE, LEGACY_FB_IG_FILE, 'fb_ig')
+    if os.path.exists(outbox_path(LEGACY_FB_IG_FILE)):
+        outbox.merge(outbox_path(LEGACY_FB_IG_FILE))
+
+# ========== نشر منتج واحد لـ rotation ==========
+def post_next(catalog, total, catalog_key, tracking, outbox, channels, skip=frozenset()):
+    """نشر المنتج التالي للـ rotation على قنواته بالتوازي - يرجع قائمة القنوات اللي نجحت
+    channels: {اسم القناة: دالة النشر}
+    المنشورات المعلقة في الـ outbox ليها الأولوية قبل اختيار منتج جديد
+    """
+    pending = outbox.pending(tracking['cycle'], catalog, channels)
+    if pending:
+        product_id, pending_channels = next(iter(pending.items()))
+        product, product_url = catalog[product_id], catalog[product_id]['url']
+        channels = {name: channels[name] for name in pending_channels}
+        log.info(f"\n🔁 استكمال منشور معلق من الـ outbox: {product.get('title', 'N/A')} ({', '.join(channels)})")
+    else:
+        with metrics.phase('selection'):
+            product, product_url = select_next_product(catalog, total, tracking, catalog_key, skip)
+        if not product:
+            log.error("❌ فشل اختيار المنتج")
+            return []
+    product_id = str(product.get('id'))
+
+    log.info(f"\n📦 المنتج: {product.get('title', 'N/A')} [{tracking['rotation']}: {', '.join(channels)}]")
+    log.info(f"🆔 ID: {product_id}")
+    log.info(f"🔗 الرابط: {product_url}")
+    log.info(f"🔢 الدورة: {tracking['cycle']}")
+    log.info(f"✅ تم نشر: {len(tracking['posted'])}/{total} منتج\n")
+
+    # مفتاح ثابت لكل منشور (منتج + قناة + دورة) - نفس النص في كل محاولة ولكل القنوات
+    jobs = {name: outbox.job(product_id, name, tracking['cycle']) for name in channels}
+    content = create_post_content(product, product_url)
+    text = next((job.step('text') for job in jobs.values() if job.step('text')), None)
+    if text:
+        content['text'] = text
+    for job in jobs.values():
+        if not job.step('text'):
+            job.checkpoint('text', content['text'])
+    log.info(f"\n📝 المحتوى:\n{content['text']}\n")
+
+    results = publish_all(content, channels, jobs)
+
+    # تحديث التتبع (سطر لكل قناة نجحت) - checkpoint بعد كل منشور
+    succeeded = settle_jobs(outbox, tracking, product_id, jobs, results)
+    if succeeded:
+        log.info(f"\n✅ تم تحديث التتبع ({tracking['rotation']}): {len(tracking['posted'])}/{total}")
+    for name in channels:
+        ok = name in succeeded
+        log.info(f"{'✅' if ok else '❌'} {name.capitalize()}: {'Success' if ok else 'Failed'}")
+    return succeeded
+
+# ========== البرنامج الرئيسي ==========
+def add_runner_args(parser):
+    parser.add_argument('--channels', default=None,
+                        help='القنوات مفصولة بفاصلة (افتراضياً من .github/posting.json)')
+    parser.add_argument('--rotation', choices=('shared', 'independent'), default=None,
+                        help='كل القنوات نفس المنتج (shared) أو كل قناة دورتها (independent)')
+
+def main(channels=None, script_name=SCRIPT_NAME):
+    """channels: القنوات الافتراضية للسكربتات القديمة (auto_post.py ...) بدل الإعدادات"""
+    args = parse_batch_args('Auto-post products to every configured channel', add_runner_args)
+
+    metrics.setup_logging()
+    config = load_config()
+    registry = load_plugins()
+    wanted = args.channels.split(',') if args.channels else channels or config['channels']
+    active = {}
+    for name in wanted:
+        if name not in registry:
+            log.error(f"❌ قناة مش معروفة: {name} (المتاح: {', '.join(sorted(registry))})")
+        elif missing_credentials(name):
+            log.warning(f"⏭️ {name}: مفاتيح ناقصة ({', '.join(missing_credentials(name))}) - القناة مش هتشتغل")
+        else:
+            active[name] = registry[name]['post']
+    groups = rotation_groups(list(active), args.rotation or config['rotation'])
+    metrics.set_info(script=script_name, channel=','.join(active), rotations=list(groups), batch=args.batch)
+
+    log.info("\n" + "="*50)
+    log.info(f"🚀 بدء النشر التلقائي: {', '.join(active) or '-'}")
+    log.info(f"📅 {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    log.info("="*50 + "\n")
+    if not active:
+        log.error("❌ مفيش ولا قناة جاهزة للنشر")
+        metrics.emit(args.metrics_history)
+        sys.exit(1)
+
+    # 1. تحميل الكتالوج من مخزن الكتالوج (mmap) - مرة واحدة لكل القنوات والدفعة كلها
+    with metrics.phase('catalog_load'):
+        catalog, total, catalog_key = load_catalog()
+    if not catalog:
+        log.error("❌ فشل تحميل الكتالوج")
+        metrics.emit(args.metrics_history)
+        sys.exit(1)
+    # المنتجات اللي صورتها مكسورة في آخر فحص (image_health.py) - الاختيار بيتخطاها
+    broken = broken_product_ids(catalog)
+    if broken:
+        log.info(f"🩺 {len(broken)} منتج صورته مكسورة - هيتخطوا في الاختيار")
+
+    # 2. التتبع: سجل واحد وحالة دورة لكل rotation
+    outbox = Outbox(outbox_path(TRACKING_FILE))
+    with metrics.phase('tracking_load'):
+        migrate_logs(outbox)
+        trackings = {name: load_tracking(TRACKING_FILE, name, rotation=name) for name in groups}
+
+    # 3. كل تشغيل (أو كل خطوة في الدفعة) بينشر منتج واحد لكل rotation
+    counts = {name: 0 for name in groups}
+
+    def post_once():
+        posted = False
+        for name, members in groups.items():
+            succeeded = post_next(catalog, total, catalog_key, trackings[name], outbox,
+                                  {channel: active[channel] for channel in members}, broken)
+            counts[name] += bool(succeeded)
+            posted = posted or bool(succeeded)
+        return posted
+
+    results = run_batch(post_once, args.batch, args.spacing, queue_path(TRACKING_FILE))
+
+    # 4. النتيجة
+    log.info("\n" + "="*50)
+    log.info("📊 النتيجة:")
+    for name, members in groups.items():
+        log.info(f"{'✅' if counts[name] == len(results) else '❌'} {name} ({', '.join(members)}): "
+                 f"{counts[name]}/{len(results)} Success")
+    log.info("="*50 + "\n")
+
+    # سطر JSON واحد بزمن كل مرحلة (ويتضاف لملف التاريخ لو محدد)
+    metrics.set_info(posted=sum(counts.values()), attempted=len(results) * len(groups))
+    metrics.emit(args.metrics_history)
+
+    # فشل إذا ما نجح أي منشور
+    if not any(results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
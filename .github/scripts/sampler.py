@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ترتيب الدورة بالأوزان: سحب من غير إرجاع على Fenwick trees
+- وزن المنتج من الخصم (price/sale_price) والمخزون (stock)
+- الفئة اللي لسه منشور منها منتج بيقل وزنها لـ CATEGORY_COOLDOWN سحبات (cooldown)
+  عشان نفس الفئة ما تطلعش كذا مرة ورا بعض
+- مستويين: Fenwick للفئات (وزن الفئة = مجموع أوزان منتجاتها الباقية) و Fenwick لكل فئة
+  فالسحب والشيل والـ cooldown كلهم O(log n)
+- الأوزان أرقام صحيحة (مش float) - نفس الـ seed = نفس الترتيب على أي جهاز
+
+كل منتج بيتسحب مرة واحدة بس - الترتيب الناتج فيه كل المنتجات، فضمان الدورة
+(ما فيش تكرار قبل ما الدورة تخلص) هو هو - شوف tracking.cycle_order
+"""
+
+import random
+
+# الوزن الأساسي لمنتج من غير خصم ومخزونه كويس
+WEIGHT_SCALE = 100
+# 40% خصم = الوزن × 1.8
+DISCOUNT_BOOST = 2
+# المخزون: صفر = نادراً ما يطلع بدري، قليل = نص الوزن، مش معروف = وزن عادي
+OUT_OF_STOCK_FACTOR = 0.05
+LOW_STOCK = 5
+LOW_STOCK_FACTOR = 0.5
+# الفئة بعد ما يتنشر منها منتج وزنها بيتقسم على COOLDOWN_DIVISOR لعدد السحبات ده
+# (cooldown أطول بيأخر الفئة الكبيرة لآخر الدورة فتتكرر ورا بعض هناك - على الكتالوج الحالي
+#  1 سحبة قللت التكرار ورا بعض من ~284 لـ ~161 في الدورة، و3 سحبات ~265 بس)
+CATEGORY_COOLDOWN = 1
+COOLDOWN_DIVISOR = 10
+
+# ========== الوزن ==========
+def discount(product):
+    """نسبة الخصم 0..1 (صفر لو مفيش sale_price أقل من السعر)"""
+    price, sale_price = product.get('price'), product.get('sale_price')
+    try:
+        if price and sale_price and 0 <= sale_price < price:
+            return (price - sale_price) / price
+    except TypeError:
+        pass
+    return 0.0
+
+def product_weight(product):
+    """وزن المنتج (رقم صحيح >= 1)"""
+    stock = product.get('stock')
+    if stock is None:
+        stock_factor = 1.0
+    elif stock <= 0:
+        stock_factor = OUT_OF_STOCK_FACTOR
+    elif stock < LOW_STOCK:
+        stock_factor = LOW_STOCK_FACTOR
+    else:
+        stock_factor = 1.0
+    return max(1, round(WEIGHT_SCALE * (1 + DISCOUNT_BOOST * discount(product)) * stock_factor))
+
+# ========== Fenwick tree ==========
+class FenwickTree:
+    """مجاميع جزئية لأوزان صحيحة - تعديل وزن وإيجاد العنصر لقيمة عشوائية O(log n)"""
+
+    __slots__ = ('tree', 'weights', 'total', 'top')
+
+    def __init__(self, weights):
+        self.weights = list(weights)
+        size = len(self.weights)
+        tree = [0] + self.weights
+        # بناء O(n)
+        for i in range(1, size + 1):
+            parent = i + (i & -i)
+            if parent <= size:
+                tree[parent] += tree[i]
+        self.tree = tree
+        self.total = sum(self.weights)
+        self.top = 1 << (size.bit_length() - 1) if size else 0
+
+    def update(self, index, weight):
+        delta = weight - self.weights[index]
+        if not delta:
+            return
+        self.weights[index] = weight
+        self.total += delta
+        tree, size = self.tree, len(self.weights)
+        i = index + 1
+        while i <= size:
+            tree[i] += delta
+            i += i & -i
+
+    def find(self, value):
+        """أول index مجموع الأوزان لحد عنده أكبر من value (0 <= value < total)"""
+        tree, size = self.tree, len(self.weights)
+        position, step = 0, self.top
+        while step:
+            following = position + step
+            if following <= size and tree[following] <= value:
+                position = following
+                value -= tree[following]
+            step >>= 1
+        return position
+
+# ========== السحب ==========
+class WeightedSampler:
+    """سحب منتجات من غير إرجاع بالأوزان مع cooldown للفئة"""
+
+    def __init__(self, items, rng):
+        """items: (product_id, category, weight) - rng: random.Random"""
+        groups = {}
+        for product_id, category, weight in items:
+            ids, weights = groups.setdefault(category or '', ([], []))
+            ids.append(product_id)
+            weights.append(weight)
+        self.categories = sorted(groups)
+        self.ids = [groups[c][0] for c in self.categories]
+        self.trees = [FenwickTree(groups[c][1]) for c in self.categories]
+        self.category_tree = FenwickTree(tree.total for tree in self.trees)
+        self.cooling = {}
+        self.rng = rng
+
+    def category_weight(self, category):
+        total = self.trees[category].total
+        if category in self.cooling and total:
+            return max(1, total // COOLDOWN_DIVISOR)
+        return total
+
+    def draw(self):
+        """المنتج التالي (بيتشال من السحب) - None لو خلصوا"""
+        if not self.category_tree.total:
+            return None
+        category = self.category_tree.find(self.rng.randrange(self.category_tree.total))
+        tree = self.trees[category]
+        index = tree.find(self.rng.randrange(tree.total))
+        tree.update(index, 0)
+
+        # الفئات اللي خلص الـ cooldown بتاعها ترجع لوزنها الكامل
+        for cooled in list(self.cooling):
+            self.cooling[cooled] -= 1
+            if not self.cooling[cooled]:
+                del self.cooling[cooled]
+                self.category_tree.update(cooled, self.category_weight(cooled))
+        self.cooling[category] = CATEGORY_COOLDOWN
+        self.category_tree.update(category, self.category_weight(category))
+        return self.ids[category][index]
+
+def weighted_order(product_ids, catalog, seed):
+    """ترتيب الدورة بالأوزان - نفس المنتجات + نفس الـ seed + نفس الأوزان = نفس الترتيب
+    catalog: product_id -> {price, sale_price, stock, category, ...}
+    """
+    items = []
+    for product_id in sorted(product_ids, key=int):
+        product = catalog[product_id]
+        items.append((product_id, product.get('category'), product_weight(product)))
+    sampler = WeightedSampler(items, random.Random(seed))
+    return [sampler.draw() for _ in range(len(items))]
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+فهرس البحث (inverted index) للصفحة الرئيسية - بيتبني وقت الـ build
+- تطبيع عربي: التشكيل والتطويل بيتشالوا، أ إ آ ٱ -> ا، ى -> ي، ة -> ه، ؤ -> و، ئ -> ي
+- كل كلمة بتتفهرس كمان من غير "ال" (والمتصل بيها و/ب/ك/ف/لل) عشان "مساج" تلاقي "المساج"
+- البحث بالبادئة (prefix): "ساع" تلاقي "ساعة" و"ساعات"
+- الكلمات مترتبة ومقسمة على shards بالمدى - الـ manifest فيه أول كلمة في كل shard
+  فالمتصفح بيحمل shard واحد (أو اتنين) لكل كلمة في البحث مهما كبر الكتالوج
+
+data/search/manifest.json            {"version", "total", "shards": [[أول كلمة, اسم الملف], ...]}
+data/search/terms-0000.<hash>.json   {"terms": [...], "postings": [[...], ...]}
+
+الـ postings هي ترتيب المنتج في products.json (= ترتيبه في data/listing)
+متخزنة كفروق (delta) والأرقام السالبة معناها -k منتج متتالي بعد اللي قبله
+مثال: [0, -3, 10] = [0, 1, 2, 3, 13]
+
+الاستخدام (تجربة البحث من سطر الأوامر):
+    python .github/scripts/search_index.py "ساعه رولكس"
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+from bisect import bisect_left, bisect_right
+
+log = logging.getLogger(__name__)
+
+SEARCH_DIR = os.path.join('data', 'search')
+SEARCH_MANIFEST = os.path.join(SEARCH_DIR, 'manifest.json')
+SEARCH_VERSION = 1
+# عدد الكلمات في كل shard
+DEFAULT_SHARD_TERMS = 2000
+# الحقول اللي بيدور فيها البحث (نفس searchProducts القديمة)
+SEARCH_FIELDS = ('title', 'description', 'category')
+
+# ========== التطبيع ==========
+DIACRITICS = re.compile('[\u064B-\u065F\u0670\u0640]')
+# str.translate بيمشي في المسار البطيء لما الحروف الناتجة مش ASCII
+# سلسلة replace على الحروف الموجودة فعلاً أسرع بحوالي 10 مرات
+FOLD = [('أ', 'ا'), ('إ', 'ا'), ('آ', 'ا'), ('ٱ', 'ا'), ('ى', 'ي'), ('ة', 'ه'), ('ؤ', 'و'), ('ئ', 'ي')]
+FOLD += [(chr(0x0660 + d), str(d)) for d in range(10)] + [(chr(0x06F0 + d), str(d)) for d in range(10)]
+TOKEN_SPLIT = re.compile('[^\u0621-\u064Aa-z0-9]+')
+# أداة التعريف في أول الكلمة - بشرط يفضل بعدها حرفين على الأقل
+ARTICLE = re.compile('^(?:وال|بال|كال|فال|لل|ال)(?=..)')
+
+def normalize(text):
+    """نفس normalizeArabic() في index.html"""
+    text = DIACRITICS.sub('', text.lower())
+    for old, new in FOLD:
+        if old in text:
+            text = text.replace(old, new)
+    return text
+
+def strip_article(token):
+    return ARTICLE.sub('', token)
+
+# نفس الكلمات بتتكرر في كل المنتجات (الوصف شبه ثابت) - كاش لنتيجة strip_article
+_stripped = {}
+
+def tokenize(text):
+    """الكلمات المطبّعة في النص (من غير تكرار)"""
+    tokens = set(TOKEN_SPLIT.split(normalize(text)))
+    tokens.discard('')
+    stems = set()
+    for token in tokens:
+        stem = _stripped.get(token)
+        if stem is None:
+            stem = _stripped[token] = strip_article(token)
+        stems.add(stem)
+    return tokens | stems
+
+# ========== ضغط الـ postings ==========
+def encode_postings(positions):
+    """[0, 1, 2, 3, 13] -> [0, -3, 10] (positions مترتبة تصاعدياً)"""
+    out = []
+    previous = None
+    for position in positions:
+        if previous is None:
+            out.append(position)
+        elif position == previous + 1 and out and out[-1] < 0 and len(out) > 1:
+            out[-1] -= 1
+        elif position == previous + 1:
+            out.append(-1)
+        else:
+            out.append(position - previous)
+        previous = position
+    return out
+
+def decode_postings(encoded):
+    positions = []
+    current = None
+    for value in encoded:
+        if current is None:
+            current = value
+            positions.append(current)
+        elif value < 0:
+            positions.extend(range(current + 1, current + 1 - value))
+            current -= value
+        else:
+            current += value
+            positions.append(current)
+    return positions
+
+# ========== البناء ==========
+def build_terms(products):
+    """term -> [positions] بترتيب المنتجات"""
+    index = {}
+    for position, product in enumerate(products):
+        text = ' '.join(str(product.get(field) or '') for field in SEARCH_FIELDS)
+        for term in tokenize(text):
+            index.setdefault(term, []).append(position)
+    return index
+
+def iter_shards(index, shard_terms):
+    """(أول كلمة, اسم الملف, المحتوى) لكل shard"""
+    terms = sorted(index)
+    for number, start in enumerate(range(0, len(terms), shard_terms)):
+        chunk = terms[start:start + shard_terms]
+        text = json.dumps({
+            'terms': chunk,
+            'postings': [encode_postings(index[term]) for term in chunk],
+        }, ensure_ascii=False, separators=(',', ':')) + '\n'
+        digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:10]
+        yield chunk[0], f"terms-{number:04d}.{digest}.json", text
+
+def build_search_index(products, shard_terms=DEFAULT_SHARD_TERMS, dry_run=False):
+    """كتابة shards الفهرس + الـ manifest - يرجع (عدد الكلمات, عدد الـ shards, عدد اللي اتكتب)"""
+    index = build_terms(products)
+    shards = list(iter_shards(index, shard_terms))
+    names = [name for _, name, _ in shards]
+    existing = {os.path.basename(path) for path in glob.glob(os.path.join(SEARCH_DIR, 'terms-*.json'))}
+    changed = [(name, text) for _, name, text in shards if name not in existing]
+    stale = existing - set(names)
+
+    if not dry_run:
+        os.makedirs(SEARCH_DIR, exist_ok=True)
+        for name, text in changed:
+            with open(os.path.join(SEARCH_DIR, name), 'w', encoding='utf-8') as f:
+                f.write(text)
+        manifest = {
+            'version': SEARCH_VERSION,
+            'total': len(products),
+            'shards': [[first, name] for first, name, _ in shards],
+        }
+        tmp_path = SEARCH_MANIFEST + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+            f.write('\n')
+        os.replace(tmp_path, SEARCH_MANIFEST)
+        for name in stale:
+            os.remove(os.path.join(SEARCH_DIR, name))
+
+    size = sum(len(text.encode('utf-8')) for _, _, text in shards)
+    log.info(f"🔎 فهرس البحث: {len(index)} كلمة في {len(shards)} shard ({size // 1024} KB) - "
+             f"{len(changed)} اتكتب، {len(stale)} اتحذف")
+    return len(index), len(shards), len(changed)
+
+# ========== البحث (نفس منطق index.html) ==========
+class SearchIndex:
+    """قراءة الفهرس من الديسك بنفس طريقة المتصفح: manifest ثم الـ shards المطلوبة بس"""
+
+    def __init__(self, directory=SEARCH_DIR):
+        self.directory = directory
+        with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.firsts = [first for first, _ in self.manifest['shards']]
+        self.shards = {}
+
+    def shard(self, number):
+        if number not in self.shards:
+            name = self.manifest['shards'][number][1]
+            with open(os.path.join(self.directory, name), 'r', encoding='utf-8') as f:
+                self.shards[number] = json.load(f)
+        return self.shards[number]
+
+    def prefix_postings(self, prefix):
+        """postings (tuples مترتبة) لكل كلمة في الفهرس بتبدأ بـ prefix"""
+        # الـ shards اللي ممكن يكون فيها كلمات في المدى [prefix, prefix + '\uffff')
+        first = max(0, bisect_right(self.firsts, prefix) - 1)
+        last = max(0, bisect_right(self.firsts, prefix + '\uffff') - 1)
+        found = []
+        for number in range(first, last + 1):
+            shard = self.shard(number)
+            terms = shard['terms']
+            low = bisect_left(terms, prefix)
+            high = bisect_left(terms, prefix + '\uffff')
+            postings = shard['postings']
+            for i in range(low, high):
+                # فك الضغط مرة واحدة لكل كلمة - البحث اللي بعده بيستخدم النتيجة على طول
+                if not isinstance(postings[i], tuple):
+                    postings[i] = tuple(decode_postings(postings[i]))
+                found.append(postings[i])
+        return found
+
+    def search(self, query):
+        """ترتيب المنتجات (positions) اللي فيها كل كلمات البحث"""
+        tokens = {strip_article(token) for token in TOKEN_SPLIT.split(normalize(query)) if token}
+        groups = [self.prefix_postings(token) for token in tokens]
+        if not groups or not all(groups):
+            return []
+        # كلمة واحدة طابقت كلمة واحدة في الفهرس: الـ postings نفسها مترتبة - من غير set ولا sort
+        if len(groups) == 1 and len(groups[0]) == 1:
+            return list(groups[0][0])
+        candidates = sorted((group[0] if len(group) == 1 else set().union(*group) for group in groups), key=len)
+        # التقاطع يبدأ من أصغر مجموعة
+        result = set(candidates[0])
+        for other in candidates[1:]:
+            result.intersection_update(other)
+            if not result:
+                return []
+        return sorted(result)
+
+def main():
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    from catalog import load_products
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+    products = load_products()
+    positions = SearchIndex().search(' '.join(sys.argv[1:]))
+    print(f"🔎 {len(positions)} نتيجة")
+    for position in positions[:20]:
+        print(f"   {products[position].get('id'):>5}  {products[position].get('title')}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+مولّد sitemap.xml من products.json + manifest صفحات المنتجات
+- الـ lastmod لكل منتج جاي من hash محتواه: بيتغير بس لما المنتج نفسه يتغير
+  (أول تشغيل بياخد التاريخ المكتوب في الـ sitemap القديم عشان ما يبانش إن كل حاجة اتغيرت)
+- لو الروابط عدّت MAX_URLS أو الملف عدّى MAX_BYTES (حدود بروتوكول sitemaps)
+  sitemap.xml بيبقى sitemapindex بيشاور على sitemap-products-N.xml
+- كل shard ليه بصمة في الـ state: الملف بيتكتب بس لو فيه منتج اتغير
+- الكتابة streaming: shard واحد في الذاكرة في المرة
+
+.github/sitemap-state.json   {"version", "home": [hash, lastmod], "products": {id: [hash, lastmod]},
+                              "shards": {filename: digest}}
+"""
+
+import glob
+import hashlib
+import json
+import logging
+import os
+import xml.etree.ElementTree as ET
+from datetime import date
+from itertools import chain
+from xml.sax.saxutils import escape
+
+from catalog import SITE_URL, SITEMAP_FILE, SITEMAP_NS
+
+log = logging.getLogger(__name__)
+
+STATE_FILE = os.path.join('.github', 'sitemap-state.json')
+STATE_VERSION = 1
+SHARD_PATTERN = 'sitemap-products-*.xml'
+# حدود بروتوكول sitemaps لكل ملف
+MAX_URLS = 50000
+MAX_BYTES = 50 * 1024 * 1024
+
+# نفس شكل sitemap.xml الأصلي (BOM + CRLF)
+BOM = '﻿'
+NEWLINE = '\r\n'
+URLSET_HEAD = (f'{BOM}<?xml version="1.0" encoding="UTF-8"?>{NEWLINE}'
+               f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{NEWLINE}')
+URLSET_TAIL = f'</urlset>{NEWLINE}'
+INDEX_HEAD = (f'{BOM}<?xml version="1.0" encoding="UTF-8"?>{NEWLINE}'
+              f'<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{NEWLINE}')
+INDEX_TAIL = f'</sitemapindex>{NEWLINE}'
+
+# ========== الـ state ==========
+def load_state():
+    try:
+        with open(STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get('version') == STATE_VERSION:
+            return state
+    except (OSError, ValueError):
+        pass
+    return {'version': STATE_VERSION, 'home': None, 'products': {}, 'shards': {}}
+
+def save_state(state):
+    tmp_path = STATE_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write('\n')
+    os.replace(tmp_path, STATE_FILE)
+
+def read_lastmods(path=SITEMAP_FILE):
+    """loc -> lastmod من الـ sitemap الحالي (وملفاته الفرعية) - لأول تشغيل من غير state"""
+    lastmods = {}
+    if not os.path.exists(path):
+        return lastmods
+    try:
+        for _, elem in ET.iterparse(path):
+            if elem.tag == SITEMAP_NS + 'sitemap':
+                child = os.path.join(os.path.dirname(path),
+                                     elem.findtext(SITEMAP_NS + 'loc', '').rstrip('/').rsplit('/', 1)[-1])
+                if child != path:
+                    lastmods.update(read_lastmods(child))
+                elem.clear()
+            elif elem.tag == SITEMAP_NS + 'url':
+                loc = (elem.findtext(SITEMAP_NS + 'loc') or '').strip()
+                lastmod = (elem.findtext(SITEMAP_NS + 'lastmod') or '').strip()
+                if loc and lastmod:
+                    lastmods[loc] = lastmod
+                elem.clear()
+    except ET.ParseError as e:
+        log.warning(f"⚠️ مش قادر أقرأ {path}: {e}")
+    return lastmods
+
+def resolve_lastmod(previous, digest, loc, seed, today):
+    """[hash, lastmod] للرابط: نفس التاريخ لو الـ hash ما اتغيرش، والنهارده لو اتغير"""
+    if previous and previous[0] == digest:
+        return previous
+    if previous is None and loc in seed:
+        return [digest, seed[loc]]
+    return [digest, today]
+
+# ========== الروابط ==========
+def url_entry(loc, lastmod, changefreq, priority, comment=None):
+    lines = [f'  <!-- {comment} -->'] if comment else []
+    lines += [
+        '  <url>',
+        f'    <loc>{escape(loc)}</loc>',
+        f'    <lastmod>{lastmod}</lastmod>',
+        f'    <changefreq>{changefreq}</changefreq>',
+        f'    <priority>{priority}</priority>',
+        '  </url>',
+    ]
+    return NEWLINE.join(lines) + NEWLINE
+
+def iter_entries(products, pages, urls, state, seed, today):
+    """(النص, lastmod) لكل رابط بالترتيب: الصفحة الرئيسية ثم المنتجات بترتيب products.json
+    الصفحة الرئيسية بتتغير مع أي تغيير في القائمة - الـ hash بتاعها من hashes كل المنتجات
+    """
+    home_hash = hashlib.sha256()
+    for product in products:
+        home_hash.update(pages[str(product.get('id'))][1].encode('utf-8'))
+    home = resolve_lastmod(state['home'], home_hash.hexdigest()[:16], SITE_URL, seed, today)
+    state['home'] = home
+    yield url_entry(SITE_URL, home[1], 'daily', '1.0', comment='الصفحة الرئيسية'), home[1]
+
+    previous = state['products']
+    current = {}
+    for product in products:
+        product_id = str(product.get('id'))
+        digest = pages[product_id][1]
+        loc = SITE_URL + urls[product_id][0]
+        current[product_id] = resolve_lastmod(previous.get(product_id), digest, loc, seed, today)
+        yield url_entry(loc, current[product_id][1], 'weekly', '0.8'), current[product_id][1]
+    state['products'] = current
+
+def plan_shards(entries, max_urls, max_bytes):
+    """تقسيم الروابط على shards - يطلع (النصوص, أحدث lastmod) لكل shard
+    shard واحد بس في الذاكرة في المرة (لحد MAX_URLS رابط)
+    """
+    limit = max_bytes - len((URLSET_HEAD + URLSET_TAIL).encode('utf-8'))
+    chunk, size, newest = [], 0, ''
+    for text, lastmod in entries:
+        length = len(text.encode('utf-8'))
+        if chunk and (len(chunk) >= max_urls or size + length > limit):
+            yield chunk, newest
+            chunk, size, newest = [], 0, ''
+        chunk.append(text)
+        size += length
+        newest = max(newest, lastmod)
+    if chunk:
+        yield chunk, newest
+
+def shard_digest(chunk):
+    h = hashlib.sha256()
+    for text in chunk:
+        h.update(text.encode('utf-8'))
+    return h.hexdigest()[:16]
+
+# ========== الكتابة ==========
+def write_streaming(path, head, parts, tail):
+    """كتابة الملف جزء جزء في ملف مؤقت ثم rename"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        f.write(head)
+        for part in parts:
+            f.write(part)
+        f.write(tail)
+    os.replace(tmp_path, path)
+
+def build_sitemap(products, pages, urls, max_urls=MAX_URLS, max_bytes=MAX_BYTES, dry_run=False):
+    """كتابة sitemap.xml (أو sitemapindex + shards) - يرجع (عدد الروابط, عدد الـ shards, عدد اللي اتكتب)
+    pages: product_id -> [filename, hash] من manifest صفحات المنتجات، urls: product_id -> [path, url]
+    """
+    state = load_state()
+    # أول تشغيل: التواريخ من الـ sitemap الموجود
+    seed = read_lastmods() if not state['products'] else {}
+    today = date.today().isoformat()
+    base_dir = os.path.dirname(SITEMAP_FILE)
+
+    chunks = plan_shards(iter_entries(products, pages, urls, state, seed, today), max_urls, max_bytes)
+    first = next(chunks, None)
+    second = next(chunks, None)
+    written = []
+    digests = {}
+
+    if second is None:
+        # ملف واحد: sitemap.xml نفسه هو الـ urlset
+        chunk, _ = first
+        digest = shard_digest(chunk)
+        digests[SITEMAP_FILE] = digest
+        if state['shards'].get(SITEMAP_FILE) != digest or not os.path.exists(SITEMAP_FILE):
+            written.append(SITEMAP_FILE)
+            if not dry_run:
+                write_streaming(SITEMAP_FILE, URLSET_HEAD, chunk, URLSET_TAIL)
+        count = len(chunk)
+    else:
+        index = []
+        count = 0
+        for number, (chunk, newest) in enumerate(chain([first, second], chunks), 1):
+            name = f'sitemap-products-{number}.xml'
+            path = os.path.join(base_dir, name)
+            digest = shard_digest(chunk)
+            digests[name] = digest
+            count += len(chunk)
+            index.append(f'  <sitemap>{NEWLINE}    <loc>{escape(SITE_URL + name)}</loc>{NEWLINE}'
+                         f'    <lastmod>{newest}</lastmod>{NEWLINE}  </sitemap>{NEWLINE}')
+            if state['shards'].get(name) != digest or not os.path.exists(path):
+                written.append(name)
+                if not dry_run:
+                    write_streaming(path, URLSET_HEAD, chunk, URLSET_TAIL)
+        digest = shard_digest(index)
+        digests[SITEMAP_FILE] = digest
+        if state['shards'].get(SITEMAP_FILE) != digest or written:
+            written.append(SITEMAP_FILE)
+            if not dry_run:
+                write_streaming(SITEMAP_FILE, INDEX_HEAD, index, INDEX_TAIL)
+
+    # shards زيادة من تشغيل قبل كده (الكتالوج صغر أو رجع لملف واحد)
+    stale = [path for path in glob.glob(os.path.join(base_dir, SHARD_PATTERN))
+             if os.path.basename(path) not in digests]
+    if not dry_run:
+        for path in stale:
+            os.remove(path)
+        state['shards'] = digests
+        save_state(state)
+
+    shards = max(1, len(digests) - 1)
+    log.info(f"🗺️ sitemap: {count} رابط في {shards} ملف - {len(written)} اتكتب، {len(stale)} اتحذف")
+    return count, shards, len(written)
@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+نظام التتبع واختيار المنتج التالي
+كل دورة ليها ترتيب عشوائي ثابت (seed) للمنتجات + مؤشر cursor
+الترتيب بالأوزان: الخصم والمخزون بيقدموا المنتج، ونفس الفئة ما تتكررش ورا بعض (شوف sampler.py)
+الاختيار O(1) من غير ما نلف على كل المنتجات، والترتيب ممكن يتعاد من الـ seed للتصحيح
+
+التتبع محفوظ كسجل append-only (سطر JSON لكل حدث):
+    {"type": "order", "cycle": 2, "seed": ..., "catalog_key": ..., "order": [...]}
+    {"type": "post", "id": "75", "channel": "twitter", "cycle": 2, "ts": ..., "remote_id": ...}
+    {"type": "defer", "id": "75", "cycle": 2}
+    {"type": "summary", "cycle": 1, "posts": 882, ...}   (بعد ضغط الدورات القديمة)
+
+أكتر من rotation (دورة مستقلة) ممكن يتشاركوا نفس السجل: كل سطر فيه "rotation"
+وكل rotation ليه دورته وترتيبه وضغطه لوحده (شوف runner.py)
+
+الاستخدام (إعادة عرض ترتيب الدورة الحالية):
+    python .github/scripts/tracking.py posted_products.jsonl --show 10
+"""
+
+import logging
+import json
+import os
+import random
+import argparse
+from datetime import datetime, timezone
+
+from sampler import WEIGHT_SCALE, product_weight, weighted_order
+
+log = logging.getLogger(__name__)
+
+# عدد الدورات المنتهية اللي تفضل كاملة في السجل قبل ما تتضغط لسطر ملخص
+KEEP_FINISHED_CYCLES = 1
+
+# ========== مجموعة المنتجات المنشورة (bitset) ==========
+class PostedIds:
+    """مجموعة IDs منشورة على شكل bitset - بت واحد لكل منتج"""
+
+    __slots__ = ('bits', 'count')
+
+    def __init__(self):
+        self.bits = bytearray()
+        self.count = 0
+
+    def add(self, product_id):
+        n = int(product_id)
+        byte, bit = n >> 3, n & 7
+        if byte >= len(self.bits):
+            self.bits.extend(bytes(byte - len(self.bits) + 1))
+        if not self.bits[byte] & (1 << bit):
+            self.bits[byte] |= 1 << bit
+            self.count += 1
+
+    def __contains__(self, product_id):
+        n = int(product_id)
+        byte = n >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (n & 7)))
+
+    def __len__(self):
+        return self.count
+
+# ========== ترتيب الدورة ==========
+def cycle_order(product_ids, seed, catalog):
+    """ترتيب عشوائي بالأوزان قابل للإعادة: نفس المنتجات + نفس الـ seed + نفس الأوزان = نفس الترتيب"""
+    return weighted_order(product_ids, catalog, seed)
+
+def splice_position(seed, product_id, low, high, weight=WEIGHT_SCALE):
+    """مكان ثابت لإدخال منتج جديد في نص الدورة (بين low و high) بنفس أوزان sampler.py
+    u^(weight/WEIGHT_SCALE): الوزن العادي مكانه عشوائي منتظم، الأتقل (خصم) أقرب للـ cursor
+    في المتوسط والأخف (مخزون صفر) قرب آخر الدورة
+    """
+    fraction = random.Random(f"{seed}:{product_id}").random() ** (weight / WEIGHT_SCALE)
+    return low + min(high - low, int(fraction * (high - low + 1)))
+
+def start_cycle(tracking, catalog, catalog_key, cycle, seed=None):
+    """بدء دورة جديدة بترتيب عشوائي لكل المنتجات المؤهلة"""
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    posted = tracking['posted']
+    eligible = [product_id for product_id in catalog if product_id not in posted]
+    tracking.update({
+        'cycle': cycle,
+        'seed': seed,
+        'order': cycle_order(eligible, seed, catalog),
+        'cursor': 0,
+        'catalog_key': catalog_key,
+    })
+    append_order(tracking)
+
+def reconcile_catalog(tracking, catalog, catalog_key):
+    """تحديث ترتيب الدورة لما الكتالوج يتغير في نصها
+    المنتجات الجديدة تدخل في أماكن ثابتة (حسب وزنها) بعد الـ cursor والمحذوفة تطلع - من غير إعادة خلط
+    """
+    if tracking.get('catalog_key') == catalog_key:
+        return
+    order = tracking['order']
+    cursor = tracking['cursor']
+    posted = tracking['posted']
+    known = set(order)
+
+    remaining = [product_id for product_id in order[cursor:] if product_id in catalog]
+    removed = len(order) - cursor - len(remaining)
+    added = sorted((product_id for product_id in catalog
+                    if product_id not in known and product_id not in posted), key=int)
+    for product_id in added:
+        position = splice_position(tracking['seed'], product_id, 0, len(remaining),
+                                   product_weight(catalog[product_id]))
+        remaining.insert(position, product_id)
+
+    # الترتيب الباقي بيتسجل كسطر order جديد والـ cursor يبدأ من أوله
+    tracking['order'] = remaining
+    tracking['cursor'] = 0
+    tracking['catalog_key'] = catalog_key
+    append_order(tracking)
+    if added or removed:
+        log.info(f"🧩 تحديث الدورة: +{len(added)} منتج جديد، -{removed} منتج محذوف")
+
+# ========== سجل التتبع (append-only) ==========
+def now_iso():
+    return datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def encode_record(record):
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def append_record(path, record):
+    """إضافة سطر واحد للسجل بكتابة واحدة + fsync
+    لو العملية وقفت في النص السطر الناقص بيتجاهل وقت القراءة - والسطر الجديد بيبدأ بـ \n
+    عشان ما يلزقش في الحتة الناقصة ويضيع معاها
+    """
+    data = encode_record(record).encode('utf-8')
+    fd = os.open(path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b'\n':
+            data = b'\n' + data
+        view = memoryview(data)
+        while view:
+            # os.write ممكن يكتب جزء بس - نكمل الباقي
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def write_records_atomic(path, records):
+    """إعادة كتابة السجل كامل (ملف مؤقت ثم rename) - للضغط والترحيل"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for record in records:
+            f.write(encode_record(record))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def read_records(path):
+    """قراءة السجل سطر بسطر مع تجاهل أي سطر ناقص أو تالف"""
+    records = []
+    # سطر اتقطع في نص حرف عربي ما يوقفش القراءة - بيبقى JSON تالف ويتجاهل
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                break
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    return records
+
+def append_tracking_record(tracking, record):
+    """سطر جديد في السجل باسم الـ rotation بتاع التتبع ده (لو فيه)"""
+    if tracking.get('rotation') is not None:
+        record['rotation'] = tracking['rotation']
+    append_record(tracking['path'], record)
+
+def append_order(tracking):
+    append_tracking_record(tracking, {
+        'type': 'order',
+        'cycle': tracking['cycle'],
+        'seed': tracking['seed'],
+        'catalog_key': tracking['catalog_key'],
+        'order': tracking['order'],
+    })
+
+# ========== ترحيل ملفات JSON القديمة ==========
+def legacy_path(path):
+    """posted_products.jsonl -> posted_products.json"""
+    return os.path.splitext(path)[0] + '.json'
+
+def migrate_legacy(path, channel):
+    """تحويل posted_products*.json القديم (قائمة posted) لسجل append-only"""
+    old_path = legacy_path(path)
+    if os.path.exists(path) or not os.path.exists(old_path):
+        return
+    try:
+        with open(old_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except Exception as e:
+        log.warning(f"⚠️ فشل قراءة ملف التتبع القديم {old_path}: {e}")
+        return
+
+    cycle = data.get('cycle', 1)
+    records = []
+    if 'order' in data and 'seed' in data:
+        records.append({'type': 'order', 'cycle': cycle, 'seed': data['seed'],
+                        'catalog_key': data.get('catalog_key'), 'order': data['order']})
+    for product_id in data.get('posted', []):
+        records.append({'type': 'post', 'id': str(product_id), 'channel': channel,
+                        'cycle': cycle, 'ts': None, 'remote_id': None})
+    write_records_atomic(path, records)
+    os.remove(old_path)
+    log.info(f"📦 تم ترحيل {old_path} -> {path} ({len(data.get('posted', []))} منتج)")
+
+def merge_log(path, other_path, rotation):
+    """نقل سجل تتبع تاني (قديم) جوه السجل ده باسم rotation - وبعدين بيتمسح"""
+    if not os.path.exists(other_path):
+        return
+    records = read_records(path) if os.path.exists(path) else []
+    imported = [dict(record, rotation=rotation) for record in read_records(other_path)]
+    write_records_atomic(path, records + imported)
+    os.remove(other_path)
+    log.info(f"📦 تم دمج {other_path} في {path} كـ rotation {rotation} ({len(imported)} سطر)")
+
+def tag_untagged(path, rotation):
+    """السطور القديمة اللي من غير rotation بتاخد الاسم ده (مرة واحدة)"""
+    if not os.path.exists(path):
+        return
+    records = read_records(path)
+    if all('rotation' in record for record in records):
+        return
+    write_records_atomic(path, [record if 'rotation' in record else dict(record, rotation=rotation)
+                                for record in records])
+    log.info(f"🏷️ سطور {path} القديمة اتسجلت باسم rotation {rotation}")
+
+# ========== نظام التتبع ==========
+def replay(records, rotation=None):
+    """بناء حالة التتبع من السجل (سطور الـ rotation ده بس)"""
+    tracking = {'cycle': 1, 'posted': PostedIds()}
+    for record in records:
+        if record.get('rotation') != rotation:
+            continue
+        kind = record.get('type')
+        cycle = record.get('cycle', 1)
+        if cycle > tracking['cycle']:
+            # دورة جديدة - منشورات الدورة القديمة ما تتحسبش
+            tracking['cycle'] = cycle
+            tracking['posted'] = PostedIds()
+            tracking.pop('order', None)
+        elif cycle < tracking['cycle']:
+            continue
+        if kind == 'order':
+            tracking.update({'seed': record['seed'], 'catalog_key': record.get('catalog_key'),
+                             'order': list(record['order'])})
+        elif kind == 'post':
+            tracking['posted'].add(record['id'])
+        elif kind == 'defer' and 'order' in tracking:
+            order = tracking['order']
+            if record['id'] in order:
+                order.remove(record['id'])
+                order.append(record['id'])
+
+    if 'order' in tracking:
+        # المنشورات بتمشي بترتيب الدورة - الـ cursor هو أول منتج لسه ما اتنشرش
+        order, posted = tracking['order'], tracking['posted']
+        cursor = 0
+        while cursor < len(order) and order[cursor] in posted:
+            cursor += 1
+        tracking['cursor'] = cursor
+    return tracking
+
+def load_tracking(path, channel, rotation=None):
+    """تحميل التتبع من السجل (مع ترحيل ملف JSON القديم أول مرة)
+    rotation: اسم الدورة في سجل مشترك بين أكتر من rotation (None = السجل كله ليه)
+    """
+    migrate_legacy(path, channel)
+    records = []
+    if os.path.exists(path):
+        try:
+            records = read_records(path)
+        except Exception as e:
+            log.warning(f"⚠️ فشل قراءة ملف التتبع: {e}")
+    tracking = replay(records, rotation)
+    tracking['path'] = path
+    tracking['channel'] = channel
+    tracking['rotation'] = rotation
+    name = f" ({rotation})" if rotation is not None else ""
+    log.info(f"📊 التتبع الحالي{name}: {len(tracking['posted'])} منتج منشور في الدورة {tracking['cycle']}")
+    return tracking
+
+def save_tracking(tracking):
+    """ضغط السجل: كل دورة منتهية أقدم من KEEP_FINISHED_CYCLES تتحول لسطر ملخص واحد"""
+    path = tracking['path']
+    rotation = tracking.get('rotation')
+    try:
+        records = read_records(path)
+        # سطور الـ rotations التانية في نفس السجل بتفضل زي ما هي
+        others = [r for r in records if r.get('rotation') != rotation]
+        records = [r for r in records if r.get('rotation') == rotation]
+        keep_from = tracking['cycle'] - KEEP_FINISHED_CYCLES
+        if not any(r.get('cycle', 1) < keep_from and r.get('type') != 'summary' for r in records):
+            return
+        summaries = {}
+        kept = []
+        for record in records:
+            cycle = record.get('cycle', 1)
+            if cycle >= keep_from:
+                kept.append(record)
+            elif record.get('type') == 'summary':
+                summaries[cycle] = record
+            else:
+                summary = summaries.setdefault(cycle, {'type': 'summary', 'cycle': cycle, 'posts': 0,
+                                                       'first_ts': None, 'last_ts': None})
+                if rotation is not None:
+                    summary['rotation'] = rotation
+                if record.get('type') == 'post':
+                    summary['posts'] += 1
+                    summary['first_ts'] = summary['first_ts'] or record.get('ts')
+                    summary['last_ts'] = record.get('ts') or summary['last_ts']
+        write_records_atomic(path, others + [summaries[c] for c in sorted(summaries)] + kept)
+        log.info(f"🗜️ تم ضغط سجل التتبع: {len(records)} -> {len(summaries) + len(kept)} سطر")
+    except Exception as e:
+        log.warning(f"⚠️ فشل ضغط سجل التتبع: {e}")
+
+def mark_posted(tracking, product_id, channel=None, remote_id=None):
+    """تسجيل المنتج كمنشور (سطر جديد في السجل) وتحريك الـ cursor"""
+    append_tracking_record(tracking, {
+        'type': 'post',
+        'id': product_id,
+        'channel': channel or tracking['channel'],
+        'cycle': tracking['cycle'],
+        'ts': now_iso(),
+        'remote_id': remote_id,
+    })
+    tracking['posted'].add(product_id)
+    order = tracking['order']
+    if tracking['cursor'] < len(order) and order[tracking['cursor']] == product_id:
+        tracking['cursor'] += 1
+
+def defer_product(tracking, product_id):
+    """تأجيل منتج فشل نشره لآخر الدورة بدل ما يوقف الدورة عنده"""
+    order = tracking['order']
+    cursor = tracking['cursor']
+    if cursor < len(order) and order[cursor] == product_id:
+        order.append(order.pop(cursor))
+        append_tracking_record(tracking, {'type': 'defer', 'id': product_id, 'cycle': tracking['cycle']})
+
+def select_next_product(catalog, total, tracking, catalog_key, skip=frozenset()):
+    """اختيار المنتج التالي حسب ترتيب الدورة - ما ينشر منتج مرتين في نفس الدورة
+    skip: IDs بتتخطى في الدورة دي (مثلاً صورتها مكسورة - شوف image_health.py)
+    """
+    cycle = tracking['cycle']
+    if 'order' not in tracking:
+        # سجل جديد أو مترحل من غير ترتيب - نبني ترتيب للمنتجات الباقية في نفس الدورة
+        start_cycle(tracking, catalog, catalog_key, cycle)
+    else:
+        reconcile_catalog(tracking, catalog, catalog_key)
+
+    log.info(f"\n🔍 البحث عن منتج جديد...")
+    log.info(f"📊 تم نشر {len(tracking['posted'])} منتج من {total} في الدورة {cycle}")
+
+    for attempt in range(2):
+        order = tracking['order']
+        # الـ cursor واقف على أول منتج ما اتنشرش - بس المنتجات اللي بعده ممكن تكون اتنشرت
+        # (بعد منتج متخطي أو منشور معلق من الـ outbox)، فلازم نتخطى المنشور والمحذوف من الكتالوج
+        posted = tracking['posted']
+        while tracking['cursor'] < len(order):
+            product_id = order[tracking['cursor']]
+            if product_id in posted:
+                pass
+            elif product_id in skip:
+                log.info(f"⏭️ تخطي المنتج {product_id}: الصورة مكسورة")
+            elif product_id in catalog:
+                product = catalog[product_id]
+                log.info(f"🎯 تم اختيار المنتج: {product.get('title', 'N/A')} "
+                         f"({tracking['cursor'] + 1}/{len(order)})")
+                log.info(f"🔗 الرابط: {product['url']}")
+                return product, product['url']
+            tracking['cursor'] += 1
+
+        if attempt:
+            break
+        # إذا خلصت كل المنتجات، ابدأ دورة جديدة
+        log.info(f"\n🎉 انتهت الدورة {cycle} - تم نشر {len(tracking['posted'])}/{total} منتج")
+        log.info("🔄 بدء دورة جديدة...\n")
+        tracking['posted'] = PostedIds()
+        cycle += 1
+        start_cycle(tracking, catalog, catalog_key, cycle)
+        save_tracking(tracking)
+
+    return None, None
+
+# ========== إعادة عرض الترتيب ==========
+def main():
+    parser = argparse.ArgumentParser(description='Replay the current cycle order from its seed')
+    parser.add_argument('file', help='سجل التتبع (posted_products.jsonl)')
+    parser.add_argument('--show', type=int, default=10, help='عدد المنتجات القادمة')
+    parser.add_argument('--rotation', default=None, help='اسم الـ rotation في السجل المشترك')
+    args = parser.parse_args()
+
+    tracking = replay(read_records(args.file), args.rotation)
+    if 'order' not in tracking:
+        print("⚠️ سجل التتبع ما فيه ترتيب دورة بعد")
+        return
+    cursor = tracking['cursor']
+    print(f"🎲 seed: {tracking['seed']} | الدورة {tracking['cycle']} | المؤشر {cursor}/{len(tracking['order'])}")
+    for i, product_id in enumerate(tracking['order'][cursor:cursor + args.show], cursor + 1):
+        print(f"{i:>5}. {product_id}")
+
+if __name__ == "__main__":
+    main()